@@ -17,6 +17,30 @@ def env_csv(name: str) -> list[str]:
     return [item.strip() for item in value.split(',') if item.strip()]
 
 
+def env_bool(name: str, default: str = 'False') -> bool:
+    return os.getenv(name, default).strip().lower() in {'1', 'true', 'yes', 'on'}
+
+
+def cache_config(url: str) -> dict:
+    # redis://host:6379/0, file:///var/tmp/prompthub-cache, db://cache_table, locmem:// (per process)
+    # Only Redis has atomic incr; the other schemes are for local development and tests.
+    options = {
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'prompthub'),
+        'TIMEOUT': int(os.getenv('CACHE_DEFAULT_TIMEOUT', '300')),
+    }
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': url, **options}
+    # Django's default of 300 entries would cull buffered counters and lock keys.
+    options['OPTIONS'] = {'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '100000'))}
+    if url.startswith('file://'):
+        return {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': url[len('file://'):], **options}
+    if url.startswith('db://'):
+        return {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': url[len('db://'):], **options}
+    if not url or url.startswith('locmem://'):
+        return {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': url[len('locmem://'):] or 'prompthub', **options}
+    raise ImproperlyConfigured(f"Unsupported CACHE_URL scheme: {url}")
+
+
 SECRET_KEY = require_env('DJANGO_SECRET_KEY')
 
 DEBUG = os.getenv('DJANGO_DEBUG', 'False').lower() == 'true'
@@ -48,6 +72,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'users.middleware.SessionActivityMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -71,13 +96,24 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Reuse DB connections across requests; health checks drop connections the server closed.
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+DB_CONN_HEALTH_CHECKS = env_bool('DB_CONN_HEALTH_CHECKS', 'True')
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
     }
 }
 
+# Caches must be shared by all workers (list/dashboard versions, view buffers, locks).
+CACHES = {
+    'default': cache_config(os.getenv('CACHE_URL', '').strip()),
+}
+
 LANGUAGE_CODE = 'ko-kr'
 TIME_ZONE = 'Asia/Seoul'
 USE_I18N = True
@@ -95,13 +131,13 @@ AUTH_USER_MODEL = 'users.CustomUser'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -120,6 +156,34 @@ CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_HEADERS = list(default_headers) + ['x-session-key']
 
+# Post detail views are buffered in the cache and written back in batches.
+POST_VIEW_FLUSH_INTERVAL_SECONDS = int(os.getenv('POST_VIEW_FLUSH_INTERVAL_SECONDS', '10'))
+POST_VIEW_DEDUPE_SECONDS = int(os.getenv('POST_VIEW_DEDUPE_SECONDS', '1800'))
+
+# Anonymous post list/search pages are cached; writes bump a version key.
+POST_LIST_CACHE_SECONDS = int(os.getenv('POST_LIST_CACHE_SECONDS', '60'))
+
+# Token -> user lookups are cached; token/user/settings changes invalidate the entry.
+AUTH_TOKEN_CACHE_SECONDS = int(os.getenv('AUTH_TOKEN_CACHE_SECONDS', '60'))
+
+# IP geolocation runs after the response; the default resolver reads a local MaxMind-format database.
+GEOLOCATION_RESOLVER = os.getenv('GEOLOCATION_RESOLVER', 'users.services.geolocation.GeoIPDatabaseResolver')
+GEOLOCATION_DATABASE_PATH = os.getenv('GEOLOCATION_DATABASE_PATH', str(BASE_DIR / 'geoip' / 'GeoLite2-City.mmdb'))
+GEOLOCATION_CACHE_SECONDS = int(os.getenv('GEOLOCATION_CACHE_SECONDS', '86400'))
+GEOLOCATION_HTTP_TIMEOUT_SECONDS = int(os.getenv('GEOLOCATION_HTTP_TIMEOUT_SECONDS', '3'))
+GEOLOCATION_ASYNC = env_bool('GEOLOCATION_ASYNC', 'True')
+
+# Session last_active is buffered per X-Session-Key and written back in batched UPDATEs.
+SESSION_ACTIVITY_RESOLUTION_SECONDS = int(os.getenv('SESSION_ACTIVITY_RESOLUTION_SECONDS', '60'))
+SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS = int(os.getenv('SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS', '30'))
+
+# purge_sessions retention: revoked sessions are deleted after this many days, idle sessions after SESSION_STALE_DAYS.
+SESSION_REVOKED_RETENTION_DAYS = int(os.getenv('SESSION_REVOKED_RETENTION_DAYS', '30'))
+SESSION_STALE_DAYS = int(os.getenv('SESSION_STALE_DAYS', '90'))
+
+# Dashboard totals are maintained on write; 7/30-day windows are recounted at most this often.
+DASHBOARD_WINDOW_REFRESH_SECONDS = int(os.getenv('DASHBOARD_WINDOW_REFRESH_SECONDS', '300'))
+
 LOG_LEVEL = os.getenv('DJANGO_LOG_LEVEL', 'INFO')
 LOGGING = {
     'version': 1,
@@ -23,17 +23,28 @@ ALLOWED_HOSTS = env_csv('DJANGO_ALLOWED_HOSTS')
 database_url = os.getenv('DATABASE_URL', '').strip()
 postgres_url = os.getenv('POSTGRES_URL', '').strip()
 
-if database_url:
+if database_url or postgres_url:
     DATABASES = {
-        'default': dj_database_url.parse(database_url)
-    }
-elif postgres_url:
-    DATABASES = {
-        'default': dj_database_url.parse(postgres_url)
+        'default': dj_database_url.parse(
+            database_url or postgres_url,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS,
+        )
     }
 else:
     raise ImproperlyConfigured("Missing required environment variable: DATABASE_URL or POSTGRES_URL")
 
+# Flush locks, buffered counters and cache version keys need atomic add/incr shared by every worker.
+# Only Redis provides that; the file and DB caches implement incr as a separate get and set.
+cache_url = os.getenv('CACHE_URL', '').strip() or os.getenv('REDIS_URL', '').strip()
+if not cache_url:
+    raise ImproperlyConfigured("Missing required environment variable: CACHE_URL or REDIS_URL")
+if not cache_url.startswith(('redis://', 'rediss://', 'unix://')):
+    raise ImproperlyConfigured("CACHE_URL must point to Redis (redis:// or rediss://) in production")
+CACHES = {
+    'default': cache_config(cache_url),
+}
+
 CORS_ALLOWED_ORIGINS = env_csv('CORS_ALLOWED_ORIGINS')
 
 CSRF_TRUSTED_ORIGINS = env_csv('CSRF_TRUSTED_ORIGINS')
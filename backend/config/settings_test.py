@@ -30,4 +30,12 @@ CACHES = {
     }
 }
 
+# Tests flush buffered views and session activity explicitly.
+POST_VIEW_FLUSH_INTERVAL_SECONDS = 0
+SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS = 0
+
+# Geolocation runs inline in on_commit callbacks and never reaches a network provider.
+GEOLOCATION_ASYNC = False
+GEOLOCATION_DATABASE_PATH = ""
+
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _repair_search_index(sender, using, **kwargs):
+    if sender.label != 'posts':
+        return
+
+    from django.db import connections
+
+    from .search_index import repair_search_index
+
+    repair_search_index(connections[using])
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        post_migrate.connect(_repair_search_index, dispatch_uid='core.repair_search_index')
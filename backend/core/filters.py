@@ -1,13 +1,16 @@
 from django.db.models import Q
 from django_filters import rest_framework as filters
 
-from posts.models import AiModel, Category, Post
+from posts.models import Post, PostTag
+from posts.services.reference_data import ReferenceData
+from posts.services.tag_service import parse_tag_names
 
 
 class PostFilter(filters.FilterSet):
     categories = filters.CharFilter(method='categories_filter', label='카테고리')
     platforms = filters.CharFilter(method='platforms_filter', label='플랫폼')
     models = filters.CharFilter(method='models_filter', label='모델')
+    tags = filters.CharFilter(method='tags_filter', label='태그')
 
     class Meta:
         model = Post
@@ -36,9 +39,7 @@ class PostFilter(filters.FilterSet):
         if not parsed_ids:
             return queryset
 
-        category_rows = Category.objects.filter(id__in=parsed_ids).values_list('id', 'name')
-        other_category_ids = [category_id for category_id, name in category_rows if name == '기타']
-        normal_category_ids = [category_id for category_id, name in category_rows if name != '기타']
+        normal_category_ids, other_category_ids = ReferenceData.snapshot().split_category_ids(parsed_ids)
 
         conditions = Q()
         if normal_category_ids:
@@ -60,9 +61,7 @@ class PostFilter(filters.FilterSet):
         if not parsed_ids:
             return queryset
 
-        model_rows = AiModel.objects.filter(id__in=parsed_ids).values_list('id', 'name')
-        other_model_ids = [model_id for model_id, name in model_rows if name == '기타']
-        normal_model_ids = [model_id for model_id, name in model_rows if name != '기타']
+        normal_model_ids, other_model_ids = ReferenceData.snapshot().split_model_ids(parsed_ids)
 
         conditions = Q()
         if normal_model_ids:
@@ -86,3 +85,11 @@ class PostFilter(filters.FilterSet):
             return queryset
 
         return queryset.filter(platform_id__in=valid_ids)
+
+    def tags_filter(self, queryset, name, value):
+        tag_names = parse_tag_names(value or '')
+        if not tag_names:
+            return queryset
+
+        tagged_post_ids = PostTag.objects.filter(tag__name__in=tag_names).values('post_id')
+        return queryset.filter(id__in=tagged_post_ids)
@@ -1,13 +1,22 @@
 from django.core.cache import cache
 from django.db import connection
 from django.db.utils import DatabaseError
-from django.http import JsonResponse
 from django.utils import timezone
 from django.views.decorators.http import require_http_methods
 import logging
 
+from core.renderers import FastJsonResponse
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+    RedisError = OSError
+
 logger = logging.getLogger(__name__)
 
+# Backend failures: redis-py raises RedisError, the file and DB caches raise OSError / DatabaseError.
+CACHE_ERRORS = (ValueError, TypeError, RuntimeError, OSError, DatabaseError, RedisError)
+
 
 @require_http_methods(["GET"])
 def health_check(request):
@@ -19,11 +28,11 @@ def health_check(request):
         try:
             cache.set("health_check", "ok", 10)
             cache.get("health_check")
-        except (ValueError, TypeError, RuntimeError) as cache_error:
+        except CACHE_ERRORS as cache_error:
             logger.warning("Cache health probe failed: %s", cache_error)
             cache_status = "unavailable"
 
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "status": "healthy",
                 "database": "connected",
@@ -34,7 +43,7 @@ def health_check(request):
         )
     except DatabaseError:
         logger.exception("Health check failed due to database error.")
-        return JsonResponse({
+        return FastJsonResponse({
             "status": "unhealthy",
             "error": "database_unavailable",
             "timestamp": timezone.now().isoformat(),
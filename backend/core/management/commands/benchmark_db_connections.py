@@ -0,0 +1,67 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+
+
+class Command(BaseCommand):
+    help = "DB 연결 재사용(CONN_MAX_AGE) 여부에 따른 요청당 응답 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/core/health/", help="측정할 API 경로")
+        parser.add_argument("--requests", type=int, default=200, help="모드별 요청 수")
+        parser.add_argument("--conn-max-age", type=int, default=60, help="재사용 모드의 CONN_MAX_AGE(초)")
+
+    def handle(self, *args, **options):
+        if options["requests"] <= 0:
+            raise CommandError("--requests 값은 1 이상이어야 합니다.")
+
+        handler = WSGIHandler()
+        original_max_age = connection.settings_dict.get("CONN_MAX_AGE", 0)
+        try:
+            for label, max_age in (("연결 재사용 안 함", 0), ("연결 재사용", options["conn_max_age"])):
+                timings, connects = self._measure(handler, options["path"], options["requests"], max_age)
+                timings.sort()
+                self.stdout.write(
+                    f"{label} (CONN_MAX_AGE={max_age}): "
+                    f"평균 {statistics.mean(timings):.2f}ms, "
+                    f"p50 {timings[len(timings) // 2]:.2f}ms, "
+                    f"p95 {timings[int(len(timings) * 0.95) - 1]:.2f}ms, "
+                    f"새 연결 {connects}회"
+                )
+        finally:
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = original_max_age
+
+        self.stdout.write(self.style.SUCCESS("측정을 완료했습니다."))
+
+    def _measure(self, handler, path: str, total: int, max_age: int) -> tuple[list[float], int]:
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = max_age
+        factory = RequestFactory(HTTP_HOST=(settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip("."))
+        connects = 0
+
+        def count_connect(**kwargs):
+            nonlocal connects
+            connects += 1
+
+        connection_created.connect(count_connect)
+        timings = []
+        try:
+            # Goes through the WSGI handler so request_started/finished manage connections as in production.
+            for _ in range(total):
+                environ = factory.get(path).environ
+                started = time.perf_counter()
+                response = handler(environ, lambda *args, **kwargs: None)
+                response.close()
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 400:
+                    raise CommandError(f"{path} 요청이 {response.status_code} 응답을 반환했습니다.")
+        finally:
+            connection_created.disconnect(count_connect)
+        return timings, connects
@@ -0,0 +1,71 @@
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.http import JsonResponse
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from core.renderers import FastJSONRenderer, FastJsonResponse, orjson
+from posts.models import Post
+from posts.serializers import PostDetailSerializer
+
+
+class Command(BaseCommand):
+    help = "게시글 상세 페이지 응답을 기준으로 기본 JSON 렌더러와 FastJSONRenderer의 처리 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=50, help="한 페이지의 게시글 상세 수")
+        parser.add_argument("--iterations", type=int, default=200, help="방식별 반복 횟수")
+
+    def handle(self, *args, **options):
+        if options["count"] <= 0 or options["iterations"] <= 0:
+            raise CommandError("--count, --iterations 값은 1 이상이어야 합니다.")
+
+        factory = RequestFactory(HTTP_HOST=(settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip("."))
+        request = Request(factory.get("/api/posts/"))
+        request.user = AnonymousUser()
+
+        posts = list(
+            Post.objects.select_related("author", "platform", "model", "category")
+            .order_by("-created_at", "-id")[: options["count"]]
+        )
+        if not posts:
+            raise CommandError("측정할 게시글이 없습니다.")
+
+        payload = {
+            "status": "success",
+            "data": {"results": PostDetailSerializer(posts, many=True, context={"request": request}).data},
+        }
+        expected = JSONRenderer().render(payload)
+        if FastJSONRenderer().render(payload) != expected:
+            raise CommandError("FastJSONRenderer 결과가 JSONRenderer와 다릅니다.")
+        if json.loads(FastJsonResponse(payload).content) != json.loads(JsonResponse(payload).content):
+            raise CommandError("FastJsonResponse 결과가 JsonResponse와 다릅니다.")
+
+        cases = (
+            ("JSONRenderer", lambda: JSONRenderer().render(payload)),
+            ("FastJSONRenderer", lambda: FastJSONRenderer().render(payload)),
+            ("JsonResponse", lambda: JsonResponse(payload)),
+            ("FastJsonResponse", lambda: FastJsonResponse(payload)),
+        )
+        self.stdout.write(f"orjson 사용: {'예' if orjson is not None else '아니오(표준 json 대체)'}, 응답 크기 {len(expected)}바이트")
+        for label, render in cases:
+            timings = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                render()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            self.stdout.write(
+                f"{label}: 게시글 {len(posts)}건, "
+                f"평균 {statistics.mean(timings):.3f}ms, "
+                f"p50 {timings[len(timings) // 2]:.3f}ms, "
+                f"p95 {timings[int(len(timings) * 0.95) - 1]:.3f}ms"
+            )
+
+        self.stdout.write(self.style.SUCCESS("측정을 완료했습니다. 두 방식의 JSON 결과가 동일합니다."))
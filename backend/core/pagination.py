@@ -1,3 +1,12 @@
+import base64
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from django.db.models import F, Q
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -24,3 +33,167 @@ class CustomPagination(PageNumberPagination):
 
 class PostPagination(CustomPagination):
     page_size = 10
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CursorKey:
+    expression: Any
+    descending: bool
+    kind: str = 'int'
+    nullable: bool = False
+
+
+CURSOR_VALUE_DECODERS = {
+    'int': int,
+    'float': float,
+    'decimal': Decimal,
+    'datetime': datetime.fromisoformat,
+}
+
+
+def _encode_cursor_value(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class KeysetPage(Sequence):
+    def __init__(self, object_list, *, page_size, next_cursor=None, prev_cursor=None):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.prev_cursor is not None
+
+
+# Seeks past the sort key of the last (or first) row seen instead of using
+# COUNT(*) + OFFSET, so deep pages cost the same as the first one.
+class KeysetPaginator:
+    ALIAS_PREFIX = 'cursor_key_'
+
+    def __init__(self, queryset, keys, page_size, sort_name=''):
+        self.queryset = queryset
+        self.keys = tuple(keys)
+        self.page_size = page_size
+        self.sort_name = sort_name
+
+    def _alias(self, position):
+        return f'{self.ALIAS_PREFIX}{position}'
+
+    def encode_cursor(self, values, direction):
+        payload = {
+            's': self.sort_name,
+            'd': direction,
+            'v': [_encode_cursor_value(value) for value in values],
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction = payload['d']
+            raw_values = payload['v']
+            if payload.get('s') != self.sort_name or direction not in ('next', 'prev'):
+                raise InvalidCursor(cursor)
+            if len(raw_values) != len(self.keys):
+                raise InvalidCursor(cursor)
+            values = [
+                None if raw is None else CURSOR_VALUE_DECODERS[key.kind](raw)
+                for key, raw in zip(self.keys, raw_values)
+            ]
+        except (ValueError, TypeError, KeyError, ArithmeticError) as decode_error:
+            raise InvalidCursor(cursor) from decode_error
+
+        for key, value in zip(self.keys, values):
+            if value is None and not key.nullable:
+                raise InvalidCursor(cursor)
+        return values, direction
+
+    def _boundary_condition(self, position, value, *, forward):
+        key = self.keys[position]
+        alias = self._alias(position)
+        if value is None:
+            # NULLs sort last: nothing follows them, every non-NULL precedes them.
+            return None if forward else Q(**{f'{alias}__isnull': False})
+
+        lookup = 'lt' if key.descending == forward else 'gt'
+        condition = Q(**{f'{alias}__{lookup}': value})
+        if key.nullable and forward:
+            condition |= Q(**{f'{alias}__isnull': True})
+        return condition
+
+    def _seek_filter(self, values, *, forward):
+        seek = Q()
+        equal_prefix = Q()
+        for position, value in enumerate(values):
+            boundary = self._boundary_condition(position, value, forward=forward)
+            if boundary is not None:
+                seek |= equal_prefix & boundary
+            alias = self._alias(position)
+            equal_prefix &= Q(**{f'{alias}__isnull': True}) if value is None else Q(**{alias: value})
+        return seek
+
+    def _ordering(self, *, forward):
+        ordering = []
+        for position, key in enumerate(self.keys):
+            expression = F(self._alias(position))
+            if key.descending == forward:
+                ordering.append(expression.desc(nulls_last=True) if key.nullable else expression.desc())
+            else:
+                ordering.append(expression.asc(nulls_first=True) if key.nullable else expression.asc())
+        return ordering
+
+    def _row_values(self, row):
+        return [getattr(row, self._alias(position)) for position in range(len(self.keys))]
+
+    def page(self, cursor=None):
+        direction = 'next'
+        values = None
+        if cursor:
+            try:
+                values, direction = self.decode_cursor(cursor)
+            except InvalidCursor:
+                values, direction = None, 'next'
+
+        forward = direction == 'next'
+        queryset = self.queryset.annotate(
+            **{self._alias(position): key.expression for position, key in enumerate(self.keys)}
+        )
+        if values is not None:
+            queryset = queryset.filter(self._seek_filter(values, forward=forward))
+
+        rows = list(queryset.order_by(*self._ordering(forward=forward))[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if not forward:
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if has_more or not forward:
+                next_cursor = self.encode_cursor(self._row_values(rows[-1]), 'next')
+            if (has_more and not forward) or (forward and values is not None):
+                prev_cursor = self.encode_cursor(self._row_values(rows[0]), 'prev')
+
+        return KeysetPage(rows, page_size=self.page_size, next_cursor=next_cursor, prev_cursor=prev_cursor)
@@ -0,0 +1,52 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Dates go through the encoders' default() so output matches the stdlib encoders exactly.
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_drf_default = JSONEncoder().default
+_django_default = DjangoJSONEncoder().default
+
+
+def _escape_line_separators(content: bytes) -> bytes:
+    # Same JavaScript-safety escaping as DRF's JSONRenderer.
+    if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+        content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return content
+
+
+def dumps(data, default=_django_default) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=ORJSON_OPTIONS)
+    return json.dumps(data, default=default, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return _escape_line_separators(dumps(data, default=_drf_default))
+
+
+class FastJsonResponse(HttpResponse):
+    # Drop-in for JsonResponse in plain Django views; Decimal/datetime output follows DjangoJSONEncoder.
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
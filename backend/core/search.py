@@ -1,14 +1,136 @@
-from django.db.models import Q
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+
+from .search_index import (
+    FTS_TABLE,
+    POST_TABLE,
+    SEARCH_CONFIG,
+    SEARCH_VECTOR_COLUMN,
+    search_index_available,
+)
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+MAX_SEARCH_TOKENS = 8
+
+TITLE_SCOPE = frozenset({'title'})
+CONTENT_SCOPE = frozenset({'content'})
+TITLE_CONTENT_SCOPE = TITLE_SCOPE | CONTENT_SCOPE
+
+
+class PostgresFullTextBackend:
+    WEIGHT_LABELS = {'title': 'a', 'content': 'b'}
+
+    @classmethod
+    def _vector_sql(cls, scope) -> str:
+        column = f'"{POST_TABLE}"."{SEARCH_VECTOR_COLUMN}"'
+        if scope == TITLE_CONTENT_SCOPE:
+            return column
+        weights = ','.join(sorted(cls.WEIGHT_LABELS[field] for field in scope))
+        return f"ts_filter({column}, '{{{weights}}}')"
+
+    @classmethod
+    def match(cls, tokens: list[str], scope):
+        ts_query = ' & '.join(f"{token}:*" for token in tokens)
+        column = f'"{POST_TABLE}"."{SEARCH_VECTOR_COLUMN}"'
+        vector = cls._vector_sql(scope)
+
+        where_sql = f"{column} @@ to_tsquery('{SEARCH_CONFIG}', %s)"
+        params = [ts_query]
+        if vector != column:
+            where_sql += f" AND {vector} @@ to_tsquery('{SEARCH_CONFIG}', %s)"
+            params.append(ts_query)
+
+        condition = RawSQL(where_sql, params, output_field=BooleanField())
+        rank = RawSQL(
+            f"ts_rank_cd({vector}, to_tsquery('{SEARCH_CONFIG}', %s))",
+            [ts_query],
+            output_field=FloatField(),
+        )
+        return Q(condition), rank
+
+
+class SqliteFullTextBackend:
+    # bm25() column weights for (title, content); lower scores are better.
+    BM25_WEIGHTS = (3.0, 1.0)
+
+    @classmethod
+    def match(cls, tokens: list[str], scope):
+        columns = ' '.join(sorted(scope))
+        terms = ' AND '.join(f'"{token}"*' for token in tokens)
+        fts_query = f"{{{columns}}} : ({terms})"
+
+        condition = Q(id__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            [fts_query],
+        ))
+        title_weight, content_weight = cls.BM25_WEIGHTS
+        rank = RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, {title_weight}, {content_weight}) FROM {FTS_TABLE} "
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{POST_TABLE}"."id"',
+            [fts_query],
+            output_field=FloatField(),
+        )
+        return condition, rank
+
+
+FULL_TEXT_BACKENDS = {
+    'postgresql': PostgresFullTextBackend,
+    'sqlite': SqliteFullTextBackend,
+}
 
 
 class SearchManager:
+    @staticmethod
+    def tokenize(query: str) -> list[str]:
+        tokens = []
+        for token in SEARCH_TOKEN_PATTERN.findall(query.lower()):
+            if token not in tokens:
+                tokens.append(token)
+        return tokens[:MAX_SEARCH_TOKENS]
+
+    @staticmethod
+    def get_full_text_backend(queryset):
+        connection = connections[queryset.db]
+        backend = FULL_TEXT_BACKENDS.get(connection.vendor)
+        if backend is None or not search_index_available(connection):
+            return None
+        return backend
+
     @staticmethod
     def search_posts(queryset, query, search_type='all'):
         if not query:
             return queryset
 
         normalized_type = (search_type or 'all').strip().lower()
+        author_query = Q(author__username__icontains=query)
 
+        if normalized_type == 'author':
+            return queryset.filter(author_query)
+
+        scope = {
+            'title': TITLE_SCOPE,
+            'content': CONTENT_SCOPE,
+        }.get(normalized_type, TITLE_CONTENT_SCOPE)
+        include_author = normalized_type not in {'title', 'content', 'title_content'}
+
+        backend = SearchManager.get_full_text_backend(queryset)
+        tokens = SearchManager.tokenize(query)
+        if backend is None or not tokens:
+            return SearchManager.search_posts_with_icontains(queryset, query, normalized_type)
+
+        condition, rank = backend.match(tokens, scope)
+        if include_author:
+            condition |= author_query
+            rank = Coalesce(rank, Value(0.0), output_field=FloatField())
+
+        return queryset.filter(condition).annotate(search_rank=rank)
+
+    @staticmethod
+    def search_posts_with_icontains(queryset, query, normalized_type='all'):
         title_query = Q(title__icontains=query)
         author_query = Q(author__username__icontains=query)
         content_query = (
@@ -27,9 +149,7 @@ class SearchManager:
         if normalized_type == 'author':
             return queryset.filter(author_query)
 
-        if normalized_type in {'title_content', 'all'}:
-            if normalized_type == 'all':
-                return queryset.filter(title_query | content_query | author_query)
+        if normalized_type == 'title_content':
             return queryset.filter(title_query | content_query)
 
         return queryset.filter(title_query | content_query | author_query)
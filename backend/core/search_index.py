@@ -0,0 +1,156 @@
+import logging
+
+from django.db import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+POST_TABLE = "posts_post"
+
+# PostgreSQL: stored, generated tsvector column + GIN index.
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "posts_post_search_vector_gin"
+SEARCH_CONFIG = "simple"
+
+# SQLite: FTS5 table kept in sync by triggers (dev/test fallback).
+FTS_TABLE = "posts_post_fts"
+FTS_TRIGGERS = (
+    "posts_post_fts_ai",
+    "posts_post_fts_ad",
+    "posts_post_fts_au",
+)
+INDEXED_FIELDS = ("title", "prompt", "ai_response", "additional_opinion", "tags")
+
+_availability_cache: dict[tuple[str, str], bool] = {}
+
+
+def _content_expression(prefix: str = "") -> str:
+    parts = [
+        f"coalesce({prefix}{field}, '')"
+        for field in ("prompt", "ai_response", "additional_opinion", "tags")
+    ]
+    return " || ' ' || ".join(parts)
+
+
+def _postgres_install_statements() -> list[str]:
+    vector = (
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', {_content_expression()}), 'B')"
+    )
+    return [
+        f"ALTER TABLE {POST_TABLE} ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS {SEARCH_VECTOR_INDEX} ON {POST_TABLE} USING GIN ({SEARCH_VECTOR_COLUMN})",
+    ]
+
+
+def _sqlite_trigger_statements() -> list[str]:
+    insert_new = (
+        f"INSERT INTO {FTS_TABLE}(rowid, title, content) "
+        f"VALUES (new.id, new.title, {_content_expression('new.')});"
+    )
+    delete_old = f"DELETE FROM {FTS_TABLE} WHERE rowid = old.id;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS posts_post_fts_ai AFTER INSERT ON {POST_TABLE} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS posts_post_fts_ad AFTER DELETE ON {POST_TABLE} BEGIN {delete_old} END",
+        (
+            f"CREATE TRIGGER IF NOT EXISTS posts_post_fts_au "
+            f"AFTER UPDATE OF {', '.join(INDEXED_FIELDS)} ON {POST_TABLE} "
+            f"BEGIN {delete_old} {insert_new} END"
+        ),
+    ]
+
+
+def _sqlite_rebuild_statements() -> list[str]:
+    return [
+        f"DELETE FROM {FTS_TABLE}",
+        f"INSERT INTO {FTS_TABLE}(rowid, title, content) "
+        f"SELECT id, title, {_content_expression()} FROM {POST_TABLE}",
+    ]
+
+
+def _sqlite_table_exists(cursor, name: str, kind: str = "table") -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = %s AND name = %s", [kind, name])
+    return cursor.fetchone() is not None
+
+
+def _sqlite_triggers_complete(cursor) -> bool:
+    return all(_sqlite_table_exists(cursor, trigger, kind="trigger") for trigger in FTS_TRIGGERS)
+
+
+def _clear_cache(connection) -> None:
+    _availability_cache.pop((connection.alias, str(connection.settings_dict.get("NAME"))), None)
+
+
+def install_search_index(connection) -> bool:
+    _clear_cache(connection)
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            for statement in _postgres_install_statements():
+                cursor.execute(statement)
+            return True
+
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                    f"USING fts5(title, content, tokenize='unicode61')"
+                )
+            except DatabaseError as fts_error:
+                logger.warning("SQLite FTS5 is unavailable, search falls back to icontains: %s", fts_error)
+                return False
+            for statement in _sqlite_trigger_statements() + _sqlite_rebuild_statements():
+                cursor.execute(statement)
+            return True
+
+    return False
+
+
+def uninstall_search_index(connection) -> None:
+    _clear_cache(connection)
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(f"DROP INDEX IF EXISTS {SEARCH_VECTOR_INDEX}")
+            cursor.execute(f"ALTER TABLE {POST_TABLE} DROP COLUMN IF EXISTS {SEARCH_VECTOR_COLUMN}")
+        elif connection.vendor == "sqlite":
+            for trigger in FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def repair_search_index(connection) -> None:
+    # SQLite migrations that rebuild posts_post (AlterField, non-null AddField, ...)
+    # drop its triggers; recreate them and resync the FTS table when that happens.
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        if not _sqlite_table_exists(cursor, FTS_TABLE) or _sqlite_triggers_complete(cursor):
+            return
+    logger.info("Rebuilding %s after posts table was recreated.", FTS_TABLE)
+    install_search_index(connection)
+
+
+def search_index_available(connection) -> bool:
+    if connection.vendor not in {"postgresql", "sqlite"}:
+        return False
+
+    cache_key = (connection.alias, str(connection.settings_dict.get("NAME")))
+    if cache_key in _availability_cache:
+        return _availability_cache[cache_key]
+
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() AND table_name = %s AND column_name = %s",
+                    [POST_TABLE, SEARCH_VECTOR_COLUMN],
+                )
+                available = cursor.fetchone() is not None
+            else:
+                available = _sqlite_table_exists(cursor, FTS_TABLE)
+    except DatabaseError:
+        logger.warning("Could not inspect full-text search index; using icontains search.")
+        return False
+
+    _availability_cache[cache_key] = available
+    return available
@@ -4,6 +4,7 @@ from django.core.cache import cache
 from django.db import DatabaseError
 from django.db.models import QuerySet, Prefetch
 from ..models.trending import TrendingCategory, TrendingRanking
+from ..utils.cache import get_or_compute_result
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +16,18 @@ class TrendingServiceError(RuntimeError):
 class TrendingService:
     CACHE_KEY = "trending_category_rankings"
     CACHE_TIMEOUT = 3600
+    CACHE_STALE_TIMEOUT = 6 * 3600
 
     @classmethod
     def get_category_rankings(cls) -> Dict[str, Any]:
-        cached_data = cache.get(cls.CACHE_KEY)
-        if cached_data is not None:
-            return {"status": "success", "data": cached_data, "from_cache": True}
-
         try:
-            category_rankings = cls._fetch_category_rankings()
-            cache.set(cls.CACHE_KEY, category_rankings, cls.CACHE_TIMEOUT)
-            return {"status": "success", "data": category_rankings, "from_cache": False}
+            result = get_or_compute_result(
+                cls.CACHE_KEY,
+                cls._fetch_category_rankings,
+                soft_timeout=cls.CACHE_TIMEOUT,
+                hard_timeout=cls.CACHE_STALE_TIMEOUT,
+            )
+            return {"status": "success", "data": result.value, "from_cache": result.status != "miss"}
         except DatabaseError as db_error:
             logger.exception("Failed to fetch trending category rankings.")
             raise TrendingServiceError("트렌딩 데이터를 조회할 수 없습니다.") from db_error
@@ -1,5 +1,7 @@
 from django.db.models import F
 
+from .pagination import CursorKey
+
 
 class PostSorting:
     @staticmethod
@@ -12,9 +14,11 @@ class PostSorting:
     
     @staticmethod
     def sort_by_popular(queryset):
-        return queryset.annotate(
-            popularity=F('like_count') + F('bookmark_count')
-        ).order_by('-popularity', '-created_at')
+        return queryset.order_by('-popularity_score', '-created_at')
+
+    @staticmethod
+    def sort_by_hot(queryset):
+        return queryset.order_by('-hot_score', '-created_at')
     
     @staticmethod
     def sort_by_satisfaction(queryset):
@@ -24,14 +28,44 @@ class PostSorting:
     def sort_by_views(queryset):
         return queryset.order_by('-view_count', '-created_at')
 
+    @staticmethod
+    def sort_by_relevance(queryset):
+        if 'search_rank' not in queryset.query.annotations:
+            return PostSorting.sort_by_latest(queryset)
+        return queryset.order_by('-search_rank', '-created_at')
+
+
+CREATED_AT_DESC = CursorKey(F('created_at'), descending=True, kind='datetime')
+ID_DESC = CursorKey(F('id'), descending=True)
+
 
 class SortManager:
+    # Composite keyset keys per sort option; the post id makes every key unique.
+    CURSOR_KEYS = {
+        'latest': (CREATED_AT_DESC, ID_DESC),
+        'oldest': (
+            CursorKey(F('created_at'), descending=False, kind='datetime'),
+            CursorKey(F('id'), descending=False),
+        ),
+        'popular': (CursorKey(F('popularity_score'), descending=True), CREATED_AT_DESC, ID_DESC),
+        'hot': (CursorKey(F('hot_score'), descending=True, kind='float'), CREATED_AT_DESC, ID_DESC),
+        'satisfaction': (
+            CursorKey(F('satisfaction'), descending=True, kind='decimal', nullable=True),
+            CREATED_AT_DESC,
+            ID_DESC,
+        ),
+        'views': (CursorKey(F('view_count'), descending=True), CREATED_AT_DESC, ID_DESC),
+        'relevance': (CursorKey(F('search_rank'), descending=True, kind='float'), CREATED_AT_DESC, ID_DESC),
+    }
+
     SORT_OPTIONS = {
         'latest': PostSorting.sort_by_latest,
         'oldest': PostSorting.sort_by_oldest,
         'popular': PostSorting.sort_by_popular,
+        'hot': PostSorting.sort_by_hot,
         'satisfaction': PostSorting.sort_by_satisfaction,
         'views': PostSorting.sort_by_views,
+        'relevance': PostSorting.sort_by_relevance,
     }
     
     @staticmethod
@@ -41,12 +75,23 @@ class SortManager:
             return sort_func(queryset)
         return PostSorting.sort_by_latest(queryset)
     
+    @staticmethod
+    def get_cursor_keys(queryset, sort_by='latest'):
+        if sort_by == 'relevance' and 'search_rank' not in queryset.query.annotations:
+            sort_by = 'latest'
+        if sort_by not in SortManager.CURSOR_KEYS:
+            sort_by = 'latest'
+        return sort_by, SortManager.CURSOR_KEYS[sort_by]
+
     @staticmethod
     def get_sort_options():
         return {
             'latest': '최신순',
             'oldest': '오래된순',
             'popular': '인기순',
+            'hot': '급상승순',
             'satisfaction': '만족도순',
             'views': '조회순',
-        } 
+            'relevance': '관련도순',
+        }
+
@@ -1,6 +1,13 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.http import JsonResponse
 from django.urls import reverse
 from django.db import connection
+from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
@@ -9,6 +16,10 @@ from posts.models import Platform, AiModel, Category, Post
 from core.filters import PostFilter
 from core.models.trending import TrendingCategory, TrendingRanking
 from core.services.trending_service import TrendingService
+from core.utils.cache import LOCK_KEY_SUFFIX, cache_metrics, get_or_compute, get_or_compute_result, reset_cache_metrics
+from django.core.cache import cache
+from config.settings_base import cache_config
+from core.renderers import FastJSONRenderer, FastJsonResponse
 
 
 User = get_user_model()
@@ -221,3 +232,120 @@ class TrendingCategoryRankingsQueryTests(APITestCase):
         self.assertIn("llm_quality", data)
         self.assertEqual(len(data["llm_speed"]["data"]), 2)
         self.assertEqual(data["llm_speed"]["data"][0]["rank"], 1)
+
+
+class StampedeCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_cache_metrics()
+        self.calls = 0
+
+    def produce(self, value='fresh'):
+        self.calls += 1
+        return value
+
+    def test_stale_value_served_while_another_worker_refreshes(self):
+        key = 'test:stampede'
+        options = {'soft_timeout': 0, 'hard_timeout': 60, 'jitter': 0}
+        self.assertEqual(get_or_compute_result(key, lambda: self.produce('v1'), **options)[:2], ('v1', 'miss'))
+
+        cache.add(f'{key}{LOCK_KEY_SUFFIX}', 1)
+        self.assertEqual(get_or_compute_result(key, lambda: self.produce('v2'), **options)[:2], ('v1', 'stale'))
+        self.assertEqual(self.calls, 1)
+
+        cache.delete(f'{key}{LOCK_KEY_SUFFIX}')
+        self.assertEqual(get_or_compute_result(key, lambda: self.produce('v2'), **options)[:2], ('v2', 'miss'))
+        self.assertEqual(self.calls, 2)
+
+        metrics = cache_metrics()[key]
+        self.assertEqual((metrics['misses'], metrics['stale_hits'], metrics['recomputes']), (1, 1, 2))
+
+    def test_none_result_is_negatively_cached(self):
+        for _ in range(3):
+            self.assertIsNone(get_or_compute('test:negative', lambda: self.produce(None), 60, negative_timeout=60))
+        self.assertEqual(self.calls, 1)
+
+
+class CacheConfigTests(APITestCase):
+    def test_cache_url_schemes_select_shared_backends(self):
+        self.assertEqual(cache_config('redis://cache:6379/1')['BACKEND'], 'django.core.cache.backends.redis.RedisCache')
+        self.assertEqual(cache_config('file:///tmp/ph-cache')['LOCATION'], '/tmp/ph-cache')
+        self.assertEqual(cache_config('db://ph_cache')['LOCATION'], 'ph_cache')
+        self.assertEqual(cache_config('')['BACKEND'], 'django.core.cache.backends.locmem.LocMemCache')
+
+    def test_health_reports_unavailable_cache_instead_of_failing(self):
+        # /dev/null is not a directory, so every cache write raises an OSError from the backend.
+        with override_settings(CACHES={'default': cache_config('file:///dev/null/ph-cache')}):
+            res = self.client.get(reverse('core:health_check'))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['cache'], 'unavailable')
+
+
+class FastJsonRendererTests(APITestCase):
+    def test_output_matches_stdlib_encoders(self):
+        payload = {
+            'title': '한글 제목\u2028',
+            'satisfaction': Decimal('4.5'),
+            'createdAt': datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            'tags': ['a', 'b'],
+            'model': None,
+            1: 'int key',
+        }
+        self.assertEqual(FastJSONRenderer().render(payload), JSONRenderer().render(payload))
+        self.assertEqual(json.loads(FastJsonResponse(payload).content), json.loads(JsonResponse(payload).content))
+        self.assertEqual(FastJsonResponse(payload)['Content-Type'], 'application/json')
+
+        res = self.client.get(reverse('core:health_check'))
+        self.assertEqual(res.json()['status'], 'healthy')
+
+
+class FullTextSearchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='fts@example.com', password='Test1234!')
+        self.platform = Platform.objects.create(name='OpenAI')
+        self.model = AiModel.objects.create(platform=self.platform, name='GPT-4')
+        self.category = Category.objects.create(name='개발')
+        self.title_match = self._create_post(
+            title='장고 마이그레이션 가이드',
+            prompt='충분히 긴 프롬프트 내용입니다.',
+        )
+        self.content_match = self._create_post(
+            title='데이터베이스 정리 노트',
+            prompt='장고 ORM 쿼리를 최적화하는 방법을 알려주세요.',
+        )
+        self.url = reverse('core:search_posts')
+
+    def _create_post(self, *, title: str, prompt: str):
+        return Post.objects.create(
+            title=title,
+            author=self.user,
+            platform=self.platform,
+            model=self.model,
+            category=self.category,
+            prompt=prompt,
+            ai_response='충분히 긴 AI 응답 내용입니다.',
+        )
+
+    def _search_ids(self, params: dict) -> list[int]:
+        res = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in res.data['results']]
+
+    def test_relevance_sort_ranks_title_matches_first(self):
+        ids = self._search_ids({'q': '장고', 'sort': 'relevance'})
+        self.assertEqual(ids, [self.title_match.id, self.content_match.id])
+
+    def test_search_type_limits_matched_fields(self):
+        self.assertEqual(self._search_ids({'q': '장고', 'search_type': 'title'}), [self.title_match.id])
+        self.assertEqual(self._search_ids({'q': '장고', 'search_type': 'content'}), [self.content_match.id])
+
+    def test_index_follows_post_updates_and_deletes(self):
+        self.content_match.title = '장고 쿼리 최적화'
+        self.content_match.save()
+        self.assertCountEqual(
+            self._search_ids({'q': '쿼리 최적', 'search_type': 'title'}),
+            [self.content_match.id],
+        )
+
+        self.content_match.delete()
+        self.assertEqual(self._search_ids({'q': '장고'}), [self.title_match.id])
@@ -1,12 +1,180 @@
-from typing import Any, Callable
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, NamedTuple
+
 from django.core.cache import cache
 
+logger = logging.getLogger(__name__)
+
+LOCK_KEY_SUFFIX = ':lock'
+DEFAULT_LOCK_TIMEOUT_SECONDS = 30
+DEFAULT_WAIT_SECONDS = 2.0
+WAIT_POLL_SECONDS = 0.05
+DEFAULT_JITTER_RATIO = 0.1
+
+_NEGATIVE = '__cache_negative__'
+
+_metrics = defaultdict(lambda: {'hits': 0, 'stale_hits': 0, 'misses': 0, 'recomputes': 0, 'recompute_seconds': 0.0})
+_metrics_lock = threading.Lock()
+
+
+class CacheResult(NamedTuple):
+    value: Any
+    status: str  # 'hit', 'stale' or 'miss'
+    built_at: float | None = None
+
+
+def _record(metric: str, field: str, amount=1) -> None:
+    with _metrics_lock:
+        _metrics[metric][field] += amount
+
+
+def cache_metrics() -> dict:
+    with _metrics_lock:
+        return {metric: dict(values) for metric, values in _metrics.items()}
+
+
+def reset_cache_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def incr_counter(key: str, delta: int = 1) -> int:
+    # Persistent counter that survives eviction between add() and incr().
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, timeout=None)
+        return delta
+
+
+class DirtyQueue:
+    # Cache-backed queue of members awaiting a flush. Writers append numbered slots; take() drains them in order.
+    def __init__(self, prefix: str, slot_timeout: int | None = None):
+        self.seq_key = f'{prefix}:dirty_seq'
+        self.slot_prefix = f'{prefix}:dirty'
+        self.flushed_key = f'{prefix}:flushed_seq'
+        self.gap_key = f'{prefix}:gap_slot'
+        self.slot_timeout = slot_timeout
+
+    def mark(self, member) -> None:
+        slot = incr_counter(self.seq_key)
+        cache.set(f'{self.slot_prefix}:{slot}', member, timeout=self.slot_timeout)
+
+    def take(self) -> list:
+        last_seq = cache.get(self.seq_key) or 0
+        flushed_seq = cache.get(self.flushed_key) or 0
+        if last_seq <= flushed_seq:
+            return []
 
-def cache_value_or_set(key: str, timeout_seconds: int, producer: Callable[[], Any]) -> Any:
-    value = cache.get(key)
-    if value is not None:
-        return value
+        slot_keys = [f'{self.slot_prefix}:{slot}' for slot in range(flushed_seq + 1, last_seq + 1)]
+        slots = cache.get_many(slot_keys)
+        taken_keys = []
+        for slot_key in slot_keys:
+            # A missing slot is usually a writer between incr and set; skip it only if it is still missing next time.
+            if slot_key not in slots and cache.get(self.gap_key) != slot_key:
+                cache.set(self.gap_key, slot_key, timeout=None)
+                break
+            taken_keys.append(slot_key)
+
+        cache.delete_many(taken_keys)
+        cache.set(self.flushed_key, flushed_seq + len(taken_keys), timeout=None)
+        return list(dict.fromkeys(slots[slot_key] for slot_key in taken_keys if slot_key in slots))
+
+
+def _jittered(seconds: float, jitter: float) -> float:
+    return seconds + random.uniform(0, seconds * jitter) if seconds > 0 else seconds
+
+
+def _unwrap(entry):
+    value, soft_expires_at, built_at = entry
+    return (None if value == _NEGATIVE else value), soft_expires_at, built_at
+
+
+def cached_built_at(key: str) -> float | None:
+    # When the fresh value stored under key was computed; usable as a cheap HTTP validator.
+    # Soft-expired entries report None so clients revalidate through the view, which triggers the refresh.
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    _, soft_expires_at, built_at = _unwrap(entry)
+    return built_at if time.time() < soft_expires_at else None
+
+
+def _compute_and_store(key, producer, soft_timeout, hard_timeout, negative_timeout, jitter, metric):
+    started = time.monotonic()
     value = producer()
-    cache.set(key, value, timeout=timeout_seconds)
-    return value
+    _record(metric, 'recomputes')
+    _record(metric, 'recompute_seconds', time.monotonic() - started)
+
+    now = time.time()
+    if value is None:
+        if negative_timeout > 0:
+            cache.set(key, (_NEGATIVE, now + negative_timeout, now), timeout=negative_timeout)
+        return CacheResult(value, 'miss', now)
+
+    soft = _jittered(soft_timeout, jitter)
+    cache.set(key, (value, now + soft, now), timeout=max(_jittered(hard_timeout, jitter), soft))
+    return CacheResult(value, 'miss', now)
+
+
+def get_or_compute_result(
+    key: str,
+    producer: Callable[[], Any],
+    soft_timeout: int,
+    hard_timeout: int | None = None,
+    negative_timeout: int = 0,
+    jitter: float = DEFAULT_JITTER_RATIO,
+    lock_timeout: int = DEFAULT_LOCK_TIMEOUT_SECONDS,
+    wait_seconds: float = DEFAULT_WAIT_SECONDS,
+    metric: str | None = None,
+) -> CacheResult:
+    # Fresh until soft_timeout; stale copies are served until hard_timeout while one worker refreshes.
+    metric = metric or key
+    hard_timeout = max(hard_timeout or soft_timeout, soft_timeout)
+    compute = partial(_compute_and_store, key, producer, soft_timeout, hard_timeout, negative_timeout, jitter, metric)
+    lock_key = f'{key}{LOCK_KEY_SUFFIX}'
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, soft_expires_at, built_at = _unwrap(entry)
+        if time.time() < soft_expires_at:
+            _record(metric, 'hits')
+            return CacheResult(value, 'hit', built_at)
+        if not cache.add(lock_key, 1, timeout=lock_timeout):
+            _record(metric, 'stale_hits')
+            return CacheResult(value, 'stale', built_at)
+        try:
+            return compute()
+        except Exception:
+            logger.warning("Cache refresh failed for %s; serving stale value", key, exc_info=True)
+            _record(metric, 'stale_hits')
+            return CacheResult(value, 'stale', built_at)
+        finally:
+            cache.delete(lock_key)
+
+    _record(metric, 'misses')
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            return compute()
+        finally:
+            cache.delete(lock_key)
+
+    # Another worker is computing; wait briefly for its result before computing ourselves.
+    deadline = time.monotonic() + wait_seconds
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_POLL_SECONDS)
+        entry = cache.get(key)
+        if entry is not None:
+            value, _, built_at = _unwrap(entry)
+            return CacheResult(value, 'hit', built_at)
+    return compute()
+
 
+def get_or_compute(key: str, producer: Callable[[], Any], soft_timeout: int, **options) -> Any:
+    return get_or_compute_result(key, producer, soft_timeout, **options).value
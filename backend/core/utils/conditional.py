@@ -0,0 +1,90 @@
+import hashlib
+from functools import wraps
+from typing import Callable
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .cache import cached_built_at
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def etag_from_parts(*parts) -> str:
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest[:32])
+
+
+def cache_entry_etag(key: str) -> str | None:
+    built_at = cached_built_at(key)
+    return etag_from_parts(key, built_at) if built_at is not None else None
+
+
+def cache_entry_last_modified(key: str) -> float | None:
+    return cached_built_at(key)
+
+
+def evaluate_conditions(
+    request,
+    etag: str | None = None,
+    last_modified: float | None = None,
+    vary_on_auth: bool = False,
+):
+    # Returns a 304 (or 412) response when the client's copy is still current, else None.
+    if request.method not in SAFE_METHODS or (etag is None and last_modified is None):
+        return None
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified) if last_modified is not None else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified, vary_on_auth=vary_on_auth)
+    return response
+
+
+def set_validators(response, etag: str | None = None, last_modified: float | None = None, vary_on_auth: bool = False):
+    if vary_on_auth:
+        patch_vary_headers(response, ('Authorization',))
+    if response.status_code not in (200, 304):
+        return response
+    if etag is not None and not response.has_header('ETag'):
+        response['ETag'] = etag
+    if last_modified is not None and not response.has_header('Last-Modified'):
+        response['Last-Modified'] = http_date(int(last_modified))
+    return response
+
+
+def conditional_get(
+    etag_func: Callable | None = None,
+    last_modified_func: Callable | None = None,
+    vary_on_auth: bool = False,
+):
+    # Validators must be cheap (a version key, a timestamp); the view only runs when the client copy is stale.
+    # Place above @api_view so the check runs before DRF authentication and serialization.
+    def compute(func, request, args, kwargs):
+        return func(request, *args, **kwargs) if func is not None else None
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return view_func(request, *args, **kwargs)
+
+            etag = compute(etag_func, request, args, kwargs)
+            last_modified = compute(last_modified_func, request, args, kwargs)
+            not_modified = evaluate_conditions(request, etag, last_modified, vary_on_auth=vary_on_auth)
+            if not_modified is not None:
+                return not_modified
+
+            response = view_func(request, *args, **kwargs)
+            # Validators backed by a cache entry may only exist once the view has filled it.
+            if etag is None:
+                etag = compute(etag_func, request, args, kwargs)
+            if last_modified is None:
+                last_modified = compute(last_modified_func, request, args, kwargs)
+            return set_validators(response, etag, last_modified, vary_on_auth=vary_on_auth)
+
+        return wrapped
+
+    return decorator
@@ -9,7 +9,10 @@ from .filters import PostFilter
 from .search import SearchManager
 from .sorting import SortManager
 from posts.models import Post
-from posts.services.post_service import annotate_viewer_interaction_flags
+from posts.services.interaction_overlay import attach_viewer_interaction_flags, overlay_viewer_flags
+from posts.services.post_list_cache import PostListCache
+from posts.services.reference_data import ReferenceData
+from .utils.conditional import cache_entry_etag, cache_entry_last_modified, conditional_get
 from .services import TrendingService, TrendingServiceError
 from django.core.exceptions import ValidationError
 from django.db import DatabaseError
@@ -17,11 +20,20 @@ from django.db import DatabaseError
 logger = logging.getLogger(__name__)
 
 
+@conditional_get(etag_func=lambda request: PostListCache.etag(request, 'search'), vary_on_auth=True)
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def search_posts(request):
+    payload = PostListCache.get_or_build(request, 'search', lambda: _build_anonymous_search_payload(request))
+    if payload is None:
+        return Response({'error': '페이지네이션 오류'}, status=status.HTTP_400_BAD_REQUEST)
+
+    payload['results'] = overlay_viewer_flags(payload['results'], request.user)
+    return Response(payload)
+
+
+def _build_anonymous_search_payload(request):
     queryset = Post.objects.select_related('author', 'platform', 'model', 'category').all()
-    queryset = annotate_viewer_interaction_flags(queryset, getattr(request, "user", None))
 
     query = request.GET.get('q', '')
     search_type = request.GET.get('search_type', 'all')
@@ -43,12 +55,12 @@ def search_posts(request):
     paginator = PostPagination()
     page = paginator.paginate_queryset(queryset, request)
 
-    if page is not None:
-        from posts.serializers import PostCardSerializer
-        serializer = PostCardSerializer(page, many=True, context={'request': request})
-        return paginator.get_paginated_response(serializer.data)
+    if page is None:
+        return None
 
-    return Response({'error': '페이지네이션 오류'}, status=status.HTTP_400_BAD_REQUEST)
+    from posts.serializers import FastPostCardSerializer
+    results = FastPostCardSerializer({'request': request}).serialize(page)
+    return paginator.get_paginated_response(results).data
 
 
 @api_view(['GET'])
@@ -61,36 +73,17 @@ def get_sort_options(request):
     })
 
 
+@conditional_get(etag_func=ReferenceData.etag)
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def get_filter_options(request):
-    from posts.models import Platform, Category, AiModel
-
-    platforms = Platform.objects.values('id', 'name').order_by('id')
-    categories = Category.objects.values('id', 'name').order_by('id')
-    models = AiModel.objects.select_related('platform').values(
-        'id', 'name', 'platform__id', 'platform__name'
-    ).order_by('platform__id', 'id')
-
-    models_by_platform = {}
-    for model in models:
-        platform_name = model['platform__name']
-        if platform_name not in models_by_platform:
-            models_by_platform[platform_name] = []
-        models_by_platform[platform_name].append({
-            'id': model['id'],
-            'name': model['name'],
-            'platform_id': model['platform__id'],
-            'platform_name': platform_name
-        })
-    
-    return Response({
-        'platforms': list(platforms),
-        'categories': list(categories),
-        'models_by_platform': models_by_platform
-    })
+    return Response(ReferenceData.snapshot().filter_options)
 
 
+@conditional_get(
+    etag_func=lambda request: cache_entry_etag(TrendingService.CACHE_KEY),
+    last_modified_func=lambda request: cache_entry_last_modified(TrendingService.CACHE_KEY),
+)
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def get_category_rankings(request):
@@ -120,7 +113,6 @@ def get_trending_model_posts(request, model_name):
             }, status=status.HTTP_404_NOT_FOUND)
 
         posts_queryset = TrendingService.get_related_posts_by_model_name(model_name)
-        posts_queryset = annotate_viewer_interaction_flags(posts_queryset, getattr(request, "user", None))
         sort_by = request.GET.get('sort', 'latest')
         posts_queryset = SortManager.sort_posts(posts_queryset, sort_by)
 
@@ -128,9 +120,10 @@ def get_trending_model_posts(request, model_name):
         page = paginator.paginate_queryset(posts_queryset, request)
 
         if page is not None:
-            from posts.serializers import PostCardSerializer
-            serializer = PostCardSerializer(page, many=True, context={'request': request})
-            response_data = paginator.get_paginated_response(serializer.data).data
+            from posts.serializers import FastPostCardSerializer
+            page = attach_viewer_interaction_flags(page, getattr(request, "user", None))
+            results = FastPostCardSerializer({'request': request}).serialize(page)
+            response_data = paginator.get_paginated_response(results).data
             response_data['trending_model'] = model_info
             return Response(response_data)
 
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Platform, AiModel, Category, Post, PostInteraction
+from .models import Platform, AiModel, Category, Post, PostInteraction, Tag
+from .services.tag_service import TagService
 
 
 class AiModelInline(admin.TabularInline):
@@ -93,6 +94,7 @@ class PostAdmin(admin.ModelAdmin):
     ]
     readonly_fields = [
         'view_count', 'like_count', 'bookmark_count', 
+        'popularity_score', 'hot_score',
         'created_at', 'updated_at'
     ]
     list_select_related = ['author', 'platform', 'model', 'category']
@@ -114,7 +116,7 @@ class PostAdmin(admin.ModelAdmin):
             'fields': ('satisfaction',)
         }),
         ('통계', {
-            'fields': ('view_count', 'like_count', 'bookmark_count'),
+            'fields': ('view_count', 'like_count', 'bookmark_count', 'popularity_score', 'hot_score'),
             'classes': ('collapse',)
         }),
         ('메타데이터', {
@@ -132,6 +134,17 @@ class PostAdmin(admin.ModelAdmin):
             'author', 'platform', 'model', 'category'
         )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        TagService.sync_post_tags(obj)
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'post_count', 'created_at']
+    search_fields = ['name']
+    readonly_fields = ['post_count', 'created_at']
+
 
 @admin.register(PostInteraction)
 class PostInteractionAdmin(admin.ModelAdmin):
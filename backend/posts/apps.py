@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class PostsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'posts'
-    verbose_name = '게시글'
\ No newline at end of file
+    verbose_name = '게시글'
+
+    def ready(self):
+        from . import signals  # noqa: F401
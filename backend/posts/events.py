@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Sent after a like/bookmark counter moved. kwargs: post, counter_field, delta, user.
+post_counter_changed = Signal()
+
+# Sent after buffered views were written to posts. kwargs: deltas ({post_id: views}).
+post_views_flushed = Signal()
+
+# Sent after tag counts changed for a post. kwargs: post.
+post_tags_changed = Signal()
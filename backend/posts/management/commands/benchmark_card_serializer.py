@@ -0,0 +1,65 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from posts.models import Post
+from posts.serializers import POST_CARD_VALUES, FastPostCardSerializer, PostCardSerializer
+
+
+class Command(BaseCommand):
+    help = "게시글 카드 직렬화(PostCardSerializer vs FastPostCardSerializer)의 페이지당 처리 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=20, help="한 페이지의 게시글 수")
+        parser.add_argument("--iterations", type=int, default=200, help="방식별 반복 횟수")
+
+    def handle(self, *args, **options):
+        if options["count"] <= 0 or options["iterations"] <= 0:
+            raise CommandError("--count, --iterations 값은 1 이상이어야 합니다.")
+
+        factory = RequestFactory(HTTP_HOST=(settings.ALLOWED_HOSTS or ["localhost"])[0].lstrip("."))
+        request = Request(factory.get("/api/posts/"))
+        request.user = AnonymousUser()
+        context = {"request": request}
+
+        queryset = Post.objects.order_by("-created_at", "-id")[: options["count"]]
+        posts = list(queryset.select_related("author", "platform", "model", "category"))
+        rows = list(queryset.values(*POST_CARD_VALUES))
+        if not posts:
+            raise CommandError("측정할 게시글이 없습니다.")
+
+        renderer = JSONRenderer()
+        expected = renderer.render(PostCardSerializer(posts, many=True, context=context).data)
+        for label, payload in (
+            ("모델 인스턴스", FastPostCardSerializer(context).serialize(posts)),
+            ("values() 행", FastPostCardSerializer(context).serialize(rows)),
+        ):
+            if renderer.render(payload) != expected:
+                raise CommandError(f"FastPostCardSerializer({label}) 결과가 PostCardSerializer와 다릅니다.")
+
+        cases = (
+            ("PostCardSerializer", lambda: PostCardSerializer(posts, many=True, context=context).data),
+            ("FastPostCardSerializer(인스턴스)", lambda: FastPostCardSerializer(context).serialize(posts)),
+            ("FastPostCardSerializer(values)", lambda: FastPostCardSerializer(context).serialize(rows)),
+        )
+        for label, serialize in cases:
+            timings = []
+            for _ in range(options["iterations"]):
+                started = time.perf_counter()
+                serialize()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            self.stdout.write(
+                f"{label}: 게시글 {len(posts)}건, "
+                f"평균 {statistics.mean(timings):.3f}ms, "
+                f"p50 {timings[len(timings) // 2]:.3f}ms, "
+                f"p95 {timings[int(len(timings) * 0.95) - 1]:.3f}ms"
+            )
+
+        self.stdout.write(self.style.SUCCESS("측정을 완료했습니다. 두 방식의 JSON 결과가 동일합니다."))
@@ -0,0 +1,61 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.services.post_transfer import TRANSFER_BATCH_SIZE, export_posts
+
+TAIL_READ_BYTES = 1024 * 1024
+
+
+def _resume_point(path: str) -> int | None:
+    # Drops a partially written last line and returns the id of the last complete record.
+    with open(path, "rb+") as output:
+        size = output.seek(0, os.SEEK_END)
+        window = TAIL_READ_BYTES
+        while True:
+            start = max(size - window, 0)
+            output.seek(start)
+            tail = output.read()
+            lines = tail.split(b"\n")
+            # Without a newline before the last complete line the window may have cut it; widen it.
+            if start == 0 or len(lines) >= 3:
+                break
+            window *= 2
+        output.truncate(size - len(lines[-1]))
+    complete = [line for line in lines[:-1] if line.strip()]
+    return json.loads(complete[-1])["id"] if complete else None
+
+
+class Command(BaseCommand):
+    help = "게시글을 JSONL 형식(한 줄에 게시글 하나)으로 스트리밍 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="출력 파일 경로 (기본: 표준 출력)")
+        parser.add_argument("--chunk-size", type=int, default=TRANSFER_BATCH_SIZE, help="한 번에 읽을 게시글 수")
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="기존 출력 파일의 마지막 게시글 다음부터 이어서 내보냅니다.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"]
+        if options["chunk_size"] <= 0:
+            raise CommandError("--chunk-size 값은 1 이상이어야 합니다.")
+        if options["resume"] and not path:
+            raise CommandError("--resume 옵션은 --output 과 함께 사용해야 합니다.")
+
+        after_id = None
+        if options["resume"] and os.path.exists(path):
+            after_id = _resume_point(path)
+
+        if path:
+            with open(path, "a" if options["resume"] else "w", encoding="utf-8") as output:
+                exported, last_id = export_posts(output, chunk_size=options["chunk_size"], after_id=after_id)
+            report = self.stdout
+        else:
+            exported, last_id = export_posts(self.stdout, chunk_size=options["chunk_size"], after_id=after_id)
+            report = self.stderr
+
+        report.write(self.style.SUCCESS(f"게시글 {exported}건을 내보냈습니다. (마지막 ID: {last_id})"))
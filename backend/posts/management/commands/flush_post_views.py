@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from posts.services import ViewCountBuffer
+
+
+class Command(BaseCommand):
+    help = "캐시에 버퍼링된 게시글 조회수를 DB에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            type=int,
+            default=0,
+            help="지정한 초 간격으로 계속 반영합니다. (0이면 한 번만 실행)",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["loop"]
+        while True:
+            flushed = ViewCountBuffer.flush()
+            self.stdout.write(self.style.SUCCESS(f"조회수 {flushed}건을 반영했습니다."))
+            if interval <= 0:
+                break
+            time.sleep(interval)
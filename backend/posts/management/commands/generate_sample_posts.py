@@ -8,6 +8,8 @@ from django.db import transaction
 from django.utils import timezone
 
 from posts.models import AiModel, Category, Platform, Post
+from posts.services.tag_service import TagService
+from posts.utils import compute_hot_score
 
 
 class Command(BaseCommand):
@@ -117,12 +119,13 @@ class Command(BaseCommand):
                     existing_post.like_count = sample["likes"]
                     existing_post.bookmark_count = sample["bookmarks"]
                     existing_post.created_at = sample["created_at"]
-                    existing_post.save()
+                    existing_post.validated_save()
+                    TagService.sync_post_tags(existing_post)
                     created += 1
                     self.stdout.write(self.style.SUCCESS(f"[UPDATE] {summary}"))
                     continue
 
-                post = Post.objects.create(
+                post = Post(
                     title=sample["title"],
                     author=sample["user"],
                     platform=sample["platform"],
@@ -136,11 +139,16 @@ class Command(BaseCommand):
                     additional_opinion=sample.get("additional_opinion", ""),
                     satisfaction=sample["satisfaction"],
                 )
-                Post.objects.filter(pk=post.pk).update(
+                post.validated_save()
+                TagService.sync_post_tags(post)
+                popularity_score = sample["likes"] + sample["bookmarks"]
+                post.fast_update(
                     view_count=sample["views"],
                     like_count=sample["likes"],
                     bookmark_count=sample["bookmarks"],
                     created_at=sample["created_at"],
+                    popularity_score=popularity_score,
+                    hot_score=compute_hot_score(popularity_score, sample["created_at"]),
                 )
                 created += 1
                 self.stdout.write(self.style.SUCCESS(f"[CREATE] {summary}"))
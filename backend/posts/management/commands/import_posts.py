@@ -0,0 +1,86 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from posts.services.post_transfer import TRANSFER_BATCH_SIZE, PostImporter
+from stats.services import DashboardStatsService, UserStatsService
+
+
+class Command(BaseCommand):
+    help = "export_posts 로 만든 JSONL 파일에서 게시글을 배치 단위로 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 JSONL 파일 경로")
+        parser.add_argument("--batch-size", type=int, default=TRANSFER_BATCH_SIZE, help="한 번에 저장할 게시글 수")
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="체크포인트 파일(<path>.checkpoint)에 기록된 줄 다음부터 이어서 가져옵니다.",
+        )
+        parser.add_argument(
+            "--create-missing-refs",
+            action="store_true",
+            help="없는 플랫폼/모델/카테고리를 자동으로 생성합니다.",
+        )
+        parser.add_argument("--default-author", help="작성자를 찾을 수 없을 때 사용할 사용자 이메일")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        checkpoint_path = f"{path}.checkpoint"
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size 값은 1 이상이어야 합니다.")
+        if not os.path.exists(path):
+            raise CommandError(f"파일을 찾을 수 없습니다: {path}")
+
+        default_author_id = None
+        if options["default_author"]:
+            default_author_id = (
+                get_user_model().objects.filter(email=options["default_author"]).values_list("id", flat=True).first()
+            )
+            if default_author_id is None:
+                raise CommandError(f"기본 작성자를 찾을 수 없습니다: {options['default_author']}")
+
+        start_line = 0
+        if options["resume"] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, encoding="utf-8") as checkpoint:
+                start_line = int(checkpoint.read().strip() or 0)
+            self.stdout.write(f"{start_line}행 다음부터 이어서 가져옵니다.")
+
+        def save_checkpoint(line_number):
+            with open(checkpoint_path, "w", encoding="utf-8") as checkpoint:
+                checkpoint.write(str(line_number))
+
+        importer = PostImporter(
+            create_missing_refs=options["create_missing_refs"],
+            default_author_id=default_author_id,
+        )
+        try:
+            with open(path, encoding="utf-8") as lines:
+                result = importer.import_lines(
+                    lines,
+                    batch_size=options["batch_size"],
+                    start_line=start_line,
+                    on_batch=save_checkpoint,
+                )
+        except DatabaseError as error:
+            raise CommandError(f"가져오기 중 오류가 발생했습니다. --resume 으로 이어서 실행할 수 있습니다: {error}")
+
+        # bulk_create bypasses the post_save receivers that maintain the derived stats.
+        if result.imported:
+            for author_id in result.author_ids:
+                UserStatsService.refresh_author(author_id)
+            DashboardStatsService.reconcile()
+
+        for error in result.errors:
+            self.stderr.write(error)
+        if result.error_count > len(result.errors):
+            self.stderr.write(f"... 외 {result.error_count - len(result.errors)}건의 오류")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"게시글 {result.imported}건을 가져왔습니다. "
+                f"(중복 {result.duplicates}건, 오류 {result.error_count}건)"
+            )
+        )
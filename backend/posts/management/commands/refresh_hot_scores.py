@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from posts.services import RankingService
+from posts.services.ranking_service import REFRESH_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "게시글 급상승 점수(hot_score)를 현재 시각 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REFRESH_BATCH_SIZE,
+            help="한 번에 갱신할 게시글 수",
+        )
+
+    def handle(self, *args, **options):
+        updated = RankingService.refresh_hot_scores(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"게시글 {updated}건의 급상승 점수를 갱신했습니다."))
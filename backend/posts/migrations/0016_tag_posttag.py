@@ -0,0 +1,86 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+TAG_NAME_MAX_LENGTH = 50
+
+
+def _split_tags(raw_tags):
+    names = []
+    for raw_name in (raw_tags or '').split(','):
+        name = raw_name.strip()[:TAG_NAME_MAX_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def backfill_tags(apps, schema_editor):
+    Post = apps.get_model('posts', 'Post')
+    Tag = apps.get_model('posts', 'Tag')
+    PostTag = apps.get_model('posts', 'PostTag')
+
+    post_tag_names = [
+        (post_id, _split_tags(raw_tags))
+        for post_id, raw_tags in Post.objects.exclude(tags='').values_list('id', 'tags').iterator(chunk_size=BATCH_SIZE)
+    ]
+
+    tag_counts = {}
+    for _, names in post_tag_names:
+        for name in names:
+            tag_counts[name] = tag_counts.get(name, 0) + 1
+
+    Tag.objects.bulk_create(
+        [Tag(name=name, post_count=count) for name, count in tag_counts.items()],
+        batch_size=BATCH_SIZE,
+    )
+    tag_ids = dict(Tag.objects.values_list('name', 'id'))
+    PostTag.objects.bulk_create(
+        [
+            PostTag(post_id=post_id, tag_id=tag_ids[name])
+            for post_id, names in post_tag_names
+            for name in names
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0015_post_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='태그명')),
+                ('post_count', models.PositiveIntegerField(default=0, verbose_name='게시글 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '태그',
+                'verbose_name_plural': '태그',
+                'ordering': ['-post_count', 'name'],
+                'indexes': [models.Index(fields=['-post_count', 'name'], name='posts_tag_post_co_604799_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_tags', to='posts.post', verbose_name='게시글')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_tags', to='posts.tag', verbose_name='태그')),
+            ],
+            options={
+                'verbose_name': '게시글 태그',
+                'verbose_name_plural': '게시글 태그',
+                'indexes': [models.Index(fields=['tag', 'post'], name='posts_postt_tag_id_802262_idx')],
+                'unique_together': {('post', 'tag')},
+            },
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:41
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+BATCH_SIZE = 1000
+HOT_SCORE_GRAVITY = 1.8
+
+
+def backfill_scores(apps, schema_editor):
+    Post = apps.get_model('posts', 'Post')
+    Post.objects.update(popularity_score=F('like_count') + F('bookmark_count'))
+
+    now = timezone.now()
+    batch = []
+    for post in Post.objects.only('id', 'popularity_score', 'created_at').iterator(chunk_size=BATCH_SIZE):
+        age_hours = max((now - post.created_at).total_seconds() / 3600, 0)
+        post.hot_score = (post.popularity_score + 1) / (age_hours + 2) ** HOT_SCORE_GRAVITY
+        batch.append(post)
+        if len(batch) >= BATCH_SIZE:
+            Post.objects.bulk_update(batch, ['hot_score'])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['hot_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0016_tag_posttag'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0, verbose_name='급상승 점수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='popularity_score',
+            field=models.PositiveIntegerField(default=0, verbose_name='인기 점수'),
+        ),
+        migrations.RunPython(backfill_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-popularity_score', '-created_at'], name='posts_post_popular_d7cb67_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-hot_score', '-created_at'], name='posts_post_hot_sco_93b8d8_idx'),
+        ),
+    ]
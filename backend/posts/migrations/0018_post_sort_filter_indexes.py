@@ -0,0 +1,103 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:43
+
+from django.db import migrations, models
+
+import posts.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0017_post_popularity_hot_score'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='post',
+            name='posts_post_platfor_72ffc6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='posts_post_categor_b0a4b1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='posts_post_author__19d68b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='post',
+            name='posts_post_model_i_00884b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='postinteraction',
+            name='posts_posti_is_like_7737da_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='postinteraction',
+            name='posts_posti_is_book_09729c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-view_count', '-created_at'], name='posts_post_view_co_702635_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=posts.models.NullsLastIndex(models.OrderBy(models.F('satisfaction'), descending=True, nulls_last=True), models.OrderBy(models.F('created_at'), descending=True), name='posts_post_satis_nl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-created_at'], name='posts_post_author__f8ea20_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['model', '-created_at'], name='posts_post_model_i_4c63e4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['platform', '-created_at'], name='posts_post_platfor_ce9466_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['platform', '-popularity_score', '-created_at'], name='posts_post_platfor_7c3773_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['platform', '-hot_score', '-created_at'], name='posts_post_platfor_7e532d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['platform', '-view_count', '-created_at'], name='posts_post_platfor_c4b3ad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=posts.models.NullsLastIndex(models.F('platform'), models.OrderBy(models.F('satisfaction'), descending=True, nulls_last=True), models.OrderBy(models.F('created_at'), descending=True), name='posts_post_plat_satis_nl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-created_at'], name='posts_post_categor_26d9c0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-popularity_score', '-created_at'], name='posts_post_categor_623800_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-hot_score', '-created_at'], name='posts_post_categor_4246bb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-view_count', '-created_at'], name='posts_post_categor_5d7960_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=posts.models.NullsLastIndex(models.F('category'), models.OrderBy(models.F('satisfaction'), descending=True, nulls_last=True), models.OrderBy(models.F('created_at'), descending=True), name='posts_post_cat_satis_nl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postinteraction',
+            index=models.Index(condition=models.Q(('is_liked', True)), fields=['user', '-updated_at'], name='posts_posti_user_liked_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='postinteraction',
+            index=models.Index(condition=models.Q(('is_bookmarked', True)), fields=['user', '-updated_at'], name='posts_posti_user_bmark_idx'),
+        ),
+    ]
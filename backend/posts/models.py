@@ -1,12 +1,40 @@
+import copy
 from django.db import models
 from django.core.validators import MinLengthValidator, MaxLengthValidator, MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from decimal import Decimal
-from django.db import transaction
+from django.db import connection, transaction
 from django.conf import settings
 from django.utils.text import slugify
+from .events import post_counter_changed
+from .utils import compute_hot_score, hot_score_decay
+from django.db.models import F, OrderBy, Value
+from django.db.models.functions import Greatest
 
 
+def _supports_update_returning():
+    # UPDATE ... RETURNING: PostgreSQL, and SQLite from 3.35. Other backends re-read the row.
+    if connection.vendor == 'postgresql':
+        return True
+    if connection.vendor == 'sqlite':
+        import sqlite3
+        return sqlite3.sqlite_version_info >= (3, 35)
+    return False
+
+
+class NullsLastIndex(models.Index):
+    # Postgres needs NULLS LAST in the index to serve "DESC NULLS LAST" ordering.
+    # SQLite already sorts NULLs last on DESC and rejects the modifier in CREATE INDEX.
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        index = self
+        if schema_editor.connection.vendor != 'postgresql':
+            index = copy.copy(self)
+            index.expressions = tuple(
+                OrderBy(expression.expression, descending=expression.descending) if isinstance(expression, OrderBy) else expression
+                for expression in self.expressions
+            )
+        return models.Index.create_sql(index, model, schema_editor, using=using, **kwargs)
+
 
 class Platform(models.Model):
     name = models.CharField(max_length=50, unique=True, verbose_name="플랫폼명")
@@ -200,6 +228,8 @@ class Post(models.Model):
     view_count = models.PositiveIntegerField(default=0, verbose_name="조회수")
     like_count = models.PositiveIntegerField(default=0, verbose_name="좋아요 수")
     bookmark_count = models.PositiveIntegerField(default=0, verbose_name="북마크 수")
+    popularity_score = models.PositiveIntegerField(default=0, verbose_name="인기 점수")
+    hot_score = models.FloatField(default=0, verbose_name="급상승 점수")
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일시")
@@ -210,10 +240,27 @@ class Post(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['platform']),
-            models.Index(fields=['category']),
-            models.Index(fields=['author']),
-            models.Index(fields=['model']),
+            models.Index(fields=['-popularity_score', '-created_at']),
+            models.Index(fields=['-hot_score', '-created_at']),
+            models.Index(fields=['-view_count', '-created_at']),
+            NullsLastIndex(F('satisfaction').desc(nulls_last=True), F('created_at').desc(), name='posts_post_satis_nl_idx'),
+            models.Index(fields=['author', '-created_at']),
+            models.Index(fields=['model', '-created_at']),
+            # Community feed: platform/category filter combined with each sort option.
+            models.Index(fields=['platform', '-created_at']),
+            models.Index(fields=['platform', '-popularity_score', '-created_at']),
+            models.Index(fields=['platform', '-hot_score', '-created_at']),
+            models.Index(fields=['platform', '-view_count', '-created_at']),
+            NullsLastIndex(
+                F('platform'), F('satisfaction').desc(nulls_last=True), F('created_at').desc(), name='posts_post_plat_satis_nl_idx'
+            ),
+            models.Index(fields=['category', '-created_at']),
+            models.Index(fields=['category', '-popularity_score', '-created_at']),
+            models.Index(fields=['category', '-hot_score', '-created_at']),
+            models.Index(fields=['category', '-view_count', '-created_at']),
+            NullsLastIndex(
+                F('category'), F('satisfaction').desc(nulls_last=True), F('created_at').desc(), name='posts_post_cat_satis_nl_idx'
+            ),
         ]
 
     def __str__(self):
@@ -261,9 +308,127 @@ class Post(models.Model):
             if satisfaction_times_10 % 5 != 0:
                 raise ValidationError({'satisfaction': '만족도는 0.5점 단위로 입력해야 합니다.'})
 
-    def save(self, *args, **kwargs):
+    def apply_counter_delta(self, counter_field, delta, user=None):
+        # Counter, popularity_score and hot_score move together in one statement; no read-modify-write.
+        decay = hot_score_decay(self.created_at)
+        if _supports_update_returning():
+            qn = connection.ops.quote_name
+            table = qn(self._meta.db_table)
+            pk = qn(self._meta.pk.column)
+            counter = qn(self._meta.get_field(counter_field).column)
+            popularity = qn(self._meta.get_field('popularity_score').column)
+            hot = qn(self._meta.get_field('hot_score').column)
+            new_popularity = f"CASE WHEN {popularity} + %s < 0 THEN 0 ELSE {popularity} + %s END"
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET "
+                    f"{counter} = CASE WHEN {counter} + %s < 0 THEN 0 ELSE {counter} + %s END, "
+                    f"{popularity} = {new_popularity}, "
+                    f"{hot} = ({new_popularity} + 1) * %s "
+                    f"WHERE {pk} = %s RETURNING {counter}, {popularity}, {hot}",
+                    [delta, delta, delta, delta, delta, delta, decay, self.pk],
+                )
+                row = cursor.fetchone()
+        else:
+            new_popularity = Greatest(F('popularity_score') + delta, Value(0))
+            Post.objects.filter(pk=self.pk).update(**{
+                counter_field: Greatest(F(counter_field) + delta, Value(0)),
+                'popularity_score': new_popularity,
+                'hot_score': (new_popularity + 1) * Value(decay),
+            })
+            row = Post.objects.filter(pk=self.pk).values_list(counter_field, 'popularity_score', 'hot_score').first()
+
+        counter_value, popularity_score, hot_score = row or (0, 0, 0.0)
+        setattr(self, counter_field, counter_value)
+        self.popularity_score = popularity_score
+        self.hot_score = hot_score
+        self._remember_loaded(**{counter_field: counter_value, 'popularity_score': popularity_score, 'hot_score': hot_score})
+        post_counter_changed.send(sender=Post, post=self, counter_field=counter_field, delta=delta, user=user)
+        return counter_value
+
+    def refresh_scores(self):
+        self.popularity_score = self.like_count + self.bookmark_count
+        self.hot_score = compute_hot_score(self.popularity_score, self.created_at)
+
+    def validated_save(self, *args, **kwargs):
+        # save() no longer validates; entry points with untrusted data (scripts, imports) call this instead.
         self.full_clean()
+        self.save(*args, **kwargs)
+
+    def fast_update(self, **values):
+        # Counter/maintenance writes: one UPDATE, no validation, no save() signals, updated_at untouched.
+        Post.objects.filter(pk=self.pk).update(**values)
+        for field, value in values.items():
+            setattr(self, field, value)
+        self._remember_loaded(**values)
+
+    def _remember_loaded(self, **values):
+        # Keeps the loaded snapshot in line with writes made outside save().
+        if hasattr(self, '_loaded_values'):
+            self._loaded_values.update({self._meta.get_field(field).attname: value for field, value in values.items()})
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Column values as loaded, so save receivers can diff without re-reading the row.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.refresh_scores()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'like_count', 'bookmark_count'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'popularity_score', 'hot_score'}
         super().save(*args, **kwargs)
+        saved_fields = self._meta.concrete_fields
+        if kwargs.get('update_fields') is not None:
+            saved_fields = [field for field in saved_fields if field.name in kwargs['update_fields']]
+        loaded = getattr(self, '_loaded_values', {})
+        loaded.update({field.attname: getattr(self, field.attname) for field in saved_fields})
+        self._loaded_values = loaded
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True, verbose_name="태그명")
+    post_count = models.PositiveIntegerField(default=0, verbose_name="게시글 수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+
+    class Meta:
+        verbose_name = "태그"
+        verbose_name_plural = "태그"
+        ordering = ['-post_count', 'name']
+        indexes = [
+            models.Index(fields=['-post_count', 'name']),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class PostTag(models.Model):
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='post_tags',
+        verbose_name="게시글"
+    )
+    tag = models.ForeignKey(
+        Tag,
+        on_delete=models.CASCADE,
+        related_name='post_tags',
+        verbose_name="태그"
+    )
+
+    class Meta:
+        verbose_name = "게시글 태그"
+        verbose_name_plural = "게시글 태그"
+        unique_together = ['post', 'tag']
+        indexes = [
+            models.Index(fields=['tag', 'post']),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} - {self.tag_id}"
 
 
 class PostInteraction(models.Model):
@@ -290,8 +455,18 @@ class PostInteraction(models.Model):
         unique_together = ['user', 'post']
         indexes = [
             models.Index(fields=['user', 'post']),
-            models.Index(fields=['is_liked']),
-            models.Index(fields=['is_bookmarked']),
+            # Partial rather than (user, is_liked, -updated_at): Django emits a bare boolean
+            # predicate that SQLite cannot match against a composite key.
+            models.Index(
+                fields=['user', '-updated_at'],
+                condition=models.Q(is_liked=True),
+                name='posts_posti_user_liked_idx',
+            ),
+            models.Index(
+                fields=['user', '-updated_at'],
+                condition=models.Q(is_bookmarked=True),
+                name='posts_posti_user_bmark_idx',
+            ),
         ]
 
     def __str__(self):
@@ -313,16 +488,11 @@ class PostInteraction(models.Model):
         with transaction.atomic():
             super().save(*args, **kwargs)
             
+            counter_deltas = {}
             if old_liked != self.is_liked:
-                if self.is_liked:
-                    self.post.like_count += 1
-                else:
-                    self.post.like_count = max(0, self.post.like_count - 1)
-            
+                counter_deltas['like_count'] = 1 if self.is_liked else -1
             if old_bookmarked != self.is_bookmarked:
-                if self.is_bookmarked:
-                    self.post.bookmark_count += 1
-                else:
-                    self.post.bookmark_count = max(0, self.post.bookmark_count - 1)
-            
-            self.post.save(update_fields=['like_count', 'bookmark_count'])
+                counter_deltas['bookmark_count'] = 1 if self.is_bookmarked else -1
+
+            for field, delta in counter_deltas.items():
+                self.post.apply_counter_delta(field, delta, user=self.user)
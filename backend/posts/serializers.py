@@ -1,7 +1,11 @@
 from rest_framework import serializers
 from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from .models import Platform, AiModel, Category, Post, PostInteraction
 from .utils import format_relative_time
+from .services.tag_service import TagService
 
 
 class PlatformSerializer(serializers.ModelSerializer):
@@ -65,7 +69,9 @@ class PostValidationMixin:
         return value
 
     def validate(self, data):
-        return self.validate_business_logic(data)
+        data = self.validate_business_logic(data)
+        self.validate_model_rules(data)
+        return data
 
     def validate_platform(self, value):
         if not value:
@@ -97,6 +103,19 @@ class PostValidationMixin:
         
         return data
 
+    def validate_model_rules(self, data):
+        # Post.clean() rules run here rather than on every Post.save(); related objects are already loaded.
+        values = {
+            field: data[field] if field in data else getattr(self.instance, field, None)
+            for field in ('platform', 'model', 'model_etc', 'model_detail', 'satisfaction')
+        }
+        if values['platform'] is None:
+            return
+        try:
+            Post(**values).clean()
+        except DjangoValidationError as error:
+            raise serializers.ValidationError(error.message_dict)
+
 
 class PostBaseSerializer(serializers.ModelSerializer):
     author = serializers.CharField(source='author.username', read_only=True)
@@ -155,37 +174,18 @@ class PostBaseSerializer(serializers.ModelSerializer):
     def get_relativeTime(self, obj):
         return format_relative_time(obj.created_at)
 
-    def _get_viewer_interaction_flag(self, obj, *, annotated_field: str, interaction_field: str):
+    def _get_viewer_interaction_flag(self, obj, flag_attribute: str):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
-
-        annotated_value = getattr(obj, annotated_field, None)
-        if annotated_value is not None:
-            return bool(annotated_value)
-
-        prefetched_interactions = getattr(obj, '_prefetched_objects_cache', {}).get('interactions')
-        if prefetched_interactions is not None:
-            return any(
-                interaction.user_id == request.user.id and getattr(interaction, interaction_field, False)
-                for interaction in prefetched_interactions
-            )
-
-        return obj.interactions.filter(user=request.user, **{interaction_field: True}).exists()
+        # Set per page by attach_viewer_interaction_flags; missing means not interacted.
+        return bool(getattr(obj, flag_attribute, False))
 
     def get_isLiked(self, obj):
-        return self._get_viewer_interaction_flag(
-            obj,
-            annotated_field='viewer_is_liked',
-            interaction_field='is_liked',
-        )
+        return self._get_viewer_interaction_flag(obj, 'viewer_is_liked')
 
     def get_isBookmarked(self, obj):
-        return self._get_viewer_interaction_flag(
-            obj,
-            annotated_field='viewer_is_bookmarked',
-            interaction_field='is_bookmarked',
-        )
+        return self._get_viewer_interaction_flag(obj, 'viewer_is_bookmarked')
 
     def get_tags(self, obj):
         return obj.get_tags_list()
@@ -203,6 +203,136 @@ class PostCardSerializer(PostBaseSerializer):
         fields = PostBaseSerializer.COMMON_FIELDS
 
 
+# Columns the flat card path reads; usable directly with Post.objects.values(*POST_CARD_VALUES).
+POST_CARD_VALUES = [
+    'id', 'title', 'created_at', 'view_count', 'like_count', 'bookmark_count', 'satisfaction', 'tags',
+    'platform_id', 'model_id', 'category_id', 'model_etc', 'model_detail', 'category_etc',
+    'model__name', 'category__name',
+    'author__username', 'author__avatar_color1', 'author__avatar_color2',
+    'author__profile_image', 'author__avatar',
+]
+
+
+def _optional_str(value):
+    return None if value is None else str(value)
+
+
+class FastPostCardSerializer:
+    # Same dicts as PostCardSerializer(many=True).data without per-row DRF field machinery.
+    # Typed fields reuse PostCardSerializer's own field instances; now, viewer and avatar URLs are resolved once per page.
+    _fields = None
+
+    def __init__(self, context=None):
+        context = context or {}
+        self.request = context.get('request')
+        user = getattr(self.request, 'user', None)
+        self.viewer_authenticated = bool(user and user.is_authenticated)
+        self.now = timezone.now()
+        self.avatar_urls = {}
+        user_model = get_user_model()
+        self.avatar_storages = {
+            field_name: user_model._meta.get_field(field_name).storage for field_name in ('profile_image', 'avatar')
+        }
+        if FastPostCardSerializer._fields is None:
+            FastPostCardSerializer._fields = PostCardSerializer().fields
+        self.created_at_field = self._fields['createdAt']
+        self.satisfaction_field = self._fields['satisfaction']
+
+    @staticmethod
+    def row_from_instance(post) -> dict:
+        author = post.author
+        return {
+            'id': post.id,
+            'title': post.title,
+            'created_at': post.created_at,
+            'view_count': post.view_count,
+            'like_count': post.like_count,
+            'bookmark_count': post.bookmark_count,
+            'satisfaction': post.satisfaction,
+            'tags': post.tags,
+            'platform_id': post.platform_id,
+            'model_id': post.model_id,
+            'category_id': post.category_id,
+            'model_etc': post.model_etc,
+            'model_detail': post.model_detail,
+            'category_etc': post.category_etc,
+            'model__name': post.model.name if post.model_id else None,
+            'category__name': post.category.name,
+            'author__username': author.username,
+            'author__avatar_color1': author.avatar_color1,
+            'author__avatar_color2': author.avatar_color2,
+            'author__profile_image': author.profile_image.name,
+            'author__avatar': author.avatar.name,
+            'viewer_is_liked': getattr(post, 'viewer_is_liked', False),
+            'viewer_is_bookmarked': getattr(post, 'viewer_is_bookmarked', False),
+        }
+
+    def _avatar_src(self, row):
+        for field_name in ('profile_image', 'avatar'):
+            name = row[f'author__{field_name}']
+            if not name:
+                continue
+            key = (field_name, name)
+            if key not in self.avatar_urls:
+                try:
+                    url = self.avatar_storages[field_name].url(name)
+                    if url and self.request and isinstance(url, str) and url.startswith('/'):
+                        url = self.request.build_absolute_uri(url)
+                    self.avatar_urls[key] = url or None
+                except (AttributeError, ValueError):
+                    self.avatar_urls[key] = None
+            return self.avatar_urls[key]
+        return None
+
+    def to_representation(self, row) -> dict:
+        if not isinstance(row, dict):
+            row = self.row_from_instance(row)
+
+        username = row['author__username']
+        model_name = row['model__name']
+        category_name = row['category__name']
+        if row['model_detail']:
+            model_display_name = row['model_detail']
+        elif model_name == '기타' and row['model_etc']:
+            model_display_name = row['model_etc']
+        else:
+            model_display_name = model_name if row['model_id'] else '기타'
+        tags = row['tags']
+        satisfaction = row['satisfaction']
+
+        return {
+            'id': row['id'],
+            'title': str(row['title']),
+            'author': str(username),
+            'authorInitial': username[0].upper() if username else 'U',
+            'avatarSrc': self._avatar_src(row),
+            'authorAvatarColor1': _optional_str(row['author__avatar_color1']),
+            'authorAvatarColor2': _optional_str(row['author__avatar_color2']),
+            'createdAt': self.created_at_field.to_representation(row['created_at']),
+            'relativeTime': format_relative_time(row['created_at'], now=self.now),
+            'views': int(row['view_count']),
+            'platformId': int(row['platform_id']),
+            'modelId': None if row['model_id'] is None else int(row['model_id']),
+            'categoryId': int(row['category_id']),
+            'modelEtc': _optional_str(row['model_etc']),
+            'modelDetail': _optional_str(row['model_detail']),
+            'categoryEtc': _optional_str(row['category_etc']),
+            'modelDisplayName': model_display_name,
+            'categoryDisplayName': (
+                row['category_etc'] if category_name == '기타' and row['category_etc'] else category_name
+            ),
+            'likes': int(row['like_count']),
+            'isLiked': self.viewer_authenticated and bool(row.get('viewer_is_liked', False)),
+            'bookmarks': int(row['bookmark_count']),
+            'isBookmarked': self.viewer_authenticated and bool(row.get('viewer_is_bookmarked', False)),
+            'satisfaction': None if satisfaction is None else self.satisfaction_field.to_representation(satisfaction),
+            'tags': [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else [],
+        }
+
+    def serialize(self, rows) -> list[dict]:
+        return [self.to_representation(row) for row in rows]
+
+
 class PostDetailSerializer(PostBaseSerializer):
     aiResponse = serializers.CharField(source='ai_response', read_only=True)
     additionalOpinion = serializers.CharField(source='additional_opinion', read_only=True)
@@ -245,7 +375,9 @@ class PostCreateSerializer(PostValidationMixin, serializers.ModelSerializer):
         tags_data = validated_data.pop('tags', [])
         validated_data['author'] = self.context['request'].user
         validated_data['tags'] = ', '.join(tags_data) if tags_data else ""
-        return super().create(validated_data)
+        post = super().create(validated_data)
+        TagService.sync_post_tags(post)
+        return post
 
 
 class PostEditSerializer(PostValidationMixin, serializers.ModelSerializer):
@@ -305,7 +437,10 @@ class PostEditSerializer(PostValidationMixin, serializers.ModelSerializer):
         tags_data = validated_data.pop('tags', None)
         if tags_data is not None:
             validated_data['tags'] = ', '.join(tags_data) if tags_data else ""
-        return super().update(instance, validated_data)
+        post = super().update(instance, validated_data)
+        if tags_data is not None:
+            TagService.sync_post_tags(post)
+        return post
 
 
 class TagSerializer(serializers.Serializer):
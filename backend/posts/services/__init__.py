@@ -1,11 +1,29 @@
 from .interaction_service import InteractionService
 from .model_suggest_service import ModelSuggestService
+from .interaction_overlay import attach_viewer_interaction_flags, overlay_viewer_flags
+from .post_list_cache import PostListCache
+from .post_transfer import PostImporter, export_posts
 from .post_service import build_posts_page, build_user_posts_page, get_post_and_increment_views
+from .ranking_service import RankingService
+from .reference_data import ReferenceData
+from .tag_service import TagService, parse_tag_names
+from .view_count_service import ViewCountBuffer, viewer_key_for_request
 
 __all__ = [
     "InteractionService",
     "ModelSuggestService",
+    "PostListCache",
+    "attach_viewer_interaction_flags",
+    "overlay_viewer_flags",
     "build_posts_page",
     "build_user_posts_page",
     "get_post_and_increment_views",
+    "PostImporter",
+    "export_posts",
+    "RankingService",
+    "ReferenceData",
+    "TagService",
+    "parse_tag_names",
+    "ViewCountBuffer",
+    "viewer_key_for_request",
 ]
@@ -0,0 +1,37 @@
+from django.db.models import Q
+
+from posts.models import PostInteraction
+
+
+def fetch_viewer_interaction_flags(user, post_ids) -> dict:
+    if user is None or not getattr(user, 'is_authenticated', False) or not post_ids:
+        return {}
+
+    return {
+        post_id: (is_liked, is_bookmarked)
+        for post_id, is_liked, is_bookmarked in PostInteraction.objects.filter(
+            Q(is_liked=True) | Q(is_bookmarked=True),
+            user=user,
+            post_id__in=post_ids,
+        ).values_list('post_id', 'is_liked', 'is_bookmarked')
+    }
+
+
+def attach_viewer_interaction_flags(posts, user):
+    posts = list(posts)
+    flags = fetch_viewer_interaction_flags(user, [post.id for post in posts])
+    for post in posts:
+        post.viewer_is_liked, post.viewer_is_bookmarked = flags.get(post.id, (False, False))
+    return posts
+
+
+def overlay_viewer_flags(results: list, user) -> list:
+    if user is None or not getattr(user, 'is_authenticated', False) or not results:
+        return results
+
+    flags = fetch_viewer_interaction_flags(user, [item['id'] for item in results])
+    overlaid = []
+    for item in results:
+        is_liked, is_bookmarked = flags.get(item['id'], (False, False))
+        overlaid.append({**item, 'isLiked': is_liked, 'isBookmarked': is_bookmarked})
+    return overlaid
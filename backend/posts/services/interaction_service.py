@@ -1,33 +1,58 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
 from posts.models import Post, PostInteraction
+from posts.services.post_list_cache import PostListCache
+
+COUNTER_FIELDS = {
+    'is_liked': 'like_count',
+    'is_bookmarked': 'bookmark_count',
+}
 
 
 class InteractionService:
+    @staticmethod
+    def _flip_flag(user, post: Post, flag_field: str) -> bool:
+        interactions = PostInteraction.objects.filter(user=user, post=post)
+        while True:
+            # update() bypasses auto_now; liked/bookmarked feeds sort by updated_at.
+            now = timezone.now()
+            if interactions.filter(**{flag_field: False}).update(**{flag_field: True, 'updated_at': now}):
+                return True
+            if interactions.filter(**{flag_field: True}).update(**{flag_field: False, 'updated_at': now}):
+                return False
+            try:
+                with transaction.atomic():
+                    # bulk_create skips PostInteraction.save(), which would adjust the counter itself.
+                    PostInteraction.objects.bulk_create([
+                        PostInteraction(user=user, post=post, **{flag_field: True}),
+                    ])
+                return True
+            except IntegrityError:
+                # Another request created the row first; flip the row it created.
+                continue
+
+    @staticmethod
+    def _toggle(user, post: Post, flag_field: str):
+        counter_field = COUNTER_FIELDS[flag_field]
+        with transaction.atomic():
+            is_set = InteractionService._flip_flag(user, post, flag_field)
+            count = post.apply_counter_delta(counter_field, 1 if is_set else -1, user=user)
+            transaction.on_commit(PostListCache.invalidate)
+        return is_set, count
+
     @staticmethod
     def toggle_like(user, post: Post) -> dict:
-        interaction, _ = PostInteraction.objects.get_or_create(
-            user=user,
-            post=post,
-            defaults={'is_liked': False, 'is_bookmarked': False},
-        )
-        interaction.is_liked = not interaction.is_liked
-        interaction.save()
-        post.refresh_from_db()
+        is_liked, like_count = InteractionService._toggle(user, post, 'is_liked')
         return {
-            'is_liked': interaction.is_liked,
-            'like_count': post.like_count,
+            'is_liked': is_liked,
+            'like_count': like_count,
         }
 
     @staticmethod
     def toggle_bookmark(user, post: Post) -> dict:
-        interaction, _ = PostInteraction.objects.get_or_create(
-            user=user,
-            post=post,
-            defaults={'is_liked': False, 'is_bookmarked': False},
-        )
-        interaction.is_bookmarked = not interaction.is_bookmarked
-        interaction.save()
-        post.refresh_from_db()
+        is_bookmarked, bookmark_count = InteractionService._toggle(user, post, 'is_bookmarked')
         return {
-            'is_bookmarked': interaction.is_bookmarked,
-            'bookmark_count': post.bookmark_count,
+            'is_bookmarked': is_bookmarked,
+            'bookmark_count': bookmark_count,
         }
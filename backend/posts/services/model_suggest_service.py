@@ -1,64 +1,204 @@
-from django.db.models import Q, Case, When, Value, IntegerField, F
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
 
 from posts.models import AiModel
+from posts.services.reference_data import ReferenceData
 
+FIELD_NAMES = ('name', 'slug', 'platform_name', 'platform_slug')
 
-class ModelSuggestService:
-    @staticmethod
-    def suggest_models(query: str, platform_id=None, limit: int = 10):
-        normalized_query = (query or "").strip()
-        if not normalized_query:
-            return []
+# Same weights the previous Case/When annotation used: (prefix, contains).
+FIELD_WEIGHTS = {
+    'name': (300, 100),
+    'slug': (250, 80),
+    'platform_name': (200, 70),
+    'platform_slug': (180, 60),
+}
 
-        queryset = AiModel.objects.select_related('platform').filter(
-            is_active=True,
-            platform__is_active=True,
-        )
+# Typo matches always rank below substring matches (minimum 60 points).
+FUZZY_MAX_SCORE = 50
+FUZZY_MIN_SIMILARITY = 0.3
 
-        if platform_id is not None:
-            queryset = queryset.filter(platform_id=platform_id)
+WORD_SPLIT_PATTERN = re.compile(r"[\s\-_./]+")
 
-        queryset = queryset.filter(
-            Q(name__icontains=normalized_query)
-            | Q(slug__icontains=normalized_query)
-            | Q(platform__name__icontains=normalized_query)
-            | Q(platform__slug__icontains=normalized_query)
-        )
 
-        score = (
-            Case(When(name__istartswith=normalized_query, then=Value(300)), default=Value(0), output_field=IntegerField())
-            + Case(When(slug__istartswith=normalized_query, then=Value(250)), default=Value(0), output_field=IntegerField())
-            + Case(When(platform__name__istartswith=normalized_query, then=Value(200)), default=Value(0), output_field=IntegerField())
-            + Case(When(platform__slug__istartswith=normalized_query, then=Value(180)), default=Value(0), output_field=IntegerField())
-            + Case(When(name__icontains=normalized_query, then=Value(100)), default=Value(0), output_field=IntegerField())
-            + Case(When(slug__icontains=normalized_query, then=Value(80)), default=Value(0), output_field=IntegerField())
-            + Case(When(platform__name__icontains=normalized_query, then=Value(70)), default=Value(0), output_field=IntegerField())
-            + Case(When(platform__slug__icontains=normalized_query, then=Value(60)), default=Value(0), output_field=IntegerField())
-        )
+def _trigrams(value: str, padded: bool = True) -> set[str]:
+    text = f"  {value} " if padded else value
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
-        sort_key = Case(
-            When(sort_order=0, then=Value(999999)),
-            default=F('sort_order'),
-            output_field=IntegerField(),
+
+def _term_trigrams(fields: dict) -> tuple[frozenset, ...]:
+    terms = set()
+    for value in fields.values():
+        terms.add(value)
+        terms.update(word for word in WORD_SPLIT_PATTERN.split(value) if word)
+    return tuple(frozenset(_trigrams(term)) for term in sorted(terms))
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    id: int
+    name: str
+    slug: str
+    platform_id: int
+    platform_name: str
+    platform_slug: str
+    sort_key: int
+    fields: dict
+    term_trigrams: tuple
+
+    def as_payload(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'slug': self.slug,
+            'platform': {
+                'id': self.platform_id,
+                'name': self.platform_name,
+                'slug': self.platform_slug,
+            },
+        }
+
+
+class ModelSuggestIndex:
+    def __init__(self, entries: list[SuggestEntry]):
+        self.entries = entries
+        self.postings: dict[str, set[int]] = {}
+        for position, entry in enumerate(entries):
+            for trigrams in entry.term_trigrams:
+                for trigram in trigrams:
+                    self.postings.setdefault(trigram, set()).add(position)
+
+    @classmethod
+    def build(cls) -> 'ModelSuggestIndex':
+        rows = (
+            AiModel.objects.filter(is_active=True, platform__is_active=True)
+            .values_list('id', 'name', 'slug', 'sort_order', 'platform_id', 'platform__name', 'platform__slug')
         )
+        entries = []
+        for model_id, name, slug, sort_order, platform_id, platform_name, platform_slug in rows:
+            fields = {
+                'name': name.lower(),
+                'slug': slug.lower(),
+                'platform_name': platform_name.lower(),
+                'platform_slug': platform_slug.lower(),
+            }
+            entries.append(
+                SuggestEntry(
+                    id=model_id,
+                    name=name,
+                    slug=slug,
+                    platform_id=platform_id,
+                    platform_name=platform_name,
+                    platform_slug=platform_slug,
+                    sort_key=sort_order or 999999,
+                    fields=fields,
+                    term_trigrams=_term_trigrams(fields),
+                )
+            )
+        return cls(entries)
+
+    def _substring_candidates(self, query: str) -> set[int] | range:
+        if len(query) < 3:
+            return range(len(self.entries))
+        candidates = None
+        for trigram in _trigrams(query, padded=False):
+            postings = self.postings.get(trigram, set())
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+        return candidates
 
-        results = list(
-            queryset.annotate(
-                score=score,
-                sort_key=sort_key,
-            ).order_by('-score', 'sort_key', 'name')[:limit]
+    @staticmethod
+    def _substring_score(entry: SuggestEntry, query: str) -> int:
+        score = 0
+        for field in FIELD_NAMES:
+            value = entry.fields[field]
+            prefix_weight, contains_weight = FIELD_WEIGHTS[field]
+            if value.startswith(query):
+                score += prefix_weight
+            if query in value:
+                score += contains_weight
+        return score
+
+    def _fuzzy_scores(self, query: str, exclude: set[int]) -> dict[int, int]:
+        query_trigrams = _trigrams(query)
+        shared_counts = Counter()
+        for trigram in query_trigrams:
+            for position in self.postings.get(trigram, ()):
+                if position not in exclude:
+                    shared_counts[position] += 1
+
+        scores = {}
+        for position in shared_counts:
+            entry = self.entries[position]
+            best_similarity = 0.0
+            for trigrams in entry.term_trigrams:
+                shared = len(query_trigrams & trigrams)
+                similarity = shared / (len(query_trigrams) + len(trigrams) - shared)
+                best_similarity = max(best_similarity, similarity)
+            if best_similarity >= FUZZY_MIN_SIMILARITY:
+                scores[position] = max(1, int(best_similarity * FUZZY_MAX_SCORE))
+        return scores
+
+    def suggest(self, query: str, platform_id=None, limit: int = 10) -> list[dict]:
+        normalized_query = query.lower()
+        scored: dict[int, int] = {}
+        for position in self._substring_candidates(normalized_query):
+            entry = self.entries[position]
+            if platform_id is not None and entry.platform_id != platform_id:
+                continue
+            score = self._substring_score(entry, normalized_query)
+            if score:
+                scored[position] = score
+
+        if len(scored) < limit and len(normalized_query) >= 3:
+            for position, score in self._fuzzy_scores(normalized_query, exclude=set(scored)).items():
+                if platform_id is None or self.entries[position].platform_id == platform_id:
+                    scored[position] = score
+
+        ranked = sorted(
+            scored,
+            key=lambda position: (
+                -scored[position],
+                self.entries[position].sort_key,
+                self.entries[position].name,
+            ),
         )
+        return [self.entries[position].as_payload() for position in ranked[:limit]]
 
-        return [
-            {
-                'id': model.id,
-                'name': model.name,
-                'slug': model.slug,
-                'platform': {
-                    'id': model.platform.id,
-                    'name': model.platform.name,
-                    'slug': model.platform.slug,
-                },
-            }
-            for model in results
-        ]
+
+class ModelSuggestService:
+    _index: ModelSuggestIndex | None = None
+    _index_version = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_index(cls) -> ModelSuggestIndex:
+        # Rebuilt whenever the shared reference-data version moves, in any worker.
+        version = ReferenceData.version()
+        index = cls._index
+        if index is not None and cls._index_version == version:
+            return index
+
+        with cls._lock:
+            if cls._index is None or cls._index_version != version:
+                cls._index = ModelSuggestIndex.build()
+                cls._index_version = version
+            return cls._index
+
+    @classmethod
+    def invalidate_index(cls) -> None:
+        with cls._lock:
+            cls._index = None
+
+    @classmethod
+    def suggest_models(cls, query: str, platform_id=None, limit: int = 10):
+        normalized_query = (query or "").strip()
+        if not normalized_query:
+            return []
+
+        return cls.get_index().suggest(normalized_query, platform_id=platform_id, limit=limit)
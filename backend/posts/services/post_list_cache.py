@@ -0,0 +1,73 @@
+import hashlib
+import time
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.utils.conditional import etag_from_parts
+
+LIST_CACHE_VERSION_KEY = 'posts:list:version'
+LIST_CACHE_KEY_PREFIX = 'posts:list'
+
+
+def _normalized_params(query_params) -> str:
+    items = sorted(
+        (key, value)
+        for key in query_params
+        for value in query_params.getlist(key)
+        if value != ''
+    )
+    return urlencode(items)
+
+
+class PostListCache:
+    @staticmethod
+    def timeout() -> int:
+        return getattr(settings, 'POST_LIST_CACHE_SECONDS', 0)
+
+    @staticmethod
+    def version() -> int:
+        # Seeded from the clock so an evicted version key never revives old entries.
+        cache.add(LIST_CACHE_VERSION_KEY, int(time.time() * 1000), timeout=None)
+        return cache.get(LIST_CACHE_VERSION_KEY) or 0
+
+    @staticmethod
+    def invalidate() -> None:
+        try:
+            cache.incr(LIST_CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(LIST_CACHE_VERSION_KEY, int(time.time() * 1000), timeout=None)
+
+    @classmethod
+    def cache_key(cls, request, namespace: str) -> str:
+        raw_key = f'{request.get_host()}{request.path}?{_normalized_params(request.GET)}'
+        digest = hashlib.sha1(raw_key.encode()).hexdigest()
+        return f'{LIST_CACHE_KEY_PREFIX}:{namespace}:{cls.version()}:{digest}'
+
+    @classmethod
+    def etag(cls, request, namespace: str) -> str | None:
+        # Cached pages carry relative times, so the validator also rolls over once per cache period.
+        timeout = cls.timeout()
+        if timeout <= 0:
+            return None
+        return etag_from_parts(
+            cls.cache_key(request, namespace),
+            request.META.get('HTTP_AUTHORIZATION', ''),
+            int(time.time() // timeout),
+        )
+
+    @classmethod
+    def get_or_build(cls, request, namespace: str, builder: Callable[[], Any]) -> Any:
+        timeout = cls.timeout()
+        if timeout <= 0:
+            return builder()
+
+        key = cls.cache_key(request, namespace)
+        payload = cache.get(key)
+        if payload is None:
+            payload = builder()
+            cache.set(key, payload, timeout=timeout)
+        return payload
+
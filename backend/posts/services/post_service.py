@@ -2,28 +2,19 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
-from django.db import transaction
-from django.db.models import F, Exists, OuterRef, QuerySet
+from django.db.models import F
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
 from core.filters import PostFilter
+from core.pagination import CursorKey, KeysetPaginator
 from core.search import SearchManager
 from core.sorting import SortManager
-from posts.models import Post, PostInteraction
+from posts.models import Post
+from posts.services.interaction_overlay import attach_viewer_interaction_flags
+from posts.services.view_count_service import ViewCountBuffer
 
 
-def annotate_viewer_interaction_flags(queryset: QuerySet, user) -> QuerySet:
-    if user is None or not getattr(user, "is_authenticated", False):
-        return queryset
-
-    user_interactions = PostInteraction.objects.filter(user=user, post_id=OuterRef("pk"))
-    return queryset.annotate(
-        viewer_is_liked=Exists(user_interactions.filter(is_liked=True)),
-        viewer_is_bookmarked=Exists(user_interactions.filter(is_bookmarked=True)),
-    )
-
-
-def build_posts_page(request) -> Tuple:
+def build_posts_page(request, with_viewer_flags: bool = True) -> Tuple:
     page = request.GET.get("page", 1)
     page_size = request.GET.get("page_size", 10)
     search = request.GET.get("search", "")
@@ -45,31 +36,40 @@ def build_posts_page(request) -> Tuple:
     if filterset.is_valid():
         queryset = filterset.qs
 
+    if search:
+        queryset = SearchManager.search_posts(queryset, search, search_type)
+
     if sort_by in ("rating", "satisfaction"):
         sort_by = "satisfaction"
     queryset = SortManager.sort_posts(queryset, sort_by)
 
-    if search:
-        queryset = SearchManager.search_posts(queryset, search, search_type)
-
     if str(exclude_id).isdigit():
         queryset = queryset.exclude(id=int(exclude_id))
 
-    user = getattr(request, "user", None)
-    queryset = annotate_viewer_interaction_flags(queryset, user)
+    cursor = request.GET.get("cursor")
+    if cursor is not None:
+        sort_name, cursor_keys = SortManager.get_cursor_keys(queryset, sort_by)
+        posts_page, paginator = _build_keyset_page(queryset, cursor, cursor_keys, page_size, sort_name)
+    else:
+        paginator = Paginator(queryset, page_size)
+        try:
+            posts_page = paginator.page(page)
+        except PageNotAnInteger:
+            posts_page = paginator.page(1)
+        except EmptyPage:
+            posts_page = paginator.page(paginator.num_pages)
+
+    if with_viewer_flags:
+        attach_viewer_interaction_flags(posts_page, getattr(request, "user", None))
+    return posts_page, paginator
 
-    paginator = Paginator(queryset, page_size)
-    try:
-        posts_page = paginator.page(page)
-    except PageNotAnInteger:
-        posts_page = paginator.page(1)
-    except EmptyPage:
-        posts_page = paginator.page(paginator.num_pages)
 
-    return posts_page, paginator
+def _build_keyset_page(queryset, cursor: str, cursor_keys, page_size: int, sort_name: str) -> Tuple:
+    paginator = KeysetPaginator(queryset, cursor_keys, max(page_size, 1), sort_name=sort_name)
+    return paginator.page(cursor), paginator
 
 
-def get_post_and_increment_views(post_id: int) -> Optional[Post]:
+def get_post_and_increment_views(post_id: int, viewer_key: Optional[str] = None) -> Optional[Post]:
     try:
         post = (
             Post.objects.select_related("author", "platform", "model", "category").get(id=post_id)
@@ -77,10 +77,8 @@ def get_post_and_increment_views(post_id: int) -> Optional[Post]:
     except Post.DoesNotExist:
         return None
 
-    with transaction.atomic():
-        Post.objects.filter(id=post_id).update(view_count=F("view_count") + 1)
-        post.refresh_from_db()
-
+    ViewCountBuffer.record_view(post_id, viewer_key)
+    post.view_count += ViewCountBuffer.pending_delta(post_id)
     return post
 
 
@@ -107,6 +105,9 @@ def build_user_posts_page(
 
     queryset = base_queryset
 
+    if search:
+        queryset = SearchManager.search_posts(queryset, search, search_type)
+
     if sort_by == "latest":
         queryset = queryset.order_by(order_field_latest)
     elif sort_by == "oldest":
@@ -114,18 +115,27 @@ def build_user_posts_page(
     else:
         queryset = SortManager.sort_posts(queryset, sort_by)
 
-    if search:
-        queryset = SearchManager.search_posts(queryset, search, search_type)
-
-    user = getattr(request, "user", None)
-    queryset = annotate_viewer_interaction_flags(queryset, user)
-
-    paginator = Paginator(queryset, page_size)
-    try:
-        posts_page = paginator.page(page)
-    except PageNotAnInteger:
-        posts_page = paginator.page(1)
-    except EmptyPage:
-        posts_page = paginator.page(paginator.num_pages)
-
+    cursor = request.GET.get("cursor")
+    if cursor is not None:
+        if sort_by in ("latest", "oldest"):
+            latest_descending = order_field_latest.startswith("-")
+            descending = latest_descending if sort_by == "latest" else not latest_descending
+            sort_name = sort_by
+            cursor_keys = (
+                CursorKey(F(order_field_latest.lstrip("-")), descending=descending, kind="datetime"),
+                CursorKey(F("id"), descending=descending),
+            )
+        else:
+            sort_name, cursor_keys = SortManager.get_cursor_keys(queryset, sort_by)
+        posts_page, paginator = _build_keyset_page(queryset, cursor, cursor_keys, page_size, sort_name)
+    else:
+        paginator = Paginator(queryset, page_size)
+        try:
+            posts_page = paginator.page(page)
+        except PageNotAnInteger:
+            posts_page = paginator.page(1)
+        except EmptyPage:
+            posts_page = paginator.page(paginator.num_pages)
+
+    attach_viewer_interaction_flags(posts_page, getattr(request, "user", None))
     return posts_page, paginator
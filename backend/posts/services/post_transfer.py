@@ -0,0 +1,261 @@
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.renderers import dumps
+from posts.models import AiModel, Category, Platform, Post, PostTag, Tag
+from posts.services.post_list_cache import PostListCache
+from posts.services.tag_service import parse_tag_names
+
+User = get_user_model()
+
+TRANSFER_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+EXPORT_VALUES = (
+    'id', 'title', 'author__email', 'author__username',
+    'platform__name', 'model__name', 'model_etc', 'model_detail', 'category__name', 'category_etc',
+    'tags', 'prompt', 'ai_response', 'additional_opinion', 'satisfaction',
+    'view_count', 'like_count', 'bookmark_count', 'created_at', 'updated_at',
+)
+COUNTER_FIELDS = ('view_count', 'like_count', 'bookmark_count')
+
+
+def _export_record(row: dict) -> dict:
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'author': row['author__email'],
+        'author_username': row['author__username'],
+        'platform': row['platform__name'],
+        'model': row['model__name'],
+        'model_etc': row['model_etc'],
+        'model_detail': row['model_detail'],
+        'category': row['category__name'],
+        'category_etc': row['category_etc'],
+        'tags': parse_tag_names(row['tags']),
+        'prompt': row['prompt'],
+        'ai_response': row['ai_response'],
+        'additional_opinion': row['additional_opinion'],
+        'satisfaction': None if row['satisfaction'] is None else str(row['satisfaction']),
+        'view_count': row['view_count'],
+        'like_count': row['like_count'],
+        'bookmark_count': row['bookmark_count'],
+        'created_at': row['created_at'].isoformat(),
+        'updated_at': row['updated_at'].isoformat(),
+    }
+
+
+def export_posts(stream, chunk_size: int = TRANSFER_BATCH_SIZE, after_id: int | None = None) -> tuple[int, int | None]:
+    # Writes one JSON object per line in id order; after_id resumes an interrupted export.
+    queryset = Post.objects.order_by('id').values(*EXPORT_VALUES)
+    if after_id is not None:
+        queryset = queryset.filter(id__gt=after_id)
+
+    exported = 0
+    last_id = after_id
+    for row in queryset.iterator(chunk_size=chunk_size):
+        stream.write(dumps(_export_record(row)).decode() + '\n')
+        exported += 1
+        last_id = row['id']
+    return exported, last_id
+
+
+def _parse_datetime(value) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    duplicates: int = 0
+    errors: list = field(default_factory=list)
+    error_count: int = 0
+    author_ids: set = field(default_factory=set)
+
+    def add_error(self, line_number: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f'{line_number}행: {message}')
+
+
+class PostImporter:
+    # Reference rows are resolved through in-memory caches; each batch is one transaction.
+    def __init__(self, create_missing_refs: bool = False, default_author_id: int | None = None):
+        self.create_missing_refs = create_missing_refs
+        self.default_author_id = default_author_id
+        self.platforms = {platform.name: platform for platform in Platform.objects.all()}
+        self.categories = {category.name: category for category in Category.objects.all()}
+        self.models = {(model.platform_id, model.name): model for model in AiModel.objects.all()}
+        self.author_ids = {}
+        self.tag_ids = {}
+
+    def _platform(self, name):
+        if name not in self.platforms and name and self.create_missing_refs:
+            self.platforms[name], _ = Platform.objects.get_or_create(name=name)
+        return self.platforms.get(name)
+
+    def _category(self, name):
+        if name not in self.categories and name and self.create_missing_refs:
+            self.categories[name], _ = Category.objects.get_or_create(name=name)
+        return self.categories.get(name)
+
+    def _model(self, platform, name):
+        if not name:
+            return None
+        key = (platform.id, name)
+        if key not in self.models and self.create_missing_refs:
+            self.models[key], _ = AiModel.objects.get_or_create(platform=platform, name=name)
+        return self.models.get(key)
+
+    def _load_authors(self, records) -> None:
+        emails = {record.get('author') for _, record in records} - set(self.author_ids) - {None}
+        if emails:
+            found = dict(User.objects.filter(email__in=emails).values_list('email', 'id'))
+            self.author_ids.update({email: found.get(email) for email in emails})
+
+    def _build_post(self, record: dict) -> Post:
+        author_id = self.author_ids.get(record.get('author')) or self.default_author_id
+        if author_id is None:
+            raise ValueError(f"작성자를 찾을 수 없습니다: {record.get('author')}")
+        platform = self._platform(record.get('platform'))
+        if platform is None:
+            raise ValueError(f"플랫폼을 찾을 수 없습니다: {record.get('platform')}")
+        category = self._category(record.get('category'))
+        if category is None:
+            raise ValueError(f"카테고리를 찾을 수 없습니다: {record.get('category')}")
+        model = self._model(platform, record.get('model'))
+        if record.get('model') and model is None:
+            raise ValueError(f"모델을 찾을 수 없습니다: {record['platform']} - {record['model']}")
+
+        satisfaction = record.get('satisfaction')
+        post = Post(
+            title=record['title'],
+            author_id=author_id,
+            platform=platform,
+            model=model,
+            model_etc=record.get('model_etc') or '',
+            model_detail=record.get('model_detail') or '',
+            category=category,
+            category_etc=record.get('category_etc') or '',
+            tags=', '.join(parse_tag_names(record.get('tags'))),
+            prompt=record['prompt'],
+            ai_response=record['ai_response'],
+            additional_opinion=record.get('additional_opinion') or '',
+            satisfaction=None if satisfaction is None else Decimal(str(satisfaction)),
+            **{counter: int(record.get(counter) or 0) for counter in COUNTER_FIELDS},
+        )
+        # created_at is required: together with author and title it is the key that makes reruns idempotent.
+        if not record.get('created_at'):
+            raise ValueError('created_at 값이 없습니다.')
+        post.created_at = _parse_datetime(record['created_at'])
+        post.updated_at = _parse_datetime(record['updated_at']) if record.get('updated_at') else post.created_at
+        # Related objects come from the caches, so this validates without existence queries.
+        post.full_clean(exclude=['author', 'platform', 'model', 'category'], validate_unique=False)
+        post.refresh_scores()
+        return post
+
+    def _existing_keys(self, posts: list[Post]) -> set:
+        rows = Post.objects.filter(
+            author_id__in={post.author_id for post in posts},
+            created_at__in={post.created_at for post in posts},
+        ).values_list('author_id', 'title', 'created_at')
+        return set(rows)
+
+    def _link_tags(self, posts: list[Post]) -> None:
+        names = {name for post in posts for name in parse_tag_names(post.tags)}
+        missing = names - set(self.tag_ids)
+        if missing:
+            Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+            self.tag_ids.update(Tag.objects.filter(name__in=missing).values_list('name', 'id'))
+
+        links = [
+            PostTag(post_id=post.id, tag_id=self.tag_ids[name])
+            for post in posts
+            for name in parse_tag_names(post.tags)
+        ]
+        PostTag.objects.bulk_create(links, ignore_conflicts=True)
+
+        # Count the links that are actually stored, not the ones submitted, so skipped conflicts add nothing.
+        linked_tag_ids = PostTag.objects.filter(post_id__in=[post.id for post in posts]).values_list('tag_id', flat=True)
+        tag_ids_by_increment = {}
+        for tag_id, count in Counter(linked_tag_ids).items():
+            tag_ids_by_increment.setdefault(count, []).append(tag_id)
+        for count, tag_ids in tag_ids_by_increment.items():
+            Tag.objects.filter(id__in=tag_ids).update(post_count=F('post_count') + count)
+
+    def import_batch(self, records: list[tuple[int, dict]], result: ImportResult) -> None:
+        self._load_authors(records)
+        posts = []
+        for line_number, record in records:
+            try:
+                posts.append(self._build_post(record))
+            except (KeyError, TypeError, ValueError, ArithmeticError) as error:
+                result.add_error(line_number, f'필수 항목 누락 또는 형식 오류 ({error})')
+            except ValidationError as error:
+                result.add_error(line_number, '; '.join(f'{key}: {", ".join(messages)}' for key, messages in error.message_dict.items()))
+
+        # Re-running an import (or resuming after a crash) must not duplicate posts.
+        seen = self._existing_keys(posts) if posts else set()
+        new_posts = []
+        for post in posts:
+            key = (post.author_id, post.title, post.created_at)
+            if key in seen:
+                result.duplicates += 1
+                continue
+            seen.add(key)
+            new_posts.append(post)
+        if not new_posts:
+            return
+
+        with transaction.atomic():
+            timestamps = [(post.created_at, post.updated_at) for post in new_posts]
+            Post.objects.bulk_create(new_posts)
+            # auto_now_add/auto_now overwrite the timestamps on insert; put the exported ones back.
+            for post, (created_at, updated_at) in zip(new_posts, timestamps):
+                post.created_at, post.updated_at = created_at, updated_at
+            Post.objects.bulk_update(new_posts, ['created_at', 'updated_at'])
+            self._link_tags(new_posts)
+
+        result.imported += len(new_posts)
+        result.author_ids.update(post.author_id for post in new_posts)
+
+    def import_lines(self, lines, batch_size: int = TRANSFER_BATCH_SIZE, start_line: int = 0, on_batch=None) -> ImportResult:
+        # on_batch(line_number) is called after each committed batch so callers can checkpoint.
+        result = ImportResult()
+        batch = []
+        line_number = start_line
+        for line_number, line in enumerate(lines, start=1):
+            if line_number <= start_line or not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                result.add_error(line_number, f'JSON 파싱 오류 ({error.msg})')
+                continue
+            if not isinstance(record, dict):
+                result.add_error(line_number, 'JSON 객체가 아닙니다.')
+                continue
+            batch.append((line_number, record))
+            if len(batch) >= batch_size:
+                self.import_batch(batch, result)
+                batch = []
+                if on_batch:
+                    on_batch(line_number)
+
+        if batch:
+            self.import_batch(batch, result)
+        if on_batch and line_number > start_line:
+            on_batch(line_number)
+        if result.imported:
+            PostListCache.invalidate()
+        return result
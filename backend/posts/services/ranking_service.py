@@ -0,0 +1,27 @@
+from django.utils import timezone
+
+from posts.models import Post
+from posts.services.post_list_cache import PostListCache
+from posts.utils import compute_hot_score
+
+REFRESH_BATCH_SIZE = 1000
+
+
+class RankingService:
+    @staticmethod
+    def refresh_hot_scores(batch_size: int = REFRESH_BATCH_SIZE) -> int:
+        now = timezone.now()
+        updated = 0
+        batch = []
+        rows = Post.objects.only('id', 'popularity_score', 'created_at').order_by('id')
+        for post in rows.iterator(chunk_size=batch_size):
+            post.hot_score = compute_hot_score(post.popularity_score, post.created_at, now=now)
+            batch.append(post)
+            if len(batch) >= batch_size:
+                updated += Post.objects.bulk_update(batch, ['hot_score'])
+                batch = []
+        if batch:
+            updated += Post.objects.bulk_update(batch, ['hot_score'])
+
+        PostListCache.invalidate()
+        return updated
@@ -0,0 +1,143 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db.models import Case, F, IntegerField, Value, When
+
+from posts.models import AiModel, Category, Platform
+from posts.serializers import AiModelSerializer, CategorySerializer, PlatformSerializer
+
+REFERENCE_VERSION_KEY = 'posts:reference:version'
+OTHER_NAME = '기타'
+
+
+def _default_model_payload(model: dict | None) -> dict | None:
+    if not model:
+        return None
+    return {
+        'id': model['id'],
+        'name': model['name'],
+        'platform': model['platform'],
+        'platform_name': model['platformName'],
+    }
+
+
+def _split_other_ids(ids, names: dict) -> tuple[list[int], list[int]]:
+    known_ids = [item_id for item_id in ids if item_id in names]
+    return (
+        [item_id for item_id in known_ids if names[item_id] != OTHER_NAME],
+        [item_id for item_id in known_ids if names[item_id] == OTHER_NAME],
+    )
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    version: int
+    platforms: list
+    active_platform_names: dict
+    models: list
+    categories: list
+    category_names: dict
+    model_names: dict
+    filter_options: dict
+
+    @classmethod
+    def build(cls, version: int) -> 'ReferenceSnapshot':
+        platforms = list(Platform.objects.order_by('name'))
+        categories = list(Category.objects.order_by('name'))
+        all_models = list(AiModel.objects.select_related('platform').order_by('platform__id', 'id'))
+        active_models = (
+            AiModel.objects.filter(is_active=True, is_deprecated=False, platform__is_active=True)
+            .select_related('platform')
+            .annotate(
+                sort_key=Case(
+                    When(sort_order=0, then=Value(999999)),
+                    default=F('sort_order'),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by('sort_key', 'platform__name', 'name')
+        )
+        active_platforms = [platform for platform in platforms if platform.is_active]
+
+        models_by_platform = {}
+        for model in all_models:
+            models_by_platform.setdefault(model.platform.name, []).append({
+                'id': model.id,
+                'name': model.name,
+                'platform_id': model.platform.id,
+                'platform_name': model.platform.name,
+            })
+
+        return cls(
+            version=version,
+            platforms=PlatformSerializer(active_platforms, many=True).data,
+            active_platform_names={platform.id: platform.name for platform in active_platforms},
+            models=AiModelSerializer(active_models, many=True).data,
+            categories=CategorySerializer(categories, many=True).data,
+            category_names={category.id: category.name for category in categories},
+            model_names={model.id: model.name for model in all_models},
+            filter_options={
+                'platforms': [
+                    {'id': platform.id, 'name': platform.name}
+                    for platform in sorted(platforms, key=lambda platform: platform.id)
+                ],
+                'categories': [
+                    {'id': category.id, 'name': category.name}
+                    for category in sorted(categories, key=lambda category: category.id)
+                ],
+                'models_by_platform': models_by_platform,
+            },
+        )
+
+    def models_for(self, platform_id=None) -> list:
+        if platform_id is None:
+            return self.models
+        return [model for model in self.models if model['platform'] == platform_id]
+
+    def default_model(self, platform_id=None) -> dict | None:
+        models = self.models_for(platform_id)
+        return _default_model_payload(models[0] if models else None)
+
+    def split_category_ids(self, ids) -> tuple[list[int], list[int]]:
+        return _split_other_ids(ids, self.category_names)
+
+    def split_model_ids(self, ids) -> tuple[list[int], list[int]]:
+        return _split_other_ids(ids, self.model_names)
+
+
+class ReferenceData:
+    _snapshot: ReferenceSnapshot | None = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def version() -> int:
+        # Seeded from the clock so an evicted version key never matches an old snapshot.
+        cache.add(REFERENCE_VERSION_KEY, int(time.time() * 1000), timeout=None)
+        return cache.get(REFERENCE_VERSION_KEY) or 0
+
+    @classmethod
+    def snapshot(cls) -> ReferenceSnapshot:
+        version = cls.version()
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with cls._lock:
+            if cls._snapshot is None or cls._snapshot.version != version:
+                cls._snapshot = ReferenceSnapshot.build(version)
+            return cls._snapshot
+
+    @classmethod
+    def etag(cls, request=None, *args, **kwargs) -> str:
+        return f'"reference-{cls.version()}"'
+
+    @classmethod
+    def invalidate(cls) -> None:
+        try:
+            cache.incr(REFERENCE_VERSION_KEY)
+        except ValueError:
+            cache.set(REFERENCE_VERSION_KEY, int(time.time() * 1000), timeout=None)
+        with cls._lock:
+            cls._snapshot = None
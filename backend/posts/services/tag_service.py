@@ -0,0 +1,60 @@
+from django.db import transaction
+from django.db.models import F
+
+from posts.events import post_tags_changed
+from posts.models import Post, PostTag, Tag
+
+TAG_NAME_MAX_LENGTH = 50
+
+
+def parse_tag_names(raw_tags) -> list[str]:
+    if isinstance(raw_tags, str):
+        raw_tags = raw_tags.split(',')
+    names = []
+    for raw_name in raw_tags or []:
+        name = str(raw_name).strip()[:TAG_NAME_MAX_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class TagService:
+    @staticmethod
+    def popular_tags(limit=None) -> list[dict]:
+        queryset = Tag.objects.filter(post_count__gt=0).order_by('-post_count', 'name').values('name', 'post_count')
+        if limit is not None:
+            queryset = queryset[:limit]
+        return [{'name': row['name'], 'count': row['post_count']} for row in queryset]
+
+    @staticmethod
+    @transaction.atomic
+    def sync_post_tags(post: Post) -> None:
+        names = parse_tag_names(post.tags)
+        # Lock the post so concurrent syncs see each other's links and adjust post_count once.
+        list(Post.objects.select_for_update().filter(pk=post.pk).values_list('pk', flat=True))
+        current_tag_ids = dict(PostTag.objects.filter(post=post).values_list('tag__name', 'tag_id'))
+
+        removed_tag_ids = [tag_id for name, tag_id in current_tag_ids.items() if name not in names]
+        if removed_tag_ids:
+            PostTag.objects.filter(post=post, tag_id__in=removed_tag_ids).delete()
+            Tag.objects.filter(id__in=removed_tag_ids, post_count__gt=0).update(post_count=F('post_count') - 1)
+
+        added_names = [name for name in names if name not in current_tag_ids]
+        if added_names:
+            Tag.objects.bulk_create([Tag(name=name) for name in added_names], ignore_conflicts=True)
+            added_tag_ids = list(Tag.objects.filter(name__in=added_names).values_list('id', flat=True))
+            PostTag.objects.bulk_create(
+                [PostTag(post=post, tag_id=tag_id) for tag_id in added_tag_ids],
+                ignore_conflicts=True,
+            )
+            Tag.objects.filter(id__in=added_tag_ids).update(post_count=F('post_count') + 1)
+
+        if removed_tag_ids or added_names:
+            post_tags_changed.send(sender=Post, post=post)
+
+    @staticmethod
+    def release_post_tags(post: Post) -> None:
+        tag_ids = list(PostTag.objects.filter(post=post).values_list('tag_id', flat=True))
+        if tag_ids:
+            Tag.objects.filter(id__in=tag_ids, post_count__gt=0).update(post_count=F('post_count') - 1)
+            post_tags_changed.send(sender=Post, post=post)
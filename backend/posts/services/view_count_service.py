@@ -0,0 +1,141 @@
+import atexit
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Value, When
+
+from core.utils.cache import DirtyQueue, incr_counter
+from posts.events import post_views_flushed
+from posts.models import Post
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY_PREFIX = 'posts:views:pending'
+FLUSH_LOCK_KEY = 'posts:views:flush_lock'
+SEEN_KEY_PREFIX = 'posts:views:seen'
+
+FLUSH_BATCH_SIZE = 500
+FLUSH_LOCK_TIMEOUT_SECONDS = 60
+
+
+def _pending_key(post_id: int) -> str:
+    return f'{PENDING_KEY_PREFIX}:{post_id}'
+
+
+def viewer_key_for_request(request) -> str:
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+
+    session_key = request.headers.get('X-Session-Key')
+    if session_key:
+        return f'session:{session_key}'
+
+    forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    client_ip = forwarded_for.split(',')[0].strip() if forwarded_for else request.META.get('REMOTE_ADDR', '')
+    user_agent = request.META.get('HTTP_USER_AGENT', '')
+    return 'anon:' + hashlib.sha1(f'{client_ip}|{user_agent}'.encode()).hexdigest()
+
+
+class ViewCountBuffer:
+    dirty = DirtyQueue('posts:views')
+    _flusher_thread = None
+    _flusher_lock = threading.Lock()
+
+    @classmethod
+    def record_view(cls, post_id: int, viewer_key: str | None = None) -> bool:
+        dedupe_seconds = getattr(settings, 'POST_VIEW_DEDUPE_SECONDS', 0)
+        if viewer_key and dedupe_seconds > 0:
+            if not cache.add(f'{SEEN_KEY_PREFIX}:{post_id}:{viewer_key}', 1, timeout=dedupe_seconds):
+                return False
+
+        if incr_counter(_pending_key(post_id)) == 1:
+            cls.dirty.mark(post_id)
+        cls._ensure_flusher()
+        return True
+
+    @staticmethod
+    def pending_delta(post_id: int) -> int:
+        return cache.get(_pending_key(post_id)) or 0
+
+    @classmethod
+    def flush(cls) -> int:
+        if not cache.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_LOCK_TIMEOUT_SECONDS):
+            return 0
+
+        try:
+            post_ids = cls.dirty.take()
+            flushed = 0
+            for start in range(0, len(post_ids), FLUSH_BATCH_SIZE):
+                batch = post_ids[start:start + FLUSH_BATCH_SIZE]
+                written = False
+                try:
+                    pending = cache.get_many([_pending_key(post_id) for post_id in batch])
+                    deltas = {
+                        post_id: pending[_pending_key(post_id)]
+                        for post_id in batch
+                        if (pending.get(_pending_key(post_id)) or 0) > 0
+                    }
+                    if deltas:
+                        Post.objects.filter(id__in=deltas).update(
+                            view_count=F('view_count') + Case(
+                                *[When(id=post_id, then=Value(delta)) for post_id, delta in deltas.items()],
+                                default=Value(0),
+                                output_field=IntegerField(),
+                            )
+                        )
+                    written = True
+                    # Only written views are subtracted; decr (not delete) keeps views recorded since the read.
+                    for post_id, delta in deltas.items():
+                        try:
+                            remaining = cache.decr(_pending_key(post_id), delta)
+                        except ValueError:
+                            remaining = 0
+                        if remaining > 0:
+                            cls.dirty.mark(post_id)
+                except Exception:
+                    # Re-queue every post whose pending views were not written so the next flush retries them.
+                    for post_id in post_ids[start + (len(batch) if written else 0):]:
+                        cls.dirty.mark(post_id)
+                    raise
+                if deltas:
+                    post_views_flushed.send(sender=Post, deltas=deltas)
+                flushed += sum(deltas.values())
+            return flushed
+        finally:
+            cache.delete(FLUSH_LOCK_KEY)
+
+    @classmethod
+    def _ensure_flusher(cls) -> None:
+        interval = getattr(settings, 'POST_VIEW_FLUSH_INTERVAL_SECONDS', 0)
+        if interval <= 0 or cls._flusher_thread is not None:
+            return
+
+        with cls._flusher_lock:
+            if cls._flusher_thread is not None:
+                return
+            cls._flusher_thread = threading.Thread(
+                target=cls._run_flusher, args=(interval,), name='post-view-flusher', daemon=True
+            )
+            cls._flusher_thread.start()
+            atexit.register(cls._flush_quietly)
+
+    @classmethod
+    def _run_flusher(cls, interval: int) -> None:
+        while True:
+            time.sleep(interval)
+            cls._flush_quietly()
+
+    @classmethod
+    def _flush_quietly(cls) -> None:
+        try:
+            cls.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered post views")
+        finally:
+            connection.close()
@@ -0,0 +1,35 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from posts.models import AiModel, Category, Platform, Post, PostInteraction
+from posts.services.model_suggest_service import ModelSuggestService
+from posts.services.post_list_cache import PostListCache
+from posts.services.reference_data import ReferenceData
+from posts.services.tag_service import TagService
+
+
+@receiver(post_save, sender=AiModel)
+@receiver(post_delete, sender=AiModel)
+@receiver(post_save, sender=Platform)
+@receiver(post_delete, sender=Platform)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_reference_data(sender, **kwargs):
+    # Bump now for this process and again after commit so other workers never keep pre-commit data.
+    ReferenceData.invalidate()
+    ModelSuggestService.invalidate_index()
+    transaction.on_commit(ReferenceData.invalidate)
+
+
+@receiver(pre_delete, sender=Post)
+def release_deleted_post_tags(sender, instance, **kwargs):
+    TagService.release_post_tags(instance)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=PostInteraction)
+@receiver(post_delete, sender=PostInteraction)
+def invalidate_post_list_cache(sender, **kwargs):
+    transaction.on_commit(PostListCache.invalidate)
@@ -1,11 +1,29 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.urls import reverse
-from django.db import connection
+from django.utils import timezone
+from django.db import OperationalError, close_old_connections, connection
+from django.test import TransactionTestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.authtoken.models import Token
 from posts.models import Platform, AiModel, Category, Post, PostInteraction
+from posts.serializers import POST_CARD_VALUES, FastPostCardSerializer, PostCardSerializer
+from posts.services import InteractionService, ViewCountBuffer
+from posts.services.post_transfer import PostImporter
+from posts.utils import compute_hot_score
 
 
 User = get_user_model()
@@ -13,6 +31,7 @@ User = get_user_model()
 
 class PostsApiTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.author = User.objects.create_user(email='author@example.com', password='Test1234!')
         self.liker = User.objects.create_user(email='liker@example.com', password='Test1234!')
         self.author_token, _ = Token.objects.get_or_create(user=self.author)
@@ -64,6 +83,31 @@ class PostsApiTests(APITestCase):
         data = res.json()
         self.assertEqual(data['data']['title'], '수정된 제목')
 
+    def test_model_rules_checked_at_entry_not_on_every_save(self):
+        other_platform = Platform.objects.create(name='기타')
+        self.auth(self.author_token)
+        payload = {**self._build_create_payload(), 'platform': other_platform.id, 'model_etc': '사내 모델'}
+        res = self.client.post(self.create_url, payload, format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('model', res.json()['errors'])
+
+        post = Post.objects.get(pk=self._create_post_via_api())
+        update_url = reverse('posts:post_update', kwargs={'post_id': post.id})
+        res = self.client.patch(update_url, {'model': None, 'model_detail': 'gpt-4o'}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        post = Post.objects.get(pk=post.pk)
+        post.like_count = 3
+        with CaptureQueriesContext(connection) as captured:
+            post.save(update_fields=['like_count'])
+        related_tables = ('posts_platform', 'posts_aimodel', 'posts_category')
+        self.assertFalse([q['sql'] for q in captured if any(table in q['sql'] for table in related_tables)])
+        self.assertEqual(Post.objects.get(pk=post.pk).popularity_score, 3)
+
+        post.satisfaction = Decimal('4.3')
+        with self.assertRaises(ValidationError):
+            post.validated_save()
+
     def test_post_detail_increments_views(self):
         post_id = self._create_post_via_api()
         detail_url = reverse('posts:post_detail', kwargs={'post_id': post_id})
@@ -88,6 +132,21 @@ class PostsApiTests(APITestCase):
         data = res.json()
         self.assertTrue(data['data']['is_bookmarked'])
 
+    def test_post_detail_views_are_buffered_deduped_and_flushed(self):
+        post_id = self._create_post_via_api()
+        detail_url = reverse('posts:post_detail', kwargs={'post_id': post_id})
+
+        self.assertEqual(self.client.get(detail_url).json()['data']['views'], 1)
+        self.assertEqual(self.client.get(detail_url).json()['data']['views'], 1)
+        self.client.credentials()
+        self.assertEqual(self.client.get(detail_url).json()['data']['views'], 2)
+        self.assertEqual(Post.objects.get(id=post_id).view_count, 0)
+
+        call_command('flush_post_views', stdout=StringIO())
+        self.assertEqual(Post.objects.get(id=post_id).view_count, 2)
+        self.assertEqual(ViewCountBuffer.pending_delta(post_id), 0)
+        self.assertEqual(self.client.get(detail_url).json()['data']['views'], 2)
+
     def _seed_liker_interaction(self, post_id: int):
         PostInteraction.objects.create(
             user=self.liker,
@@ -149,6 +208,7 @@ class PostsApiTests(APITestCase):
             self.assertEqual(res.status_code, status.HTTP_200_OK)
         return len(captured)
 
+    @override_settings(POST_LIST_CACHE_SECONDS=0)
     def test_posts_list_query_count_does_not_scale_with_result_size(self):
         first_post = self._create_post('1')
         PostInteraction.objects.create(user=self.liker, post=first_post, is_liked=True, is_bookmarked=True)
@@ -180,6 +240,72 @@ class PostsApiTests(APITestCase):
         self.assertIn('isLiked', first_item)
         self.assertIn('isBookmarked', first_item)
 
+    @override_settings(POST_LIST_CACHE_SECONDS=0)
+    def test_viewer_flags_come_from_one_query_after_slicing(self):
+        for idx in range(1, 5):
+            post = self._create_post(str(idx))
+            PostInteraction.objects.create(user=self.liker, post=post, is_liked=True, is_bookmarked=idx % 2 == 0)
+
+        self.auth(self.liker_token)
+        for url in (self.list_url, reverse('core:search_posts'), reverse('posts:user_liked_posts')):
+            with CaptureQueriesContext(connection) as captured:
+                res = self.client.get(url, {'page_size': 3})
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            sqls = [query['sql'] for query in captured.captured_queries]
+            self.assertFalse(any('EXISTS' in sql for sql in sqls), msg=url)
+            interaction_lookups = [sql for sql in sqls if sql.startswith('SELECT "posts_postinteraction"."post_id"')]
+            self.assertEqual(len(interaction_lookups), 1, msg=url)
+
+            payload = res.json()
+            results = payload['data']['results'] if 'data' in payload else payload['results']
+            self.assertTrue(all(item['isLiked'] for item in results), msg=url)
+
+    def test_posts_list_serves_cached_page_with_viewer_flags_overlaid(self):
+        liked_post = self._create_post('1')
+        self._create_post('2')
+        PostInteraction.objects.create(user=self.liker, post=liked_post, is_liked=True)
+        params = {'sort_by': 'latest', 'page_size': 5}
+
+        anonymous_results = self.client.get(self.list_url, params).json()['data']['results']
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(self.list_url, {'page_size': 5, 'sort_by': 'latest', 'search': ''})
+        self.assertEqual(len(captured), 0)
+        self.assertEqual(res.json()['data']['results'], anonymous_results)
+
+        self.auth(self.liker_token)
+        res = self.client.get(self.list_url, params)
+        flags = {item['id']: (item['isLiked'], item['isBookmarked']) for item in res.json()['data']['results']}
+        self.assertEqual(flags[liked_post.id], (True, False))
+        self.assertFalse(any(item['isLiked'] for item in anonymous_results))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_post = self._create_post('3')
+        self.client.credentials()
+        res = self.client.get(self.list_url, params)
+        self.assertEqual(res.json()['data']['results'][0]['id'], new_post.id)
+
+    def test_fast_card_serializer_matches_post_card_serializer(self):
+        other_model = AiModel.objects.create(platform=self.platform, name='기타')
+        other_category = Category.objects.create(name='기타')
+        self._create_post('1')
+        Post.objects.create(
+            title='기타 모델 게시글', author=self.liker, platform=self.platform, model=other_model,
+            model_etc='사내 모델', category=other_category, category_etc='사내 업무', tags='',
+            prompt='충분히 긴 테스트 프롬프트 내용입니다.', ai_response='충분히 긴 테스트 AI 응답 내용입니다.',
+        )
+        request = self.client.get(self.list_url).wsgi_request
+        context = {'request': request}
+
+        queryset = Post.objects.order_by('id')
+        posts = list(queryset.select_related('author', 'platform', 'model', 'category'))
+        expected = PostCardSerializer(posts, many=True, context=context).data
+        self.assertEqual(FastPostCardSerializer(context).serialize(posts), expected)
+        self.assertEqual(FastPostCardSerializer(context).serialize(queryset.values(*POST_CARD_VALUES)), expected)
+
+        out = StringIO()
+        call_command('benchmark_card_serializer', '--iterations', '2', stdout=out)
+        self.assertIn('동일합니다', out.getvalue())
+
     def test_models_list_orders_with_db_sort_key(self):
         secondary_platform = Platform.objects.create(name='Anthropic')
         AiModel.objects.create(platform=self.platform, name='Gamma', sort_order=2)
@@ -196,6 +322,43 @@ class PostsApiTests(APITestCase):
         first_zero_index = sort_orders.index(0)
         self.assertFalse(any(order != 0 for order in sort_orders[first_zero_index:]))
 
+    def test_reference_data_served_from_snapshot_with_etag(self):
+        url = reverse('posts:platform_models_with_default', kwargs={'platform_id': self.platform.id})
+        res = self.client.get(url)
+        self.assertEqual(res.json()['data']['default_model']['name'], 'GPT-4')
+        etag = res['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 0)
+
+        Category.objects.create(name='기타')
+        self.assertNotEqual(self.client.get(url)['ETag'], etag)
+        names = [item['name'] for item in self.client.get(reverse('posts:categories_list')).json()['data']]
+        self.assertIn('기타', names)
+
+    def test_post_detail_and_list_answer_conditional_requests(self):
+        post_id = self._create_post_via_api()
+        self.client.credentials()
+        detail_url = reverse('posts:post_detail', kwargs={'post_id': post_id})
+
+        res = self.client.get(detail_url, HTTP_X_SESSION_KEY='viewer-a')
+        etag = res['ETag']
+        res = self.client.get(detail_url, HTTP_X_SESSION_KEY='viewer-a', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        res = self.client.get(detail_url, HTTP_X_SESSION_KEY='viewer-b', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()['data']['views'], 2)
+
+        list_etag = self.client.get(self.list_url)['ETag']
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag).status_code, 304)
+        self.auth(self.liker_token)
+        res = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('Authorization', res['Vary'])
+
     def test_models_suggest_returns_ranked_and_limited(self):
         AiModel.objects.create(platform=self.platform, name='GPT-4.1-mini', sort_order=1)
         AiModel.objects.create(platform=self.platform, name='GPT-4.1-nano', sort_order=2)
@@ -208,3 +371,284 @@ class PostsApiTests(APITestCase):
 
         top_name = body['suggestions'][0]['name'].lower()
         self.assertTrue(top_name.startswith('gpt'))
+
+    def test_models_suggest_is_served_from_memory_and_tolerates_typos(self):
+        AiModel.objects.create(platform=self.platform, name='Claude Sonnet', sort_order=1)
+        self.client.get(self.models_suggest_url, {'query': 'gpt'})  # warm-up builds the index
+
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(self.models_suggest_url, {'query': 'sonet'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(captured), 0)
+        names = [item['name'] for item in res.json()['data']['suggestions']]
+        self.assertEqual(names[0], 'Claude Sonnet')
+
+        self.platform.is_active = False
+        self.platform.save()
+        res = self.client.get(self.models_suggest_url, {'query': 'gpt'})
+        self.assertEqual(res.json()['data']['suggestions'], [])
+
+    def _walk_cursor_pages(self, params: dict) -> tuple[list[int], dict]:
+        seen_ids = []
+        cursor = ''
+        pagination = {}
+        while cursor is not None:
+            res = self.client.get(self.list_url, {**params, 'cursor': cursor})
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            body = res.json()['data']
+            seen_ids.extend(item['id'] for item in body['results'])
+            pagination = body['pagination']
+            cursor = pagination['next_cursor']
+        return seen_ids, pagination
+
+    def test_posts_list_cursor_mode_matches_offset_order_for_every_sort(self):
+        for idx in range(7):
+            post = self._create_post(str(idx))
+            Post.objects.filter(id=post.id).update(
+                view_count=idx % 3,
+                like_count=idx % 2,
+                satisfaction=None if idx % 3 == 0 else 4.5,
+            )
+
+        for sort_by in ('latest', 'oldest', 'popular', 'satisfaction', 'views'):
+            offset_res = self.client.get(self.list_url, {'sort_by': sort_by, 'page_size': 50})
+            expected_ids = [item['id'] for item in offset_res.json()['data']['results']]
+
+            cursor_ids, last_pagination = self._walk_cursor_pages({'sort_by': sort_by, 'page_size': 3})
+            self.assertEqual(cursor_ids, expected_ids, msg=sort_by)
+            self.assertNotIn('total_count', last_pagination)
+            self.assertFalse(last_pagination['has_next'])
+
+            res = self.client.get(self.list_url, {'sort_by': sort_by, 'page_size': 3, 'cursor': last_pagination['prev_cursor']})
+            previous_ids = [item['id'] for item in res.json()['data']['results']]
+            self.assertEqual(previous_ids, expected_ids[3:6], msg=sort_by)
+
+    def test_popularity_and_hot_scores_follow_interactions_and_decay(self):
+        older = self._create_post('1')
+        newer = self._create_post('2')
+        Post.objects.filter(id=older.id).update(created_at=timezone.now() - timedelta(days=2))
+        older.refresh_from_db()
+
+        InteractionService.toggle_like(self.liker, older)
+        InteractionService.toggle_bookmark(self.liker, older)
+        InteractionService.toggle_like(self.author, newer)
+        older.refresh_from_db()
+        newer.refresh_from_db()
+        self.assertEqual(older.popularity_score, 2)
+        self.assertEqual(newer.popularity_score, 1)
+        self.assertGreater(newer.hot_score, older.hot_score)
+        # hot_score is written by the same statement as the counter, from the row's new popularity.
+        self.assertAlmostEqual(older.hot_score, compute_hot_score(2, older.created_at), places=6)
+
+        popular_ids = [item['id'] for item in self.client.get(self.list_url, {'sort_by': 'popular'}).json()['data']['results']]
+        hot_ids = [item['id'] for item in self.client.get(self.list_url, {'sort_by': 'hot'}).json()['data']['results']]
+        self.assertEqual(popular_ids, [older.id, newer.id])
+        self.assertEqual(hot_ids, [newer.id, older.id])
+
+        Post.objects.filter(id=newer.id).update(created_at=timezone.now() - timedelta(days=7))
+        call_command('refresh_hot_scores', stdout=StringIO())
+        self.assertLess(Post.objects.get(id=newer.id).hot_score, newer.hot_score)
+
+    def test_tag_counts_follow_create_edit_and_delete(self):
+        post_id = self._create_post_via_api()
+        other_post_id = self._create_post_via_api(title='두 번째 게시글')
+
+        res = self.client.get(reverse('posts:tags_list'))
+        self.assertEqual(res.json()['data'], [{'name': 'django', 'count': 2}, {'name': 'python', 'count': 2}])
+
+        update_url = reverse('posts:post_update', kwargs={'post_id': post_id})
+        res = self.client.patch(update_url, {'tags': ['python', 'orm']}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(self.list_url, {'tags': 'orm'})
+        self.assertEqual([item['id'] for item in res.json()['data']['results']], [post_id])
+
+        delete_url = reverse('posts:post_delete', kwargs={'post_id': other_post_id})
+        self.assertEqual(self.client.delete(delete_url).status_code, status.HTTP_200_OK)
+
+        res = self.client.get(reverse('posts:tags_list'))
+        self.assertEqual(res.json()['data'], [{'name': 'orm', 'count': 1}, {'name': 'python', 'count': 1}])
+
+    def test_posts_round_trip_through_jsonl_export_and_import(self):
+        first = self._create_post('1')
+        second = self._create_post('2')
+        Post.objects.filter(pk=second.pk).update(view_count=7, satisfaction=None)
+        fields = ('title', 'author_id', 'platform_id', 'model_id', 'tags', 'satisfaction', 'view_count', 'created_at')
+        originals = list(Post.objects.order_by('id').values(*fields))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'posts.jsonl')
+            call_command('export_posts', '--output', path, '--chunk-size', '1', stdout=StringIO())
+            with open(path, 'a', encoding='utf-8') as output:
+                output.write('{"id": 99, "title": "잘린')
+            call_command('export_posts', '--output', path, '--resume', stdout=StringIO())
+            with open(path, encoding='utf-8') as exported:
+                self.assertEqual(len(exported.readlines()), 2)
+
+            Post.objects.filter(pk__in=[first.pk, second.pk]).delete()
+            out = StringIO()
+            call_command('import_posts', path, '--batch-size', '1', stdout=out, stderr=StringIO())
+            self.assertIn('게시글 2건을 가져왔습니다', out.getvalue())
+            self.assertEqual(list(Post.objects.order_by('id').values(*fields)), originals)
+
+            out = StringIO()
+            call_command('import_posts', path, stdout=out, stderr=StringIO())
+            self.assertIn('중복 2건', out.getvalue())
+            call_command('import_posts', path, '--resume', stdout=out, stderr=StringIO())
+            self.assertEqual(Post.objects.count(), 2)
+
+            # Without created_at a record could never be matched as a duplicate on rerun, so it is rejected.
+            with open(path, encoding='utf-8') as exported:
+                record = json.loads(exported.readline())
+            record.pop('created_at')
+            result = PostImporter().import_lines([json.dumps(record)])
+            self.assertEqual((result.imported, result.error_count), (0, 1))
+            self.assertEqual(Post.objects.count(), 2)
+
+        res = self.client.get(reverse('posts:tags_list'))
+        self.assertEqual(res.json()['data'], [{'name': 'django', 'count': 2}, {'name': 'python', 'count': 2}])
+
+
+@override_settings(POST_LIST_CACHE_SECONDS=0)
+class QueryPlanTests(APITestCase):
+    SORTS = ('latest', 'oldest', 'popular', 'hot', 'satisfaction', 'views')
+
+    def setUp(self):
+        self.users = [User.objects.create_user(email=f'plan{i}@example.com', password='Test1234!') for i in range(4)]
+        self.token, _ = Token.objects.get_or_create(user=self.users[0])
+        platforms = [Platform.objects.create(name=f'플랫폼{i}') for i in range(4)]
+        ai_models = [AiModel.objects.create(platform=platform, name=f'모델{platform.id}') for platform in platforms]
+        categories = [Category.objects.create(name=f'카테고리{i}') for i in range(4)]
+        Post.objects.bulk_create([
+            Post(
+                title=f'실행 계획 게시글 {idx}',
+                author=self.users[idx % 4],
+                platform=platforms[idx % 4],
+                model=ai_models[idx % 4],
+                category=categories[idx % 4],
+                satisfaction=None if idx % 5 == 0 else Decimal('3.5'),
+                prompt='충분히 긴 테스트 프롬프트 내용입니다.',
+                ai_response='충분히 긴 테스트 AI 응답 내용입니다.',
+                view_count=idx,
+                popularity_score=idx % 7,
+                hot_score=idx / 10,
+            )
+            for idx in range(400)
+        ])
+        posts = list(Post.objects.order_by('id')[:100])
+        PostInteraction.objects.bulk_create([
+            PostInteraction(user=user, post=post, is_liked=idx % 2 == 0, is_bookmarked=idx % 3 == 0)
+            for user in self.users
+            for idx, post in enumerate(posts)
+        ])
+        self.platform_id = platforms[0].id
+        self.category_id = categories[0].id
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def _ordered_post_queries(self, url, params):
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [
+            query['sql'] for query in captured.captured_queries
+            if 'ORDER BY' in query['sql'] and 'FROM "posts_post"' in query['sql']
+        ]
+
+    def _plan_problems(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # With scans/sorts priced out, a Seq Scan or Sort left in the plan means no usable index.
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('SET LOCAL enable_sort = off')
+                cursor.execute(f'EXPLAIN {sql}')
+                plan = [row[0] for row in cursor.fetchall()]
+                return [line for line in plan if 'Seq Scan on posts_post' in line or line.strip().startswith('-> Sort')]
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = [row[-1] for row in cursor.fetchall()]
+        return [
+            line for line in plan
+            if (line.startswith('SCAN posts_post') and 'INDEX' not in line) or 'TEMP B-TREE FOR ORDER BY' in line
+        ]
+
+    def _assert_index_backed(self, url, params):
+        queries = self._ordered_post_queries(url, params)
+        self.assertTrue(queries, msg=f'{url} {params}')
+        for sql in queries:
+            self.assertEqual(self._plan_problems(sql), [], msg=f'{url} {params}\n{sql}')
+
+    def test_post_list_sorts_and_filters_use_indexes(self):
+        list_url = reverse('posts:posts_list')
+        for sort_by in self.SORTS:
+            for filters in ({}, {'platforms': self.platform_id}, {'categories': self.category_id}):
+                self._assert_index_backed(list_url, {'sort_by': sort_by, **filters})
+        self._assert_index_backed(list_url, {'author': self.users[1].id})
+        self._assert_index_backed(reverse('core:search_posts'), {'sort': 'popular'})
+
+    def test_user_post_lists_use_indexes(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        for name in ('posts:user_liked_posts', 'posts:user_bookmarked_posts', 'posts:user_my_posts'):
+            self._assert_index_backed(reverse(name), {'sort': 'latest'})
+
+
+class InteractionConcurrencyTests(TransactionTestCase):
+    MAX_LOCK_RETRIES = 500
+    THREAD_TIMEOUT_SECONDS = 60
+
+    def setUp(self):
+        author = User.objects.create_user(email='author@example.com', password='Test1234!')
+        platform = Platform.objects.create(name='OpenAI')
+        self.post = Post.objects.create(
+            title='동시성 테스트',
+            author=author,
+            platform=platform,
+            model=AiModel.objects.create(platform=platform, name='GPT-4'),
+            category=Category.objects.create(name='개발'),
+            satisfaction=4.5,
+            prompt='이것은 충분히 긴 프롬프트 내용입니다.',
+            ai_response='이것은 충분히 긴 AI 응답 내용입니다.',
+        )
+        self.users = [
+            User.objects.create_user(email=f'user{i}@example.com', password='Test1234!')
+            for i in range(8)
+        ]
+
+    def _toggle_repeatedly(self, user, toggles: int, errors: list):
+        try:
+            for index in range(toggles):
+                toggle = InteractionService.toggle_like if index % 2 == 0 else InteractionService.toggle_bookmark
+                for _ in range(self.MAX_LOCK_RETRIES):
+                    try:
+                        toggle(user, self.post)
+                        break
+                    except OperationalError:
+                        # SQLite serializes writers; Postgres never takes this path.
+                        time.sleep(0.01)
+                else:
+                    errors.append(AssertionError(f'toggle for {user.email} still locked after {self.MAX_LOCK_RETRIES} retries'))
+                    return
+        except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+            errors.append(exc)
+        finally:
+            close_old_connections()
+            connection.close()
+
+    def test_concurrent_toggles_keep_counters_in_sync_with_interactions(self):
+        errors = []
+        threads = [
+            threading.Thread(target=self._toggle_repeatedly, args=(user, 5 + i % 2 * 2, errors))
+            for i, user in enumerate(self.users)
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=self.THREAD_TIMEOUT_SECONDS)
+        self.assertFalse([thread for thread in threads if thread.is_alive()])
+
+        self.assertEqual(errors, [])
+        self.post.refresh_from_db()
+        interactions = PostInteraction.objects.filter(post=self.post)
+        self.assertEqual(self.post.like_count, interactions.filter(is_liked=True).count())
+        self.assertEqual(self.post.bookmark_count, interactions.filter(is_bookmarked=True).count())
+        self.assertEqual(interactions.count(), len(self.users))
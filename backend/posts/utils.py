@@ -5,7 +5,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def format_relative_time(date_obj):
+def format_relative_time(date_obj, now=None):
     if not date_obj:
         return "날짜 없음"
 
@@ -13,7 +13,7 @@ def format_relative_time(date_obj):
         return "유효하지 않은 날짜"
 
     try:
-        now = timezone.now()
+        now = now or timezone.now()
         diff_in_seconds = (now - date_obj).total_seconds()
 
         if diff_in_seconds < 60:
@@ -37,3 +37,17 @@ def format_relative_time(date_obj):
     except TypeError as conversion_error:
         logger.warning("Failed to format relative time for %r: %s", date_obj, conversion_error)
         return "날짜 변환 오류"
+
+
+HOT_SCORE_GRAVITY = 1.8
+
+
+def hot_score_decay(created_at, now=None):
+    # hot_score = (popularity_score + 1) * decay, so the database can apply it to a counter it just changed.
+    now = now or timezone.now()
+    age_hours = max((now - created_at).total_seconds() / 3600, 0) if created_at else 0
+    return 1 / (age_hours + 2) ** HOT_SCORE_GRAVITY
+
+
+def compute_hot_score(popularity_score, created_at, now=None):
+    return (popularity_score + 1) * hot_score_decay(created_at, now)
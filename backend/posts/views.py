@@ -1,209 +1,206 @@
-from django.http import JsonResponse
 from django.db import transaction
 from django.db.utils import DatabaseError
-from django.db.models import F, Case, When, Value, IntegerField
-from django.core.exceptions import FieldError
 import logging
-from collections import Counter
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
- 
 
-from .models import Platform, AiModel, Category, Post
+from core.pagination import KeysetPage
+from core.renderers import FastJsonResponse
+from core.utils.conditional import conditional_get, etag_from_parts, evaluate_conditions, set_validators
+from users.authentication import CachedTokenAuthentication
+
+from .models import Post
+from .utils import format_relative_time
 from .serializers import (
-    PlatformSerializer, AiModelSerializer, CategorySerializer,
-    PostCardSerializer, PostDetailSerializer, PostCreateSerializer, PostEditSerializer
+    FastPostCardSerializer, PostDetailSerializer, PostCreateSerializer, PostEditSerializer
 )
 from posts.services.post_service import (
     build_posts_page,
     get_post_and_increment_views,
     build_user_posts_page,
 )
-from posts.services import InteractionService, ModelSuggestService
+from posts.services import (
+    InteractionService,
+    ModelSuggestService,
+    PostListCache,
+    ReferenceData,
+    attach_viewer_interaction_flags,
+    TagService,
+    overlay_viewer_flags,
+    viewer_key_for_request,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _default_model_payload(model):
-    if not model:
-        return None
+def _post_detail_etag(post, user):
+    return etag_from_parts(
+        post.id,
+        post.updated_at.isoformat(),
+        post.view_count,
+        post.like_count,
+        post.bookmark_count,
+        post.author.username,
+        post.author.avatar_color1,
+        post.author.avatar_color2,
+        getattr(post.author, 'profile_image', None) or getattr(post.author, 'avatar', None),
+        format_relative_time(post.created_at),
+        ReferenceData.version(),
+        getattr(user, 'pk', None),
+        post.viewer_is_liked,
+        post.viewer_is_bookmarked,
+    )
+
+
+def _pagination_payload(posts_page, paginator):
+    if isinstance(posts_page, KeysetPage):
+        return {
+            'page_size': posts_page.page_size,
+            'next_cursor': posts_page.next_cursor,
+            'prev_cursor': posts_page.prev_cursor,
+            'has_next': posts_page.has_next(),
+            'has_previous': posts_page.has_previous(),
+        }
     return {
-        'id': model.id,
-        'name': model.name,
-        'platform': model.platform.id,
-        'platform_name': model.platform.name,
+        'current_page': posts_page.number,
+        'total_pages': paginator.num_pages,
+        'total_count': paginator.count,
+        'has_next': posts_page.has_next(),
+        'has_previous': posts_page.has_previous(),
     }
 
 
-def _paginated_posts_response(posts_page, paginator, request):
-    serializer = PostCardSerializer(posts_page, many=True, context={'request': request})
-    return Response({
+def _paginated_posts_payload(posts_page, paginator, serializer_context):
+    return {
         'status': 'success',
         'data': {
-            'results': serializer.data,
-            'pagination': {
-                'current_page': posts_page.number,
-                'total_pages': paginator.num_pages,
-                'total_count': paginator.count,
-                'has_next': posts_page.has_next(),
-                'has_previous': posts_page.has_previous(),
-            },
+            'results': FastPostCardSerializer(serializer_context).serialize(posts_page),
+            'pagination': _pagination_payload(posts_page, paginator),
         },
-    })
+    }
+
+
+def _paginated_posts_response(posts_page, paginator, request):
+    return Response(_paginated_posts_payload(posts_page, paginator, {'request': request}))
+
 
+def _build_anonymous_posts_list_payload(request):
+    posts_page, paginator = build_posts_page(request, with_viewer_flags=False)
+    return _paginated_posts_payload(posts_page, paginator, {'request': request})
 
+
+@conditional_get(etag_func=ReferenceData.etag)
 def platforms_list(request):
-    platforms = Platform.objects.filter(is_active=True).order_by('name')
-    serializer = PlatformSerializer(platforms, many=True)
-    return JsonResponse({
+    return FastJsonResponse({
         'status': 'success',
-        'data': serializer.data
+        'data': ReferenceData.snapshot().platforms
     })
 
 
+@conditional_get(etag_func=ReferenceData.etag)
 def models_list(request):
     platform_id = request.GET.get('platform_id')
     if platform_id:
         try:
             platform_id = int(platform_id)
-            qs = AiModel.objects.filter(
-                platform_id=platform_id,
-                is_active=True,
-                is_deprecated=False,
-                platform__is_active=True,
-            ).select_related('platform')
         except (ValueError, TypeError):
-            return JsonResponse({
+            return FastJsonResponse({
                 'status': 'error',
                 'message': '유효하지 않은 플랫폼 ID입니다.'
             }, status=400)
     else:
-        qs = AiModel.objects.filter(
-            is_active=True,
-            is_deprecated=False,
-            platform__is_active=True,
-        ).select_related('platform')
-
-    models = qs.annotate(
-        sort_key=Case(
-            When(sort_order=0, then=Value(999999)),
-            default=F('sort_order'),
-            output_field=IntegerField(),
-        )
-    ).order_by('sort_key', 'platform__name', 'name')
+        platform_id = None
 
-    serializer = AiModelSerializer(models, many=True)
-    default_model = _default_model_payload(models[0]) if models else None
-    
-    return JsonResponse({
+    snapshot = ReferenceData.snapshot()
+    return FastJsonResponse({
         'status': 'success',
-        'data': serializer.data,
-        'default_model': default_model
+        'data': snapshot.models_for(platform_id),
+        'default_model': snapshot.default_model(platform_id)
     })
 
 
+@conditional_get(etag_func=ReferenceData.etag)
 def platform_models_with_default(request, platform_id):
+    snapshot = ReferenceData.snapshot()
     try:
         platform_id = int(platform_id)
-        platform = Platform.objects.get(id=platform_id, is_active=True)
-    except (ValueError, TypeError, Platform.DoesNotExist):
-        return JsonResponse({
+        platform_name = snapshot.active_platform_names[platform_id]
+    except (ValueError, TypeError, KeyError):
+        return FastJsonResponse({
             'status': 'error',
             'message': '유효하지 않은 플랫폼 ID입니다.'
         }, status=400)
-    
-    try:
-        qs = AiModel.objects.filter(
-            platform_id=platform_id,
-            is_active=True,
-            is_deprecated=False,
-            platform__is_active=True,
-        ).annotate(
-            sort_key=Case(
-                When(sort_order=0, then=Value(999999)),
-                default=F('sort_order'),
-                output_field=IntegerField(),
-            )
-        ).order_by('sort_key', 'name')
-    except FieldError:
-        qs = AiModel.objects.filter(
-            platform_id=platform_id,
-            is_active=True,
-            is_deprecated=False,
-            platform__is_active=True,
-        ).order_by('name')
-    serializer = AiModelSerializer(qs, many=True)
-    default_model = _default_model_payload(qs.first()) if qs.exists() else None
-    
-    return JsonResponse({
+
+    return FastJsonResponse({
         'status': 'success',
         'data': {
             'platform': {
-                'id': platform.id,
-                'name': platform.name
+                'id': platform_id,
+                'name': platform_name
             },
-            'models': serializer.data,
-            'default_model': default_model
+            'models': snapshot.models_for(platform_id),
+            'default_model': snapshot.default_model(platform_id)
         }
     })
 
 
+@conditional_get(etag_func=ReferenceData.etag)
 def categories_list(request):
-    categories = Category.objects.all().order_by('name')
-    serializer = CategorySerializer(categories, many=True)
-    return JsonResponse({
+    return FastJsonResponse({
         'status': 'success',
-        'data': serializer.data
+        'data': ReferenceData.snapshot().categories
     })
 
 
 def tags_list(request):
-    tags_series = Post.objects.exclude(tags='').values_list('tags', flat=True)
-    tag_counter = Counter(
-        tag.strip()
-        for tags_group in tags_series
-        for tag in tags_group.split(',')
-        if tag.strip()
-    )
-    tag_data = [{'name': tag, 'count': count} for tag, count in tag_counter.most_common()]
-    
-    return JsonResponse({
+    return FastJsonResponse({
         'status': 'success',
-        'data': tag_data
+        'data': TagService.popular_tags()
     })
 
 
+@conditional_get(etag_func=lambda request: PostListCache.etag(request, 'posts_list'), vary_on_auth=True)
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([AllowAny])
 def posts_list(request):
-    posts_page, paginator = build_posts_page(request)
-    return _paginated_posts_response(posts_page, paginator, request)
+    # Every viewer shares the anonymous page; only the viewer's own flags are added on top.
+    payload = PostListCache.get_or_build(
+        request, 'posts_list', lambda: _build_anonymous_posts_list_payload(request)
+    )
+    payload['data']['results'] = overlay_viewer_flags(payload['data']['results'], request.user)
+    return Response(payload)
 
 
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([AllowAny])
 def post_detail(request, post_id):
-    post = get_post_and_increment_views(post_id)
+    post = get_post_and_increment_views(post_id, viewer_key_for_request(request))
     if not post:
         return Response({
             'status': 'error',
             'message': '게시글을 찾을 수 없습니다.'
         }, status=404)
     
+    attach_viewer_interaction_flags([post], request.user)
+    # Checked after the view is recorded so repeat visits still count.
+    etag = _post_detail_etag(post, request.user)
+    not_modified = evaluate_conditions(request, etag, vary_on_auth=True)
+    if not_modified is not None:
+        return not_modified
+
     serializer = PostDetailSerializer(post, context={'request': request})
     
-    return Response({
+    return set_validators(Response({
         'status': 'success',
         'data': serializer.data
-    })
+    }), etag, vary_on_auth=True)
 
 
 @api_view(["POST"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def post_create(request):
     data = request.data
@@ -235,7 +232,7 @@ def post_create(request):
 
 
 @api_view(["PUT", "PATCH"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def post_update(request, post_id):
     try:
@@ -258,6 +255,7 @@ def post_update(request, post_id):
     if serializer.is_valid():
         try:
             updated_post = serializer.save()
+            attach_viewer_interaction_flags([updated_post], request.user)
             detail_serializer = PostDetailSerializer(updated_post, context={'request': request})
             return Response({
                 'status': 'success',
@@ -280,7 +278,7 @@ def post_update(request, post_id):
         }, status=400)
 
 @api_view(["POST"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def post_like(request, post_id):
     try:
@@ -310,7 +308,7 @@ def post_like(request, post_id):
 
 
 @api_view(["POST"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def post_bookmark(request, post_id):
     try:
@@ -339,7 +337,7 @@ def post_bookmark(request, post_id):
     })
 
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def user_liked_posts(request):
     base_queryset = Post.objects.select_related('author', 'platform', 'model', 'category').filter(
@@ -357,7 +355,7 @@ def user_liked_posts(request):
 
 
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def user_bookmarked_posts(request):
     base_queryset = Post.objects.select_related('author', 'platform', 'model', 'category').filter(
@@ -375,7 +373,7 @@ def user_bookmarked_posts(request):
 
 
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def user_my_posts(request):
     base_queryset = Post.objects.select_related('author', 'platform', 'model', 'category').filter(
@@ -391,7 +389,7 @@ def user_my_posts(request):
     return _paginated_posts_response(posts_page, paginator, request)
 
 @api_view(["DELETE"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def post_delete(request, post_id):
     try:
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import DashboardStats
+from .models import DashboardStats, UserStats
 
 
 @admin.register(DashboardStats)
@@ -9,10 +9,21 @@ class DashboardStatsAdmin(admin.ModelAdmin):
         'total_likes', 'total_bookmarks', 'updated_at'
     ]
     list_filter = ['updated_at']
-    readonly_fields = ['updated_at']
+    readonly_fields = ['updated_at', 'windows_updated_at']
     
     def has_add_permission(self, request):
         return not DashboardStats.objects.exists()
     
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(UserStats)
+class UserStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        'user', 'posts_count', 'total_views',
+        'total_likes', 'total_bookmarks', 'updated_at'
+    ]
+    search_fields = ['user__username', 'user__email']
+    raw_id_fields = ['user']
+    readonly_fields = ['updated_at']
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class StatsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'stats'
-    verbose_name = "통계"
\ No newline at end of file
+    verbose_name = "통계"
+
+    def ready(self):
+        from . import signals  # noqa: F401
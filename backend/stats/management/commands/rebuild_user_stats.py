@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from stats.services import UserStatsService
+from stats.services.user_stats_service import REBUILD_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "사용자별 통계(UserStats)를 게시글/상호작용 원본 데이터로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help="한 번에 다시 계산할 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = UserStatsService.rebuild_all(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"사용자 {rebuilt}명의 통계를 다시 계산했습니다."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from stats.services import DashboardStatsService
+
+
+class Command(BaseCommand):
+    help = "대시보드 통계(DashboardStats)를 게시글/사용자/태그 원본 데이터로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        stats = DashboardStatsService.reconcile()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"대시보드 통계를 다시 계산했습니다. (게시글 {stats.total_posts}건, 사용자 {stats.total_users}명)"
+            )
+        )
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0018_post_sort_filter_indexes'),
+        ('stats', '0001_initial'),
+        ('users', '0006_seed_dummy_users'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('posts_count', models.IntegerField(default=0, verbose_name='게시글 수')),
+                ('total_views', models.BigIntegerField(default=0, verbose_name='받은 조회수')),
+                ('total_likes', models.BigIntegerField(default=0, verbose_name='받은 좋아요 수')),
+                ('total_bookmarks', models.BigIntegerField(default=0, verbose_name='받은 북마크 수')),
+                ('avg_satisfaction', models.FloatField(default=0, verbose_name='평균 만족도')),
+                ('last_post_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 게시글 작성일시')),
+                ('last_like_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 좋아요 일시')),
+                ('last_bookmark_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 북마크 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='업데이트 일시')),
+                ('most_used_category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='posts.category', verbose_name='가장 많이 사용한 카테고리')),
+                ('most_used_platform', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='posts.platform', verbose_name='가장 많이 사용한 플랫폼')),
+            ],
+            options={
+                'verbose_name': '사용자 통계',
+                'verbose_name_plural': '사용자 통계',
+            },
+        ),
+    ]
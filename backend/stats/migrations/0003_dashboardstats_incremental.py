@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-17 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0002_userstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='active_users',
+            field=models.IntegerField(default=0, verbose_name='최근 30일 활동 사용자 수'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='category_distribution',
+            field=models.JSONField(blank=True, default=dict, verbose_name='카테고리별 게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='platform_distribution',
+            field=models.JSONField(blank=True, default=dict, verbose_name='플랫폼별 게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='popular_tags',
+            field=models.JSONField(blank=True, default=list, verbose_name='인기 태그'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='satisfaction_count',
+            field=models.IntegerField(default=0, verbose_name='만족도 입력 게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='satisfaction_sum',
+            field=models.DecimalField(decimal_places=1, default=0, max_digits=14, verbose_name='만족도 합계'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='weekly_added_posts',
+            field=models.IntegerField(default=0, verbose_name='최근 7일 게시글 수'),
+        ),
+        migrations.AddField(
+            model_name='dashboardstats',
+            name='windows_updated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='기간 통계 갱신일시'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 
 
@@ -7,6 +8,14 @@ class DashboardStats(models.Model):
     total_views = models.BigIntegerField(default=0, verbose_name="총 조회수")
     total_likes = models.BigIntegerField(default=0, verbose_name="총 좋아요 수")
     total_bookmarks = models.BigIntegerField(default=0, verbose_name="총 북마크 수")
+    satisfaction_sum = models.DecimalField(max_digits=14, decimal_places=1, default=0, verbose_name="만족도 합계")
+    satisfaction_count = models.IntegerField(default=0, verbose_name="만족도 입력 게시글 수")
+    platform_distribution = models.JSONField(default=dict, blank=True, verbose_name="플랫폼별 게시글 수")
+    category_distribution = models.JSONField(default=dict, blank=True, verbose_name="카테고리별 게시글 수")
+    popular_tags = models.JSONField(default=list, blank=True, verbose_name="인기 태그")
+    weekly_added_posts = models.IntegerField(default=0, verbose_name="최근 7일 게시글 수")
+    active_users = models.IntegerField(default=0, verbose_name="최근 30일 활동 사용자 수")
+    windows_updated_at = models.DateTimeField(null=True, blank=True, verbose_name="기간 통계 갱신일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="업데이트 일시")
     
     class Meta:
@@ -15,3 +24,45 @@ class DashboardStats(models.Model):
         
     def __str__(self):
         return f"대시보드 통계 ({self.updated_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class UserStats(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+        verbose_name="사용자"
+    )
+    posts_count = models.IntegerField(default=0, verbose_name="게시글 수")
+    total_views = models.BigIntegerField(default=0, verbose_name="받은 조회수")
+    total_likes = models.BigIntegerField(default=0, verbose_name="받은 좋아요 수")
+    total_bookmarks = models.BigIntegerField(default=0, verbose_name="받은 북마크 수")
+    avg_satisfaction = models.FloatField(default=0, verbose_name="평균 만족도")
+    most_used_platform = models.ForeignKey(
+        'posts.Platform',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="가장 많이 사용한 플랫폼"
+    )
+    most_used_category = models.ForeignKey(
+        'posts.Category',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="가장 많이 사용한 카테고리"
+    )
+    last_post_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 게시글 작성일시")
+    last_like_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 좋아요 일시")
+    last_bookmark_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 북마크 일시")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="업데이트 일시")
+
+    class Meta:
+        verbose_name = "사용자 통계"
+        verbose_name_plural = "사용자 통계"
+
+    def __str__(self):
+        return f"{self.user_id} 사용자 통계"
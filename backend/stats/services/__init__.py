@@ -0,0 +1,7 @@
+from .dashboard_stats_service import DashboardStatsService
+from .user_stats_service import UserStatsService
+
+__all__ = [
+    "DashboardStatsService",
+    "UserStatsService",
+]
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from posts.models import Post
+from posts.services.tag_service import TagService
+from stats.models import DashboardStats
+
+User = get_user_model()
+
+DASHBOARD_STATS_ID = 1
+POPULAR_TAG_LIMIT = 10
+WINDOW_REFRESH_LOCK_KEY = 'stats:dashboard:windows:lock'
+WINDOW_REFRESH_LOCK_SECONDS = 60
+
+SNAPSHOT_FIELDS = ['platform_id', 'category_id', 'satisfaction', 'view_count', 'like_count', 'bookmark_count']
+DISTRIBUTION_FIELDS = {
+    'platform_id': 'platform_distribution',
+    'category_id': 'category_distribution',
+}
+TOTAL_FIELDS = {
+    'view_count': 'total_views',
+    'like_count': 'total_likes',
+    'bookmark_count': 'total_bookmarks',
+}
+
+
+def post_snapshot(post: Post) -> dict:
+    return {field: getattr(post, field) for field in SNAPSHOT_FIELDS}
+
+
+def _distribution(field: str) -> dict:
+    rows = Post.objects.values_list(field).annotate(count=Count('id')).order_by()
+    return {str(value_id): count for value_id, count in rows}
+
+
+def _window_counts(now) -> dict:
+    return {
+        'weekly_added_posts': Post.objects.filter(created_at__gte=now - timedelta(days=7)).count(),
+        'active_users': User.objects.filter(posts__created_at__gte=now - timedelta(days=30)).distinct().count(),
+        'windows_updated_at': now,
+    }
+
+
+def _apply_snapshot(stats: DashboardStats, snapshot: dict, sign: int) -> None:
+    for post_field, total_field in TOTAL_FIELDS.items():
+        setattr(stats, total_field, getattr(stats, total_field) + sign * snapshot[post_field])
+
+    if snapshot['satisfaction'] is not None:
+        stats.satisfaction_sum = Decimal(stats.satisfaction_sum) + sign * Decimal(snapshot['satisfaction'])
+        stats.satisfaction_count += sign
+
+    for post_field, distribution_field in DISTRIBUTION_FIELDS.items():
+        distribution = getattr(stats, distribution_field)
+        key = str(snapshot[post_field])
+        count = distribution.get(key, 0) + sign
+        if count > 0:
+            distribution[key] = count
+        else:
+            distribution.pop(key, None)
+
+
+class DashboardStatsService:
+    @staticmethod
+    def reconcile() -> DashboardStats:
+        aggregate = Post.objects.aggregate(
+            total_views=Sum('view_count'),
+            total_likes=Sum('like_count'),
+            total_bookmarks=Sum('bookmark_count'),
+            satisfaction_sum=Sum('satisfaction'),
+            satisfaction_count=Count('satisfaction'),
+        )
+        stats, _ = DashboardStats.objects.update_or_create(
+            pk=DASHBOARD_STATS_ID,
+            defaults={
+                'total_posts': Post.objects.count(),
+                'total_users': User.objects.count(),
+                'total_views': aggregate['total_views'] or 0,
+                'total_likes': aggregate['total_likes'] or 0,
+                'total_bookmarks': aggregate['total_bookmarks'] or 0,
+                'satisfaction_sum': aggregate['satisfaction_sum'] or 0,
+                'satisfaction_count': aggregate['satisfaction_count'],
+                'platform_distribution': _distribution('platform_id'),
+                'category_distribution': _distribution('category_id'),
+                'popular_tags': TagService.popular_tags(limit=POPULAR_TAG_LIMIT),
+                **_window_counts(timezone.now()),
+            },
+        )
+        return stats
+
+    @classmethod
+    def get(cls) -> DashboardStats:
+        return DashboardStats.objects.filter(pk=DASHBOARD_STATS_ID).first() or cls.reconcile()
+
+    @classmethod
+    def get_with_fresh_windows(cls) -> DashboardStats:
+        stats = cls.get()
+        now = timezone.now()
+        interval = getattr(settings, 'DASHBOARD_WINDOW_REFRESH_SECONDS', 300)
+        if stats.windows_updated_at and (now - stats.windows_updated_at).total_seconds() < interval:
+            return stats
+        # One request recounts the windows; concurrent ones keep serving the previous values.
+        if not cache.add(WINDOW_REFRESH_LOCK_KEY, 1, timeout=WINDOW_REFRESH_LOCK_SECONDS):
+            return stats
+
+        try:
+            values = _window_counts(now)
+            cls._update(**values)
+            for field, value in values.items():
+                setattr(stats, field, value)
+        finally:
+            cache.delete(WINDOW_REFRESH_LOCK_KEY)
+        return stats
+
+    @classmethod
+    def _update(cls, **changes) -> None:
+        # A missing row is rebuilt from source tables, which already include this change.
+        if not DashboardStats.objects.filter(pk=DASHBOARD_STATS_ID).update(**changes, updated_at=timezone.now()):
+            cls.reconcile()
+
+    @classmethod
+    def apply_post_change(cls, previous: dict | None, current: dict | None, posts_delta: int) -> None:
+        with transaction.atomic():
+            stats = DashboardStats.objects.select_for_update().filter(pk=DASHBOARD_STATS_ID).first()
+            if stats is None:
+                cls.reconcile()
+                return
+            if previous is not None:
+                _apply_snapshot(stats, previous, -1)
+            if current is not None:
+                _apply_snapshot(stats, current, 1)
+            stats.total_posts += posts_delta
+            stats.save()
+
+    @classmethod
+    def post_deleted(cls, snapshot: dict) -> None:
+        cls.apply_post_change(snapshot, None, -1)
+
+    @classmethod
+    def counter_changed(cls, counter_field: str, delta: int) -> None:
+        total_field = TOTAL_FIELDS[counter_field]
+        cls._update(**{total_field: F(total_field) + delta})
+
+    @classmethod
+    def views_flushed(cls, deltas: dict) -> None:
+        views = sum(deltas.values())
+        if views:
+            cls._update(total_views=F('total_views') + views)
+
+    @classmethod
+    def users_changed(cls, delta: int) -> None:
+        cls._update(total_users=F('total_users') + delta)
+
+    @classmethod
+    def refresh_popular_tags(cls) -> None:
+        cls._update(popular_tags=TagService.popular_tags(limit=POPULAR_TAG_LIMIT))
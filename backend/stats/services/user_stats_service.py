@@ -0,0 +1,198 @@
+from collections import defaultdict
+
+from django.contrib.auth import get_user_model
+from django.db.models import Avg, Case, Count, F, IntegerField, Max, Sum, Value, When
+from django.utils import timezone
+
+from posts.models import Post, PostInteraction
+from stats.models import UserStats
+
+User = get_user_model()
+
+REBUILD_BATCH_SIZE = 500
+
+COUNTER_STAT_FIELDS = {
+    'like_count': ('total_likes', 'last_like_at', 'is_liked'),
+    'bookmark_count': ('total_bookmarks', 'last_bookmark_at', 'is_bookmarked'),
+}
+
+POST_FIELDS = [
+    'posts_count', 'total_views', 'total_likes', 'total_bookmarks',
+    'avg_satisfaction', 'most_used_platform', 'most_used_category', 'last_post_at',
+]
+STAT_FIELDS = [*POST_FIELDS, 'last_like_at', 'last_bookmark_at']
+
+# Post fields behind averages and most-used picks; other snapshot fields are plain totals.
+AUTHOR_AGGREGATE_FIELDS = ('platform_id', 'category_id', 'satisfaction')
+AUTHOR_TOTAL_FIELDS = {
+    'view_count': 'total_views',
+    'like_count': 'total_likes',
+    'bookmark_count': 'total_bookmarks',
+}
+
+
+def _most_used(rows) -> dict:
+    # rows: (author_id, <key>_id, count); ties go to the lowest id.
+    best = {}
+    for author_id, value_id, count in rows:
+        current = best.get(author_id)
+        if current is None or (count, -value_id) > (current[1], -current[0]):
+            best[author_id] = (value_id, count)
+    return {author_id: value_id for author_id, (value_id, _) in best.items()}
+
+
+def _collect_stats(user_ids=None, with_activity: bool = True) -> dict:
+    posts = Post.objects.all()
+    interactions = PostInteraction.objects.all()
+    if user_ids is not None:
+        posts = posts.filter(author_id__in=user_ids)
+        interactions = interactions.filter(user_id__in=user_ids)
+
+    stats = defaultdict(dict)
+    for row in posts.values('author_id').annotate(
+        posts_count=Count('id'),
+        total_views=Sum('view_count'),
+        total_likes=Sum('like_count'),
+        total_bookmarks=Sum('bookmark_count'),
+        avg_satisfaction=Avg('satisfaction'),
+        last_post_at=Max('created_at'),
+    ).order_by():
+        author_id = row.pop('author_id')
+        row['avg_satisfaction'] = round(float(row['avg_satisfaction'] or 0), 1)
+        stats[author_id].update(row)
+
+    for field in ('platform', 'category'):
+        rows = posts.values_list('author_id', f'{field}_id').annotate(count=Count('id')).order_by()
+        for author_id, value_id in _most_used(rows).items():
+            stats[author_id][f'most_used_{field}_id'] = value_id
+
+    if not with_activity:
+        return stats
+
+    for flag_field, stat_field in (('is_liked', 'last_like_at'), ('is_bookmarked', 'last_bookmark_at')):
+        rows = interactions.filter(**{flag_field: True}).values_list('user_id').annotate(last=Max('updated_at')).order_by()
+        for user_id, last in rows:
+            stats[user_id][stat_field] = last
+
+    return stats
+
+
+def _build_row(user_id: int, values: dict) -> UserStats:
+    return UserStats(
+        user_id=user_id,
+        posts_count=values.get('posts_count', 0),
+        total_views=values.get('total_views') or 0,
+        total_likes=values.get('total_likes') or 0,
+        total_bookmarks=values.get('total_bookmarks') or 0,
+        avg_satisfaction=values.get('avg_satisfaction', 0),
+        most_used_platform_id=values.get('most_used_platform_id'),
+        most_used_category_id=values.get('most_used_category_id'),
+        last_post_at=values.get('last_post_at'),
+        last_like_at=values.get('last_like_at'),
+        last_bookmark_at=values.get('last_bookmark_at'),
+        updated_at=timezone.now(),
+    )
+
+
+class UserStatsService:
+    @staticmethod
+    def _save_rows(rows: list[UserStats]) -> None:
+        UserStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=[*STAT_FIELDS, 'updated_at'],
+        )
+
+    @classmethod
+    def rebuild_user(cls, user_id: int) -> UserStats:
+        values = _collect_stats([user_id]).get(user_id, {})
+        cls._save_rows([_build_row(user_id, values)])
+        return UserStats.objects.select_related('most_used_platform', 'most_used_category').get(user_id=user_id)
+
+    @classmethod
+    def rebuild_all(cls, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+        rebuilt = 0
+        user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start:start + batch_size]
+            stats = _collect_stats(batch)
+            cls._save_rows([_build_row(user_id, stats.get(user_id, {})) for user_id in batch])
+            rebuilt += len(batch)
+        return rebuilt
+
+    @classmethod
+    def get_for_user(cls, user) -> UserStats:
+        # One query: the stats row with its most-used platform/category names, memoized on the user.
+        stats = getattr(user, '_user_stats', None)
+        if stats is None:
+            stats = (
+                UserStats.objects.select_related('most_used_platform', 'most_used_category')
+                .filter(user_id=user.pk)
+                .first()
+            ) or cls.rebuild_user(user.pk)
+            user._user_stats = stats
+        return stats
+
+    @classmethod
+    def _increment(cls, user_id: int, **changes) -> None:
+        # A missing row is rebuilt from source tables, which already include this change.
+        if not UserStats.objects.filter(user_id=user_id).update(**changes):
+            cls.rebuild_user(user_id)
+
+    @classmethod
+    def refresh_author(cls, author_id: int, create: bool = True) -> None:
+        # Post writes are rare next to reads, so the author's post-derived fields are recomputed.
+        row = _build_row(author_id, _collect_stats([author_id], with_activity=False).get(author_id, {}))
+        attnames = [UserStats._meta.get_field(field).attname for field in [*POST_FIELDS, 'updated_at']]
+        updated = UserStats.objects.filter(user_id=author_id).update(
+            **{attname: getattr(row, attname) for attname in attnames}
+        )
+        if not updated and create:
+            cls.rebuild_user(author_id)
+
+    @classmethod
+    def apply_snapshot_change(cls, author_id: int, previous: dict, current: dict) -> None:
+        changes = {
+            total_field: F(total_field) + (current[post_field] - previous[post_field])
+            for post_field, total_field in AUTHOR_TOTAL_FIELDS.items()
+            if current[post_field] != previous[post_field]
+        }
+        if changes:
+            cls._increment(author_id, **changes)
+
+    @classmethod
+    def apply_counter_change(cls, post: Post, counter_field: str, delta: int, user=None) -> None:
+        total_field, activity_field, flag_field = COUNTER_STAT_FIELDS[counter_field]
+        cls._increment(post.author_id, **{total_field: F(total_field) + delta})
+
+        if user is None:
+            return
+        if delta > 0:
+            cls._increment(user.pk, **{activity_field: timezone.now()})
+        else:
+            last = (
+                PostInteraction.objects.filter(user=user, **{flag_field: True})
+                .aggregate(last=Max('updated_at'))['last']
+            )
+            cls._increment(user.pk, **{activity_field: last})
+
+    @classmethod
+    def apply_view_deltas(cls, deltas: dict) -> None:
+        author_views = defaultdict(int)
+        for post_id, author_id in Post.objects.filter(id__in=list(deltas)).values_list('id', 'author_id'):
+            author_views[author_id] += deltas[post_id]
+        if not author_views:
+            return
+
+        existing = set(UserStats.objects.filter(user_id__in=list(author_views)).values_list('user_id', flat=True))
+        if existing:
+            UserStats.objects.filter(user_id__in=existing).update(
+                total_views=F('total_views') + Case(
+                    *[When(user_id=author_id, then=Value(author_views[author_id])) for author_id in existing],
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+        for author_id in author_views.keys() - existing:
+            cls.rebuild_user(author_id)
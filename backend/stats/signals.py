@@ -0,0 +1,90 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from posts.events import post_counter_changed, post_tags_changed, post_views_flushed
+from posts.models import Post
+from stats.services import DashboardStatsService, UserStatsService
+from stats.services.dashboard_stats_service import SNAPSHOT_FIELDS, post_snapshot
+from stats.services.user_stats_service import AUTHOR_AGGREGATE_FIELDS
+
+User = get_user_model()
+
+
+def _previous_snapshot(instance: Post, update_fields) -> dict | None:
+    if update_fields is not None and not {field.removesuffix('_id') for field in SNAPSHOT_FIELDS} & set(update_fields):
+        return None
+    loaded = getattr(instance, '_loaded_values', {})
+    if all(field in loaded for field in SNAPSHOT_FIELDS):
+        return {field: loaded[field] for field in SNAPSHOT_FIELDS}
+    # Instances not loaded from the database (or loaded with deferred fields) fall back to one read.
+    return Post.objects.filter(pk=instance.pk).values(*SNAPSHOT_FIELDS).first()
+
+
+@receiver(pre_save, sender=Post)
+def remember_previous_post_snapshot(sender, instance, update_fields=None, **kwargs):
+    instance._dashboard_previous = None
+    if not instance._state.adding:
+        instance._dashboard_previous = _previous_snapshot(instance, update_fields)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleted_post_snapshot(sender, instance, **kwargs):
+    # Counters on the instance may be behind the row (buffered views, concurrent likes).
+    instance._dashboard_previous = Post.objects.filter(pk=instance.pk).values(*SNAPSHOT_FIELDS).first()
+
+
+# Stats rows are shared by every writer, so they are updated after the caller's transaction commits
+# instead of holding their row locks for the rest of it.
+@receiver(post_save, sender=Post)
+def update_stats_on_post_save(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_dashboard_previous', None)
+    current = post_snapshot(instance)
+    if not created and (previous is None or previous == current):
+        return
+    transaction.on_commit(partial(DashboardStatsService.apply_post_change, previous, current, 1 if created else 0))
+    # Counter-only changes are applied as increments; the author aggregate reruns only when it can change.
+    if created or any(previous[field] != current[field] for field in AUTHOR_AGGREGATE_FIELDS):
+        transaction.on_commit(partial(UserStatsService.refresh_author, instance.author_id))
+    else:
+        transaction.on_commit(partial(UserStatsService.apply_snapshot_change, instance.author_id, previous, current))
+
+
+@receiver(post_delete, sender=Post)
+def update_stats_on_post_delete(sender, instance, **kwargs):
+    snapshot = getattr(instance, '_dashboard_previous', None)
+    if snapshot is not None:
+        transaction.on_commit(partial(DashboardStatsService.post_deleted, snapshot))
+    # The author may be going away in the same cascade; never recreate their row here.
+    transaction.on_commit(partial(UserStatsService.refresh_author, instance.author_id, create=False))
+
+
+@receiver(post_counter_changed)
+def update_stats_on_counter_change(sender, post, counter_field, delta, user=None, **kwargs):
+    transaction.on_commit(partial(DashboardStatsService.counter_changed, counter_field, delta))
+    transaction.on_commit(partial(UserStatsService.apply_counter_change, post, counter_field, delta, user))
+
+
+@receiver(post_views_flushed)
+def update_stats_on_views_flushed(sender, deltas, **kwargs):
+    DashboardStatsService.views_flushed(deltas)
+    UserStatsService.apply_view_deltas(deltas)
+
+
+@receiver(post_tags_changed)
+def update_popular_tags_on_tags_changed(sender, **kwargs):
+    transaction.on_commit(DashboardStatsService.refresh_popular_tags)
+
+
+@receiver(post_save, sender=User)
+def update_stats_on_user_save(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(partial(DashboardStatsService.users_changed, 1))
+
+
+@receiver(post_delete, sender=User)
+def update_stats_on_user_delete(sender, instance, **kwargs):
+    transaction.on_commit(partial(DashboardStatsService.users_changed, -1))
@@ -1,9 +1,19 @@
+import time
+
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from rest_framework.authtoken.models import Token
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from posts.models import Platform, AiModel, Category, Post
+from posts.services import InteractionService
+from posts.services.view_count_service import ViewCountBuffer
+from stats.models import DashboardStats, UserStats
+from stats.services import DashboardStatsService, UserStatsService
+from stats.views import DASHBOARD_CACHE_KEY
 
 
 User = get_user_model()
@@ -16,17 +26,20 @@ class StatsApiTests(APITestCase):
         self.platform = Platform.objects.create(name='OpenAI')
         self.model = AiModel.objects.create(platform=self.platform, name='GPT-4')
         self.category = Category.objects.create(name='개발')
-        Post.objects.create(
-            title='테스트 제목',
-            author=self.user,
-            platform=self.platform,
-            model=self.model,
-            category=self.category,
-            tags='tag1, tag2',
-            satisfaction=4.0,
-            prompt='충분히 긴 테스트 프롬프트입니다.',
-            ai_response='충분히 긴 테스트 응답입니다.'
-        )
+        cache.clear()
+        # Stats are applied after commit; run those callbacks inside the test transaction.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post = Post.objects.create(
+                title='테스트 제목',
+                author=self.user,
+                platform=self.platform,
+                model=self.model,
+                category=self.category,
+                tags='tag1, tag2',
+                satisfaction=4.0,
+                prompt='충분히 긴 테스트 프롬프트입니다.',
+                ai_response='충분히 긴 테스트 응답입니다.'
+            )
 
     def test_dashboard_stats(self):
         url = reverse('stats:dashboard_stats')
@@ -49,3 +62,149 @@ class StatsApiTests(APITestCase):
         data = res.json()
         self.assertEqual(data['status'], 'success')
 
+
+    def test_user_stats_follow_writes_and_match_rebuild(self):
+        reader = User.objects.create_user(email='r@r.com', password='Test1234!')
+        with self.captureOnCommitCallbacks(execute=True):
+            InteractionService.toggle_like(reader, self.post)
+            InteractionService.toggle_bookmark(reader, self.post)
+        ViewCountBuffer.record_view(self.post.id, 'viewer-1')
+        ViewCountBuffer.record_view(self.post.id, 'viewer-2')
+        ViewCountBuffer.flush()
+
+        stats = UserStats.objects.get(user=self.user)
+        self.assertEqual(
+            (stats.posts_count, stats.total_views, stats.total_likes, stats.total_bookmarks),
+            (1, 2, 1, 1),
+        )
+        self.assertEqual(stats.most_used_platform_id, self.platform.id)
+        self.assertIsNotNone(UserStats.objects.get(user=reader).last_like_at)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            InteractionService.toggle_like(reader, self.post)
+        self.assertIsNone(UserStats.objects.get(user=reader).last_like_at)
+
+        incremental = UserStats.objects.values().get(user=self.user)
+        UserStatsService.rebuild_all()
+        rebuilt = UserStats.objects.values().get(user=self.user)
+        incremental.pop('updated_at')
+        rebuilt.pop('updated_at')
+        self.assertEqual(incremental, rebuilt)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.delete()
+        stats.refresh_from_db()
+        self.assertEqual(
+            (stats.posts_count, stats.total_views, stats.total_likes, stats.total_bookmarks),
+            (0, 0, 0, 0),
+        )
+        self.assertIsNone(stats.most_used_platform_id)
+
+    def test_user_stats_reads_one_stats_row(self):
+        url = reverse('stats:user_stats')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        # The first request caches the token lookup; the second reads only the stats row.
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+
+        data = res.json()['data']
+        self.assertEqual(data['posts_count'], 1)
+        self.assertEqual(data['most_used_platform'], 'OpenAI')
+        self.assertEqual(data['most_used_category'], '개발')
+        self.assertEqual(len(queries), 1, [query['sql'] for query in queries.captured_queries])
+        self.assertIn('stats_userstats', queries.captured_queries[0]['sql'])
+
+    def test_dashboard_stats_follow_writes_and_match_reconcile(self):
+        DashboardStatsService.reconcile()
+        with self.captureOnCommitCallbacks(execute=True):
+            other_category = Category.objects.create(name='글쓰기')
+            reader = User.objects.create_user(email='d@d.com', password='Test1234!')
+            post = Post.objects.create(
+                title='두 번째 글',
+                author=reader,
+                platform=self.platform,
+                model=self.model,
+                category=self.category,
+                satisfaction=3.0,
+                prompt='충분히 긴 테스트 프롬프트입니다.',
+                ai_response='충분히 긴 테스트 응답입니다.'
+            )
+            InteractionService.toggle_like(reader, self.post)
+            ViewCountBuffer.record_view(self.post.id, 'viewer-1')
+            ViewCountBuffer.flush()
+            post.category = other_category
+            post.save()
+
+        def snapshot():
+            return DashboardStats.objects.values(
+                'total_posts', 'total_users', 'total_views', 'total_likes', 'total_bookmarks',
+                'satisfaction_sum', 'satisfaction_count', 'platform_distribution', 'category_distribution',
+            ).get()
+
+        incremental = snapshot()
+        self.assertEqual((incremental['total_posts'], incremental['total_users']), (2, User.objects.count()))
+        self.assertEqual((incremental['total_views'], incremental['total_likes']), (1, 1))
+        self.assertEqual(incremental['category_distribution'], {str(self.category.id): 1, str(other_category.id): 1})
+        DashboardStatsService.reconcile()
+        self.assertEqual(incremental, snapshot())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.delete()
+            reader.delete()
+        incremental = snapshot()
+        self.assertEqual((incremental['total_posts'], incremental['total_users']), (1, User.objects.count()))
+        DashboardStatsService.reconcile()
+        self.assertEqual(incremental, snapshot())
+
+    def test_writes_touch_stats_rows_only_after_commit(self):
+        DashboardStatsService.reconcile()
+        reader = User.objects.create_user(email='t@t.com', password='Test1234!')
+        post = Post.objects.get(pk=self.post.pk)
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks() as callbacks:
+                InteractionService.toggle_like(reader, post)
+                post.title = '수정된 테스트 제목'
+                post.save()
+        self.assertFalse([query['sql'] for query in queries.captured_queries if 'stats_' in query['sql']])
+        self.assertFalse([
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "posts_post"' in query['sql']
+        ])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(DashboardStats.objects.get().total_likes, 1)
+        self.assertEqual(UserStats.objects.get(user=self.user).total_likes, 1)
+
+    def test_dashboard_stats_served_without_post_aggregates(self):
+        DashboardStatsService.reconcile()
+        url = reverse('stats:dashboard_stats')
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+
+        data = res.json()['data']
+        self.assertEqual(data['total_posts'], 1)
+        self.assertEqual(data['avg_satisfaction'], 4.0)
+        self.assertEqual(data['platform_distribution'], [{'platform': 'OpenAI', 'count': 1}])
+        self.assertFalse(any(
+            'SUM(' in query['sql'] or 'COUNT(' in query['sql'] for query in queries.captured_queries
+        ))
+
+    def test_dashboard_stats_answers_conditional_requests(self):
+        url = reverse('stats:dashboard_stats')
+        res = self.client.get(url)
+        self.assertTrue(res.has_header('Last-Modified'))
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 0)
+
+        # Once the entry is soft-expired the request must reach the view and refresh it.
+        etag = res['ETag']
+        value, _, built_at = cache.get(DASHBOARD_CACHE_KEY)
+        cache.set(DASHBOARD_CACHE_KEY, (value, time.time() - 1, built_at - 120))
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
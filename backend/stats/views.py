@@ -1,22 +1,20 @@
-from collections import Counter
-from datetime import timedelta
 import logging
 
-from django.contrib.auth import get_user_model
 from django.db import DatabaseError
-from django.db.models import Avg, Count, Sum
-from django.http import JsonResponse
-from django.utils import timezone
 from rest_framework.decorators import api_view, authentication_classes, permission_classes
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 
-from core.utils.cache import cache_value_or_set
-from posts.models import Category, Platform, Post, PostInteraction
+from core.renderers import FastJsonResponse
+from core.utils.cache import get_or_compute
+from core.utils.conditional import cache_entry_etag, cache_entry_last_modified, conditional_get
+from posts.models import Category, Platform, Post
+from stats.services import DashboardStatsService, UserStatsService
+from users.authentication import CachedTokenAuthentication
 
-User = get_user_model()
 logger = logging.getLogger(__name__)
 
+DASHBOARD_CACHE_KEY = "stats:dashboard"
+
 
 def _serialize_recent_posts(limit: int = 5) -> list[dict]:
     recent_posts = (
@@ -38,63 +36,51 @@ def _serialize_recent_posts(limit: int = 5) -> list[dict]:
     ]
 
 
-def _popular_tags(limit: int = 10) -> list[dict]:
-    tags_series = Post.objects.exclude(tags="").values_list("tags", flat=True)
-    tags = [tag.strip() for tag_group in tags_series for tag in tag_group.split(",") if tag.strip()]
-    return [{"name": name, "count": count} for name, count in Counter(tags).most_common(limit)]
-
-
-def _platform_distribution() -> list[dict]:
-    distribution = (
-        Platform.objects.annotate(post_count=Count("posts"))
-        .filter(post_count__gt=0)
-        .order_by("-post_count")
-    )
-    return [{"platform": platform.name, "count": platform.post_count} for platform in distribution]
-
-
-def _category_distribution() -> list[dict]:
-    distribution = (
-        Category.objects.annotate(post_count=Count("posts"))
-        .filter(post_count__gt=0)
-        .order_by("-post_count")
-    )
-    return [{"category": category.name, "count": category.post_count} for category in distribution]
+def _named_distribution(model, distribution: dict, label: str) -> list[dict]:
+    names = dict(model.objects.filter(id__in=[int(key) for key in distribution]).values_list("id", "name"))
+    rows = [
+        {label: names[int(key)], "count": count}
+        for key, count in distribution.items()
+        if count > 0 and int(key) in names
+    ]
+    return sorted(rows, key=lambda row: (-row["count"], row[label]))
 
 
 def _dashboard_payload() -> dict:
-    aggregate = Post.objects.aggregate(
-        total_views=Sum("view_count"),
-        total_likes=Sum("like_count"),
-        total_bookmarks=Sum("bookmark_count"),
-        avg_satisfaction=Avg("satisfaction"),
-    )
-    seven_days_ago = timezone.now() - timedelta(days=7)
-    thirty_days_ago = timezone.now() - timedelta(days=30)
+    stats = DashboardStatsService.get_with_fresh_windows()
+    avg_satisfaction = stats.satisfaction_sum / stats.satisfaction_count if stats.satisfaction_count else 0
 
     return {
-        "total_posts": Post.objects.count(),
-        "total_users": User.objects.count(),
-        "total_views": aggregate["total_views"] or 0,
-        "total_likes": aggregate["total_likes"] or 0,
-        "total_bookmarks": aggregate["total_bookmarks"] or 0,
-        "avg_satisfaction": round(float(aggregate["avg_satisfaction"] or 0), 1),
-        "weekly_added_posts": Post.objects.filter(created_at__gte=seven_days_ago).count(),
-        "active_users": User.objects.filter(posts__created_at__gte=thirty_days_ago).distinct().count(),
+        "total_posts": stats.total_posts,
+        "total_users": stats.total_users,
+        "total_views": stats.total_views,
+        "total_likes": stats.total_likes,
+        "total_bookmarks": stats.total_bookmarks,
+        "avg_satisfaction": round(float(avg_satisfaction), 1),
+        "weekly_added_posts": stats.weekly_added_posts,
+        "active_users": stats.active_users,
         "recent_posts": _serialize_recent_posts(),
-        "popular_tags": _popular_tags(),
-        "platform_distribution": _platform_distribution(),
-        "category_distribution": _category_distribution(),
+        "popular_tags": stats.popular_tags,
+        "platform_distribution": _named_distribution(Platform, stats.platform_distribution, "platform"),
+        "category_distribution": _named_distribution(Category, stats.category_distribution, "category"),
     }
 
 
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+@conditional_get(
+    etag_func=lambda request: cache_entry_etag(DASHBOARD_CACHE_KEY),
+    last_modified_func=lambda request: cache_entry_last_modified(DASHBOARD_CACHE_KEY),
+)
 def dashboard_stats(request):
     try:
-        data = cache_value_or_set("stats:dashboard", 60, _dashboard_payload)
-        return JsonResponse({"status": "success", "data": data})
+        data = get_or_compute(DASHBOARD_CACHE_KEY, _dashboard_payload, soft_timeout=60, hard_timeout=600)
+        return FastJsonResponse({"status": "success", "data": data})
     except DatabaseError:
         logger.exception("Failed to build dashboard stats")
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "status": "error",
                 "message": "통계 조회 중 서버 오류가 발생했습니다.",
@@ -105,77 +91,34 @@ def dashboard_stats(request):
 
 
 @api_view(["GET"])
-@authentication_classes([TokenAuthentication])
+@authentication_classes([CachedTokenAuthentication])
 @permission_classes([IsAuthenticated])
 def user_stats(request):
     try:
-        user_posts = Post.objects.filter(author=request.user)
-        posts_count = user_posts.count()
-        if posts_count == 0:
-            return JsonResponse(
-                {
-                    "status": "success",
-                    "data": {
-                        "posts_count": 0,
-                        "total_views": 0,
-                        "total_likes": 0,
-                        "total_bookmarks": 0,
-                        "avg_satisfaction": 0,
-                        "most_used_platform": None,
-                        "most_used_category": None,
-                        "recent_activity": {
-                            "last_post_date": None,
-                            "last_like_date": None,
-                            "last_bookmark_date": None,
-                        },
-                    },
-                }
-            )
-
-        aggregate = user_posts.aggregate(
-            total_views=Sum("view_count"),
-            total_likes=Sum("like_count"),
-            total_bookmarks=Sum("bookmark_count"),
-            avg_satisfaction=Avg("satisfaction"),
-        )
-        most_used_platform = (
-            user_posts.values("platform__name").annotate(count=Count("platform")).order_by("-count").first()
-        )
-        most_used_category = (
-            user_posts.values("category__name").annotate(count=Count("category")).order_by("-count").first()
-        )
-        last_post = user_posts.order_by("-created_at").first()
-        last_like = (
-            PostInteraction.objects.filter(user=request.user, is_liked=True).order_by("-updated_at").first()
-        )
-        last_bookmark = (
-            PostInteraction.objects.filter(user=request.user, is_bookmarked=True)
-            .order_by("-updated_at")
-            .first()
-        )
+        stats = UserStatsService.get_for_user(request.user)
 
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "status": "success",
                 "data": {
-                    "posts_count": posts_count,
-                    "total_views": aggregate["total_views"] or 0,
-                    "total_likes": aggregate["total_likes"] or 0,
-                    "total_bookmarks": aggregate["total_bookmarks"] or 0,
-                    "avg_satisfaction": round(float(aggregate["avg_satisfaction"] or 0), 1),
-                    "most_used_platform": (most_used_platform or {}).get("platform__name"),
-                    "most_used_category": (most_used_category or {}).get("category__name"),
+                    "posts_count": stats.posts_count,
+                    "total_views": stats.total_views,
+                    "total_likes": stats.total_likes,
+                    "total_bookmarks": stats.total_bookmarks,
+                    "avg_satisfaction": stats.avg_satisfaction if stats.posts_count else 0,
+                    "most_used_platform": stats.most_used_platform.name if stats.most_used_platform else None,
+                    "most_used_category": stats.most_used_category.name if stats.most_used_category else None,
                     "recent_activity": {
-                        "last_post_date": last_post.created_at.isoformat() if last_post else None,
-                        "last_like_date": last_like.updated_at.isoformat() if last_like else None,
-                        "last_bookmark_date": last_bookmark.updated_at.isoformat() if last_bookmark else None,
+                        "last_post_date": _isoformat(stats.last_post_at),
+                        "last_like_date": _isoformat(stats.last_like_at),
+                        "last_bookmark_date": _isoformat(stats.last_bookmark_at),
                     },
                 },
             }
         )
     except DatabaseError:
         logger.exception("Failed to build user stats for user_id=%s", getattr(request.user, "id", None))
-        return JsonResponse(
+        return FastJsonResponse(
             {
                 "status": "error",
                 "message": "사용자 통계 조회 중 서버 오류가 발생했습니다.",
@@ -0,0 +1,57 @@
+import hashlib
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_PREFIX = 'auth:token:'
+
+
+def token_cache_key(key: str) -> str:
+    # Hashed so raw tokens never appear in cache keys.
+    return f'{TOKEN_CACHE_PREFIX}{hashlib.sha256(key.encode()).hexdigest()}'
+
+
+def _delete_after_commit(cache_keys: list[str]) -> None:
+    # Deleting inside the writer's transaction would let a concurrent request re-cache the old row.
+    if cache_keys:
+        transaction.on_commit(partial(cache.delete_many, cache_keys))
+
+
+def invalidate_token(key: str) -> None:
+    _delete_after_commit([token_cache_key(key)])
+
+
+def invalidate_user_tokens(user_id) -> None:
+    # Keys are read now: the tokens may be deleted by the same transaction.
+    keys = Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+    _delete_after_commit([token_cache_key(key) for key in keys])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    # The user (with settings) is cached per token for AUTH_TOKEN_CACHE_SECONDS.
+    def authenticate_credentials(self, key):
+        timeout = getattr(settings, 'AUTH_TOKEN_CACHE_SECONDS', 0)
+        cache_key = token_cache_key(key)
+        if timeout > 0:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user', 'user__settings').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        if timeout > 0:
+            cache.set(cache_key, (token.user, token), timeout)
+        return token.user, token
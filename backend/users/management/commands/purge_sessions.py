@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from users.services import purge_sessions
+from users.services.session_cleanup import PURGE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "종료된 세션과 오래 사용되지 않은 세션, 고아 토큰을 배치 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--revoked-days",
+            type=int,
+            help="종료된 세션을 보관할 일수 (기본: SESSION_REVOKED_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--stale-days",
+            type=int,
+            help="이 일수 동안 활동이 없는 세션을 만료로 간주합니다. (기본: SESSION_STALE_DAYS)",
+        )
+        parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE, help="한 번에 삭제할 행 수")
+        parser.add_argument("--pause", type=float, default=0, help="배치 사이에 쉴 시간(초)")
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 건수만 출력합니다.")
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size 값은 1 이상이어야 합니다.")
+        for option in ("revoked_days", "stale_days"):
+            if options[option] is not None and options[option] < 0:
+                raise CommandError(f"--{option.replace('_', '-')} 값은 0 이상이어야 합니다.")
+
+        result = purge_sessions(
+            revoked_days=options["revoked_days"],
+            stale_days=options["stale_days"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+            pause=options["pause"],
+        )
+        action = "삭제 대상" if options["dry_run"] else "삭제 완료"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action}: 종료된 세션 {result.revoked_sessions}건, 만료된 세션 {result.stale_sessions}건, "
+                f"고아 토큰 {result.orphaned_tokens}건 (배치 {result.batches}회, {result.elapsed_seconds:.2f}초)"
+            )
+        )
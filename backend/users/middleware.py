@@ -0,0 +1,16 @@
+from .services import SessionActivityBuffer
+
+
+class SessionActivityMiddleware:
+    # Records X-Session-Key activity in the cache; last_active is written in batches by SessionActivityBuffer.
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        session_key = request.headers.get('X-Session-Key')
+        # DRF token authentication sets request.user on the underlying request during the view.
+        user = getattr(request, 'user', None)
+        if session_key and response.status_code < 400 and user is not None and user.is_authenticated:
+            SessionActivityBuffer.record(session_key, user.pk)
+        return response
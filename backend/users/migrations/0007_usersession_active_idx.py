@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_seed_dummy_users'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(condition=models.Q(('revoked_at__isnull', True)), fields=['user', '-last_active'], name='users_session_active_idx'),
+        ),
+    ]
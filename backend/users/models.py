@@ -102,6 +102,12 @@ class UserSession(models.Model):
         verbose_name_plural = '사용자 세션들'
         indexes = [
             models.Index(fields=['user', 'created_at']),
+            # Serves the per-user active session list; revoked rows are only read by purge_sessions.
+            models.Index(
+                fields=['user', '-last_active'],
+                condition=models.Q(revoked_at__isnull=True),
+                name='users_session_active_idx',
+            ),
         ]
 
     @property
@@ -2,8 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from .models import CustomUser, UserSettings, UserSession
-from posts.models import PostInteraction
-from django.db import models
+from stats.services import UserStatsService
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -72,24 +71,16 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return value
 
     def get_posts_count(self, obj):
-        return obj.posts.count()
+        return UserStatsService.get_for_user(obj).posts_count
     
     def get_total_likes(self, obj):
-        return PostInteraction.objects.filter(
-            post__author=obj, 
-            is_liked=True
-        ).count()
+        return UserStatsService.get_for_user(obj).total_likes
     
     def get_total_views(self, obj):
-        return obj.posts.aggregate(
-            total_views=models.Sum('view_count')
-        )['total_views'] or 0
+        return UserStatsService.get_for_user(obj).total_views
     
     def get_total_bookmarks(self, obj):
-        return PostInteraction.objects.filter(
-            post__author=obj, 
-            is_bookmarked=True
-        ).count()
+        return UserStatsService.get_for_user(obj).total_bookmarks
 
 
 class PasswordChangeSerializer(serializers.Serializer):
@@ -1,15 +1,24 @@
+from .geolocation import Geolocation
 from .oauth_service import (
+    GoogleKeySet,
     GoogleLoginResult,
     OAuthProviderError,
     OAuthValidationError,
     resolve_or_create_google_user,
     verify_google_id_token,
 )
+from .session_activity import SessionActivityBuffer
+from .session_cleanup import PurgeResult, purge_sessions
 
 __all__ = [
+    "Geolocation",
+    "GoogleKeySet",
     "GoogleLoginResult",
     "OAuthProviderError",
     "OAuthValidationError",
+    "PurgeResult",
+    "purge_sessions",
     "resolve_or_create_google_user",
+    "SessionActivityBuffer",
     "verify_google_id_token",
 ]
@@ -0,0 +1,195 @@
+import ipaddress
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.module_loading import import_string
+from requests import RequestException
+
+from users.authentication import invalidate_user_tokens
+from users.models import CustomUser, UserSession
+
+try:
+    import geoip2.database
+    import geoip2.errors
+except ImportError:
+    geoip2 = None
+
+logger = logging.getLogger(__name__)
+
+LOCAL_DEFAULT_LOCATION = "Seoul, South Korea"
+UNKNOWN_LOCATION = "Unknown"
+GEOLOCATION_CACHE_PREFIX = 'users:geo:'
+NEGATIVE_CACHE_SECONDS = 3600
+LRU_MAX_ENTRIES = 4096
+IPV4_PREFIX = 24
+IPV6_PREFIX = 48
+
+
+def _format_location(city: str | None, country: str | None) -> str | None:
+    city = city if city and city != UNKNOWN_LOCATION else None
+    country = country if country and country != UNKNOWN_LOCATION else None
+    if not city and not country:
+        return None
+    return f"{city or UNKNOWN_LOCATION}, {country or UNKNOWN_LOCATION}"
+
+
+def _network_for(ip_address: str) -> str | None:
+    # Addresses in the same /24 (IPv4) or /48 (IPv6) share a cache entry.
+    try:
+        address = ipaddress.ip_address(ip_address)
+    except ValueError:
+        return None
+    if address.is_private or address.is_loopback:
+        return None
+    prefix = IPV4_PREFIX if address.version == 4 else IPV6_PREFIX
+    return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+
+class GeoIPDatabaseResolver:
+    # Offline lookups against a MaxMind-format city database (GEOLOCATION_DATABASE_PATH).
+    def __init__(self):
+        self.reader = None
+        path = getattr(settings, 'GEOLOCATION_DATABASE_PATH', '')
+        if geoip2 is None or not path or not os.path.exists(path):
+            logger.info("GeoIP database unavailable (%s); locations will use the default", path)
+            return
+        self.reader = geoip2.database.Reader(path)
+
+    def resolve(self, ip_address: str) -> str | None:
+        if self.reader is None:
+            return None
+        try:
+            response = self.reader.city(ip_address)
+        except (geoip2.errors.AddressNotFoundError, ValueError):
+            return None
+        return _format_location(response.city.name, response.country.name)
+
+
+class IpapiResolver:
+    # Optional HTTP provider; raises on transport errors so failures are not cached.
+    def __init__(self):
+        self.session = requests.Session()
+        self.timeout = getattr(settings, 'GEOLOCATION_HTTP_TIMEOUT_SECONDS', 3)
+
+    def resolve(self, ip_address: str) -> str | None:
+        response = self.session.get(f"https://ipapi.co/{ip_address}/json/", timeout=self.timeout)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        return _format_location(data.get("city"), data.get("country_name"))
+
+
+class _LRUCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def set(self, key, value) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+class Geolocation:
+    _resolver = None
+    _resolver_path = None
+    _resolver_lock = threading.Lock()
+    _executor = None
+    local_cache = _LRUCache(LRU_MAX_ENTRIES)
+
+    @classmethod
+    def resolver(cls):
+        path = settings.GEOLOCATION_RESOLVER
+        if cls._resolver_path != path:
+            with cls._resolver_lock:
+                if cls._resolver_path != path:
+                    cls._resolver = import_string(path)()
+                    cls._resolver_path = path
+                    cls.local_cache.clear()
+        return cls._resolver
+
+    @classmethod
+    def resolve(cls, ip_address: str | None) -> str | None:
+        # Order: in-process LRU, shared cache, resolver. Empty string marks a known miss.
+        network = _network_for(ip_address) if ip_address else None
+        if network is None:
+            return None
+        resolver = cls.resolver()
+        key = f"{GEOLOCATION_CACHE_PREFIX}{cls._resolver_path}:{network}"
+
+        location = cls.local_cache.get(key)
+        if location is None:
+            location = cache.get(key)
+        if location is None:
+            try:
+                location = resolver.resolve(ip_address) or ''
+            except (RequestException, ValueError) as geolocation_error:
+                logger.info("Failed to resolve location from IP %s: %s", ip_address, geolocation_error)
+                return None
+            timeout = settings.GEOLOCATION_CACHE_SECONDS if location else NEGATIVE_CACHE_SECONDS
+            cache.set(key, location, timeout)
+        cls.local_cache.set(key, location)
+        return location or None
+
+    @classmethod
+    def fill_locations(cls, ip_address: str, user_id=None, session_id=None) -> None:
+        location = cls.resolve(ip_address)
+        if user_id is not None:
+            # Only fill a location the user has not set themselves in the meantime.
+            updated = CustomUser.objects.filter(
+                Q(location__isnull=True) | Q(location=''),
+                pk=user_id,
+            ).update(location=location or LOCAL_DEFAULT_LOCATION)
+            if updated:
+                invalidate_user_tokens(user_id)
+        if session_id is not None and location:
+            UserSession.objects.filter(pk=session_id, location__isnull=True).update(location=location)
+
+    @classmethod
+    def _run_deferred(cls, ip_address: str, user_id, session_id) -> None:
+        try:
+            cls.fill_locations(ip_address, user_id=user_id, session_id=session_id)
+        except Exception:
+            logger.exception("Deferred geolocation failed for IP %s", ip_address)
+        finally:
+            connection.close()
+
+    @classmethod
+    def _submit(cls, ip_address: str, user_id, session_id) -> None:
+        if not getattr(settings, 'GEOLOCATION_ASYNC', False):
+            cls.fill_locations(ip_address, user_id=user_id, session_id=session_id)
+            return
+        with cls._resolver_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='geolocation')
+        cls._executor.submit(cls._run_deferred, ip_address, user_id, session_id)
+
+    @classmethod
+    def schedule(cls, ip_address: str | None, user_id=None, session_id=None) -> None:
+        # Runs after the surrounding transaction commits, off the request thread when GEOLOCATION_ASYNC is on.
+        if user_id is None and session_id is None:
+            return
+        transaction.on_commit(partial(cls._submit, ip_address, user_id, session_id))
@@ -1,16 +1,35 @@
+import logging
 import os
 import random
+import re
+import threading
+import time
 from dataclasses import dataclass
 
+import jwt
 import requests
+from django.core.cache import cache
 from django.db import DatabaseError
 from requests import RequestException
 
 from users.models import CustomUser, UserSettings
-from users.utils import get_location_from_ip
+from users.services.geolocation import Geolocation
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_OAUTH_LOCATION = "위치 정보를 설정해주세요."
 
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_TOKENINFO_URL = "https://oauth2.googleapis.com/tokeninfo"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+GOOGLE_JWKS_CACHE_KEY = "users:google:jwks"
+DEFAULT_JWKS_MAX_AGE_SECONDS = 3600
+FORCED_REFRESH_INTERVAL_SECONDS = 60
+TOKEN_LEEWAY_SECONDS = 10
+
+# Shared across requests so key refreshes and tokeninfo fallbacks reuse pooled connections.
+_http = requests.Session()
+
 
 class OAuthProviderError(RuntimeError):
     pass
@@ -20,20 +39,110 @@ class OAuthValidationError(ValueError):
     pass
 
 
-@dataclass
-class GoogleLoginResult:
-    user: CustomUser
-    created: bool
-    message: str
+class GoogleKeysUnavailable(RuntimeError):
+    pass
 
 
-def verify_google_id_token(id_token: str) -> dict:
+def expected_google_client_id() -> str | None:
+    return os.environ.get("GOOGLE_CLIENT_ID") or os.environ.get("NEXT_PUBLIC_GOOGLE_CLIENT_ID")
+
+
+def _max_age(cache_control: str | None) -> int:
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else DEFAULT_JWKS_MAX_AGE_SECONDS
+
+
+class GoogleKeySet:
+    # Google's signing keys, cached in-process and in the shared cache until the JWKS max-age expires.
+    _keys = {}
+    _expires_at = 0.0
+    _last_forced_refresh = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._keys = {}
+            cls._expires_at = 0.0
+            cls._last_forced_refresh = 0.0
+
+    @staticmethod
+    def _fetch() -> dict:
+        try:
+            response = _http.get(GOOGLE_CERTS_URL, timeout=5)
+            response.raise_for_status()
+            jwks = response.json()
+        except (RequestException, ValueError) as exc:
+            raise GoogleKeysUnavailable("Google 서명 키를 가져올 수 없습니다.") from exc
+        max_age = _max_age(response.headers.get("Cache-Control"))
+        entry = {"jwks": jwks, "expires_at": time.time() + max_age}
+        cache.set(GOOGLE_JWKS_CACHE_KEY, entry, max_age)
+        return entry
+
+    @classmethod
+    def _load(cls, required_kid: str | None = None) -> None:
+        entry = cache.get(GOOGLE_JWKS_CACHE_KEY)
+        kids = {key.get("kid") for key in entry["jwks"].get("keys", [])} if entry else set()
+        if entry is None or (required_kid and required_kid not in kids):
+            entry = cls._fetch()
+        try:
+            cls._keys = {
+                key["kid"]: jwt.PyJWK(key).key
+                for key in entry["jwks"].get("keys", [])
+                if key.get("kid")
+            }
+        except (jwt.PyJWKError, KeyError, TypeError) as exc:
+            raise GoogleKeysUnavailable("Google 서명 키 형식이 올바르지 않습니다.") from exc
+        cls._expires_at = entry["expires_at"]
+
+    @classmethod
+    def get_key(cls, kid: str | None):
+        with cls._lock:
+            now = time.time()
+            if now >= cls._expires_at:
+                cls._load()
+            # An unknown kid usually means Google rotated keys; refetch, but not more than once a minute.
+            if kid not in cls._keys and now - cls._last_forced_refresh >= FORCED_REFRESH_INTERVAL_SECONDS:
+                cls._last_forced_refresh = now
+                try:
+                    cls._load(required_kid=kid)
+                except GoogleKeysUnavailable:
+                    # With a usable key set the kid is simply unknown; only a missing key set is a fetch failure.
+                    if not cls._keys:
+                        raise
+                    logger.warning("Google JWKS refresh failed; keeping the cached keys", exc_info=True)
+            return cls._keys.get(kid)
+
+
+def _verify_locally(id_token: str) -> dict:
+    try:
+        header = jwt.get_unverified_header(id_token)
+    except jwt.InvalidTokenError as exc:
+        raise OAuthValidationError("유효하지 않은 Google 토큰입니다.") from exc
+
+    # GoogleKeysUnavailable (no key set at all) propagates; an unknown kid against loaded keys is a bad token.
+    key = GoogleKeySet.get_key(header.get("kid"))
+    if key is None:
+        raise OAuthValidationError("유효하지 않은 Google 토큰입니다.")
+
+    client_id = expected_google_client_id()
     try:
-        response = requests.get(
-            "https://oauth2.googleapis.com/tokeninfo",
-            params={"id_token": id_token},
-            timeout=5,
+        return jwt.decode(
+            id_token,
+            key,
+            algorithms=["RS256"],
+            audience=client_id,
+            issuer=GOOGLE_ISSUERS,
+            leeway=TOKEN_LEEWAY_SECONDS,
+            options={"verify_aud": bool(client_id), "require": ["exp", "iat", "iss", "sub"]},
         )
+    except jwt.InvalidTokenError as exc:
+        raise OAuthValidationError("유효하지 않은 Google 토큰입니다.") from exc
+
+
+def _verify_with_tokeninfo(id_token: str) -> dict:
+    try:
+        response = _http.get(GOOGLE_TOKENINFO_URL, params={"id_token": id_token}, timeout=5)
     except RequestException as exc:
         raise OAuthProviderError("Google 인증 서버와 통신할 수 없습니다.") from exc
 
@@ -43,11 +152,27 @@ def verify_google_id_token(id_token: str) -> dict:
     return response.json()
 
 
+@dataclass
+class GoogleLoginResult:
+    user: CustomUser
+    created: bool
+    message: str
+
+
+def verify_google_id_token(id_token: str) -> dict:
+    # Verified locally against Google's JWKS; tokeninfo is only used when the key set cannot be fetched.
+    try:
+        return _verify_locally(id_token)
+    except GoogleKeysUnavailable as exc:
+        logger.info("Falling back to Google tokeninfo: %s", exc)
+    return _verify_with_tokeninfo(id_token)
+
+
 def resolve_or_create_google_user(token_payload: dict, client_ip: str | None) -> GoogleLoginResult:
     email = token_payload.get("email")
     email_verified = token_payload.get("email_verified") in (True, "true", "True", "1", 1)
     audience = token_payload.get("aud")
-    expected_client_id = os.environ.get("GOOGLE_CLIENT_ID") or os.environ.get("NEXT_PUBLIC_GOOGLE_CLIENT_ID")
+    expected_client_id = expected_google_client_id()
 
     if expected_client_id and audience != expected_client_id:
         raise OAuthValidationError("허용되지 않은 클라이언트에서 발급된 토큰입니다.")
@@ -70,8 +195,10 @@ def resolve_or_create_google_user(token_payload: dict, client_ip: str | None) ->
             if not user.github_handle:
                 user.github_handle = ""
 
-            user.location = get_location_from_ip(client_ip) if client_ip else DEFAULT_OAUTH_LOCATION
+            user.location = "" if client_ip else DEFAULT_OAUTH_LOCATION
             user.save()
+            if client_ip:
+                Geolocation.schedule(client_ip, user_id=user.pk)
 
             settings, settings_created = UserSettings.objects.get_or_create(user=user)
             if settings_created:
@@ -0,0 +1,148 @@
+import atexit
+import logging
+import operator
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import reduce
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, DateTimeField, F, Q, Value, When
+from django.db.models.functions import Greatest
+
+from core.utils.cache import DirtyQueue
+from users.models import UserSession
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_KEY_PREFIX = 'users:sessions:active'
+THROTTLE_KEY_PREFIX = 'users:sessions:seen'
+OWNER_KEY_PREFIX = 'users:sessions:owner'
+FLUSH_LOCK_KEY = 'users:sessions:flush_lock'
+
+SESSION_KEY_MAX_LENGTH = 64
+FLUSH_BATCH_SIZE = 500
+FLUSH_LOCK_TIMEOUT_SECONDS = 60
+ACTIVITY_TTL_SECONDS = 24 * 3600
+
+
+def _activity_key(session_key: str) -> str:
+    return f'{ACTIVITY_KEY_PREFIX}:{session_key}'
+
+
+def _session_owner(session_key: str):
+    # A session never changes owner, so positive lookups are cached; unknown keys always hit the table.
+    owner_key = f'{OWNER_KEY_PREFIX}:{session_key}'
+    user_id = cache.get(owner_key)
+    if user_id is None:
+        user_id = UserSession.objects.filter(key=session_key, revoked_at__isnull=True).values_list('user_id', flat=True).first()
+        if user_id is not None:
+            cache.set(owner_key, user_id, timeout=ACTIVITY_TTL_SECONDS)
+    return user_id
+
+
+class SessionActivityBuffer:
+    # last_active is written in batches; a lost timestamp only delays the next update by one resolution window.
+    dirty = DirtyQueue('users:sessions', slot_timeout=ACTIVITY_TTL_SECONDS)
+    _flusher_thread = None
+    _flusher_lock = threading.Lock()
+
+    @classmethod
+    def record(cls, session_key: str | None, user_id) -> bool:
+        if not session_key or len(session_key) > SESSION_KEY_MAX_LENGTH:
+            return False
+        resolution = getattr(settings, 'SESSION_ACTIVITY_RESOLUTION_SECONDS', 0)
+        if resolution > 0 and not cache.add(f'{THROTTLE_KEY_PREFIX}:{session_key}', 1, timeout=resolution):
+            return False
+        if _session_owner(session_key) != user_id:
+            return False
+
+        cache.set(_activity_key(session_key), (time.time(), user_id), timeout=ACTIVITY_TTL_SECONDS)
+        # Marked on every recorded hit (at most once per resolution window); take() drops duplicates.
+        cls.dirty.mark(session_key)
+        cls._ensure_flusher()
+        return True
+
+    @staticmethod
+    def pending_activity(session_keys) -> dict:
+        keys = {_activity_key(session_key): session_key for session_key in session_keys}
+        return {keys[key]: activity for key, activity in cache.get_many(list(keys)).items()}
+
+    @classmethod
+    def overlay(cls, sessions):
+        # Shows buffered activity that has not been flushed to the table yet.
+        pending = cls.pending_activity([session.key for session in sessions])
+        for session in sessions:
+            if session.key not in pending:
+                continue
+            timestamp, user_id = pending[session.key]
+            buffered = datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+            if user_id == session.user_id and (session.last_active is None or buffered > session.last_active):
+                session.last_active = buffered
+        return sorted(sessions, key=lambda session: session.last_active, reverse=True)
+
+    @classmethod
+    def flush(cls) -> int:
+        if not cache.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_LOCK_TIMEOUT_SECONDS):
+            return 0
+
+        try:
+            activity = {}
+            for session_key in cls.dirty.take():
+                key = _activity_key(session_key)
+                pending = cache.get(key)
+                if pending is not None:
+                    cache.delete(key)
+                    timestamp, user_id = pending
+                    activity[session_key] = (datetime.fromtimestamp(timestamp, tz=dt_timezone.utc), user_id)
+
+            updated = 0
+            session_keys = list(activity)
+            for start in range(0, len(session_keys), FLUSH_BATCH_SIZE):
+                batch = session_keys[start:start + FLUSH_BATCH_SIZE]
+                owned = reduce(operator.or_, (Q(key=session_key, user_id=activity[session_key][1]) for session_key in batch))
+                updated += UserSession.objects.filter(owned, revoked_at__isnull=True).update(
+                    last_active=Greatest(
+                        F('last_active'),
+                        Case(
+                            *[When(key=session_key, then=Value(activity[session_key][0])) for session_key in batch],
+                            default=F('last_active'),
+                            output_field=DateTimeField(),
+                        ),
+                    )
+                )
+            return updated
+        finally:
+            cache.delete(FLUSH_LOCK_KEY)
+
+    @classmethod
+    def _ensure_flusher(cls) -> None:
+        interval = getattr(settings, 'SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS', 0)
+        if interval <= 0 or cls._flusher_thread is not None:
+            return
+
+        with cls._flusher_lock:
+            if cls._flusher_thread is not None:
+                return
+            cls._flusher_thread = threading.Thread(
+                target=cls._run_flusher, args=(interval,), name='session-activity-flusher', daemon=True
+            )
+            cls._flusher_thread.start()
+            atexit.register(cls._flush_quietly)
+
+    @classmethod
+    def _run_flusher(cls, interval: int) -> None:
+        while True:
+            time.sleep(interval)
+            cls._flush_quietly()
+
+    @classmethod
+    def _flush_quietly(cls) -> None:
+        try:
+            cls.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered session activity")
+        finally:
+            connection.close()
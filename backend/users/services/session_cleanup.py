@@ -0,0 +1,95 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from users.models import UserSession
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 1000
+
+
+@dataclass
+class PurgeResult:
+    revoked_sessions: int = 0
+    stale_sessions: int = 0
+    orphaned_tokens: int = 0
+    batches: int = 0
+    elapsed_seconds: float = field(default=0.0, repr=False)
+
+    @property
+    def total(self) -> int:
+        return self.revoked_sessions + self.stale_sessions + self.orphaned_tokens
+
+
+def _delete_in_batches(queryset, batch_size: int, dry_run: bool, pause: float) -> tuple[int, int]:
+    # Each DELETE targets at most batch_size primary keys so locks and WAL stay bounded.
+    if dry_run:
+        return queryset.count(), 0
+    deleted = batches = 0
+    while True:
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted, batches
+        deleted += queryset.model.objects.filter(pk__in=ids).delete()[1].get(queryset.model._meta.label, 0)
+        batches += 1
+        if len(ids) < batch_size:
+            return deleted, batches
+        if pause:
+            time.sleep(pause)
+
+
+def purge_sessions(
+    revoked_days: int | None = None,
+    stale_days: int | None = None,
+    batch_size: int = PURGE_BATCH_SIZE,
+    dry_run: bool = False,
+    pause: float = 0,
+) -> PurgeResult:
+    # Revoked sessions are kept for revoked_days; sessions idle for stale_days are treated as expired.
+    # A token is orphaned when its user is inactive, or when the user had sessions and all of them are
+    # revoked or stale. Users without any session (e.g. registration only) keep their token.
+    if revoked_days is None:
+        revoked_days = settings.SESSION_REVOKED_RETENTION_DAYS
+    if stale_days is None:
+        stale_days = settings.SESSION_STALE_DAYS
+    started = time.monotonic()
+    now = timezone.now()
+    revoked_cutoff = now - timedelta(days=revoked_days)
+    stale_cutoff = now - timedelta(days=stale_days)
+    result = PurgeResult()
+
+    # Tokens go first: once the sessions below are deleted, the user no longer looks like they had any.
+    any_sessions = UserSession.objects.filter(user_id=OuterRef('user_id'))
+    live_sessions = any_sessions.filter(revoked_at__isnull=True, last_active__gte=stale_cutoff)
+    orphaned = Token.objects.filter(
+        Q(user__is_active=False) | Q(Exists(any_sessions), ~Exists(live_sessions), created__lt=stale_cutoff)
+    )
+    result.orphaned_tokens, batches = _delete_in_batches(orphaned, batch_size, dry_run, pause)
+    result.batches += batches
+
+    revoked = UserSession.objects.filter(revoked_at__lt=revoked_cutoff)
+    result.revoked_sessions, batches = _delete_in_batches(revoked, batch_size, dry_run, pause)
+    result.batches += batches
+
+    stale = UserSession.objects.filter(revoked_at__isnull=True, last_active__lt=stale_cutoff)
+    result.stale_sessions, batches = _delete_in_batches(stale, batch_size, dry_run, pause)
+    result.batches += batches
+
+    result.elapsed_seconds = time.monotonic() - started
+    logger.info(
+        "Session purge%s: revoked=%s stale=%s tokens=%s batches=%s elapsed=%.2fs",
+        " (dry run)" if dry_run else "",
+        result.revoked_sessions,
+        result.stale_sessions,
+        result.orphaned_tokens,
+        result.batches,
+        result.elapsed_seconds,
+    )
+    return result
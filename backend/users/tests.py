@@ -1,14 +1,47 @@
+import time
+from datetime import timedelta
+from io import StringIO
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from jwt.algorithms import RSAAlgorithm
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from core.utils.cache import incr_counter
 from posts.models import Platform, Category, Post
-from users.models import UserSettings
+from users.models import UserSession, UserSettings
+from users.services import (
+    Geolocation,
+    GoogleKeySet,
+    OAuthValidationError,
+    SessionActivityBuffer,
+    purge_sessions,
+    verify_google_id_token,
+)
+from users.services.oauth_service import GOOGLE_JWKS_CACHE_KEY
 
 
 User = get_user_model()
 
 
+class StubGeoResolver:
+    calls = []
+
+    def resolve(self, ip_address):
+        StubGeoResolver.calls.append(ip_address)
+        return 'Mountain View, United States' if ip_address.startswith('8.8.8.') else None
+
+
 class UserAuthAndProfileTests(APITestCase):
     def setUp(self):
         self.register_url = reverse('users:user_register')
@@ -92,6 +125,226 @@ class UserAuthAndProfileTests(APITestCase):
         }, format='json')
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_token_lookup_is_cached_and_invalidated_on_changes(self):
+        token = self._register(email='cached@example.com')
+        UserSettings.objects.get_or_create(user=User.objects.get(email='cached@example.com'))
+        self._auth_token(token)
+        self.assertEqual(self.client.get(self.profile_url).status_code, status.HTTP_200_OK)
+
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(self.profile_url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse([q['sql'] for q in captured if 'authtoken_token' in q['sql'] or 'users_usersettings' in q['sql']])
+
+        # Cache entries are dropped only once the write commits.
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.patch(self.profile_url, {'bio': 'updated'}, format='json')
+        self.assertNotEqual(self.client.get(self.profile_url).data['user']['bio'], 'updated')
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.client.get(self.profile_url).data['user']['bio'], 'updated')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(self.password_url, {
+                'current_password': 'Str0ng-Passw0rd!',
+                'new_password': 'NewStr0ng-Passw0rd!',
+                'new_password_confirm': 'NewStr0ng-Passw0rd!',
+            }, format='json')
+        self.assertEqual(self.client.get(self.profile_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self._auth_token(res.data['token'])
+        self.assertEqual(self.client.get(self.profile_url).status_code, status.HTTP_200_OK)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post(reverse('users:user_logout')).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.profile_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(GEOLOCATION_RESOLVER='users.tests.StubGeoResolver')
+class GeolocationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        Geolocation.local_cache.clear()
+        StubGeoResolver.calls = []
+
+    def test_locations_are_filled_after_commit_and_cached_per_prefix(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(reverse('users:user_register'), {
+                'email': 'geo@example.com',
+                'password': 'Str0ng-Passw0rd!',
+                'password_confirm': 'Str0ng-Passw0rd!',
+            }, format='json', REMOTE_ADDR='8.8.8.8')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(User.objects.get(email='geo@example.com').location, 'Mountain View, United States')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(reverse('users:user_login'), {
+                'email': 'geo@example.com',
+                'password': 'Str0ng-Passw0rd!',
+            }, format='json', REMOTE_ADDR='8.8.8.9')
+        session = UserSession.objects.get(key=res.data['session']['key'])
+        self.assertEqual(session.location, 'Mountain View, United States')
+        self.assertEqual(StubGeoResolver.calls, ['8.8.8.8'])
+
+        Geolocation.local_cache.clear()
+        self.assertEqual(Geolocation.resolve('8.8.8.200'), 'Mountain View, United States')
+        self.assertIsNone(Geolocation.resolve('1.1.1.1'))
+        self.assertIsNone(Geolocation.resolve('1.1.1.2'))
+        self.assertIsNone(Geolocation.resolve('10.0.0.1'))
+        self.assertEqual(StubGeoResolver.calls, ['8.8.8.8', '1.1.1.1'])
+
+
+class GoogleIdTokenTests(APITestCase):
+    KID = 'test-key'
+
+    def setUp(self):
+        cache.clear()
+        GoogleKeySet.clear()
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True)
+        jwks = {'keys': [{**jwk, 'kid': self.KID, 'alg': 'RS256', 'use': 'sig'}]}
+        cache.set(GOOGLE_JWKS_CACHE_KEY, {'jwks': jwks, 'expires_at': time.time() + 3600}, 3600)
+
+    def _id_token(self, private_key=None, **claims):
+        now = int(time.time())
+        payload = {
+            'iss': 'https://accounts.google.com',
+            'sub': '1234567890',
+            'aud': 'test-client',
+            'email': 'google-user@example.com',
+            'email_verified': True,
+            'name': 'Google User',
+            'iat': now,
+            'exp': now + 300,
+            **claims,
+        }
+        return jwt.encode(payload, private_key or self.private_key, algorithm='RS256', headers={'kid': self.KID})
+
+    def test_id_token_is_verified_locally_against_cached_keys(self):
+        payload = verify_google_id_token(self._id_token())
+        self.assertEqual(payload['email'], 'google-user@example.com')
+
+        with self.assertRaises(OAuthValidationError):
+            verify_google_id_token(self._id_token(exp=int(time.time()) - 60))
+        with self.assertRaises(OAuthValidationError):
+            verify_google_id_token(self._id_token(iss='https://evil.example.com'))
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        with self.assertRaises(OAuthValidationError):
+            verify_google_id_token(self._id_token(private_key=other_key))
+
+        # Unknown kids are rejected locally once the rate-limited refresh has run; no tokeninfo fallback.
+        GoogleKeySet._last_forced_refresh = time.time()
+        forged = jwt.encode({'sub': 'x'}, other_key, algorithm='RS256', headers={'kid': 'unknown-kid'})
+        with self.assertRaises(OAuthValidationError):
+            verify_google_id_token(forged)
+
+        res = self.client.post(reverse('users:user_google_login'), {'id_token': self._id_token()}, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(email='google-user@example.com').exists())
+
+
+class SessionActivityTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='active@example.com', password='Str0ng-Passw0rd!')
+        self.client.force_authenticate(user=self.user)
+        self.session = UserSession.objects.create(user=self.user, key='session-a')
+        self.stale = timezone.now() - timedelta(hours=1)
+        UserSession.objects.filter(pk=self.session.pk).update(last_active=self.stale)
+
+    def test_activity_is_buffered_and_flushed_in_one_update(self):
+        url = reverse('users:user_sessions')
+        res = self.client.get(url, HTTP_X_SESSION_KEY='session-a')
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.client.get(url, HTTP_X_SESSION_KEY='session-a')
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.last_active, self.stale)
+        res = self.client.get(url)
+        self.assertGreater(parse_datetime(res.data[0]['last_active']), self.stale)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(SessionActivityBuffer.flush(), 1)
+        self.assertEqual(len(queries), 1)
+        self.session.refresh_from_db()
+        self.assertGreater(self.session.last_active, self.stale)
+        self.assertEqual(SessionActivityBuffer.flush(), 0)
+
+    def test_foreign_and_unknown_session_keys_are_ignored(self):
+        other = User.objects.create_user(email='other@example.com', password='Str0ng-Passw0rd!')
+        UserSession.objects.create(user=other, key='session-b')
+        url = reverse('users:user_sessions')
+        self.client.get(url, HTTP_X_SESSION_KEY='session-b')
+        self.client.get(url, HTTP_X_SESSION_KEY='made-up-key')
+
+        self.assertEqual(SessionActivityBuffer.pending_activity(['session-b', 'made-up-key']), {})
+        self.assertEqual(SessionActivityBuffer.flush(), 0)
+
+    def test_slot_claimed_during_flush_is_not_skipped(self):
+        dirty = SessionActivityBuffer.dirty
+        # A writer that has claimed a slot number but not written the slot yet.
+        pending_slot = incr_counter(dirty.seq_key)
+        self.assertTrue(SessionActivityBuffer.record('session-a', self.user.pk))
+
+        self.assertEqual(SessionActivityBuffer.flush(), 0)
+        cache.set(f'{dirty.slot_prefix}:{pending_slot}', 'session-a')
+        self.assertEqual(SessionActivityBuffer.flush(), 1)
+        self.session.refresh_from_db()
+        self.assertGreater(self.session.last_active, self.stale)
+
+
+class PurgeSessionsTests(APITestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.active_user = User.objects.create_user(email='keep@example.com', password='Str0ng-Passw0rd!')
+        self.idle_user = User.objects.create_user(email='idle@example.com', password='Str0ng-Passw0rd!')
+        self.keep_token = Token.objects.create(user=self.active_user)
+        self.idle_token = Token.objects.create(user=self.idle_user)
+        Token.objects.filter(pk__in=[self.keep_token.pk, self.idle_token.pk]).update(created=self.now - timedelta(days=200))
+
+        self.live = self._session(self.active_user, 'live', last_active=self.now)
+        self._session(self.active_user, 'recently-revoked', last_active=self.now, revoked_at=self.now - timedelta(days=1))
+        for index in range(3):
+            self._session(self.active_user, f'old-revoked-{index}', last_active=self.now, revoked_at=self.now - timedelta(days=60))
+        self._session(self.idle_user, 'idle', last_active=self.now - timedelta(days=120))
+
+    def _session(self, user, key, last_active, revoked_at=None):
+        session = UserSession.objects.create(user=user, key=key, revoked_at=revoked_at)
+        UserSession.objects.filter(pk=session.pk).update(last_active=last_active)
+        return session
+
+    def test_purge_deletes_in_batches_and_reports_counts(self):
+        out = StringIO()
+        call_command('purge_sessions', '--dry-run', stdout=out)
+        self.assertIn('종료된 세션 3건, 만료된 세션 1건', out.getvalue())
+        self.assertEqual(UserSession.objects.count(), 6)
+
+        result = purge_sessions(revoked_days=30, stale_days=90, batch_size=2)
+        self.assertEqual((result.revoked_sessions, result.stale_sessions, result.orphaned_tokens), (3, 1, 1))
+        self.assertEqual(result.batches, 4)
+        self.assertEqual(
+            set(UserSession.objects.values_list('key', flat=True)),
+            {'live', 'recently-revoked'},
+        )
+        self.assertEqual(list(Token.objects.values_list('user_id', flat=True)), [self.active_user.pk])
+
+    def test_registration_only_user_keeps_token(self):
+        res = self.client.post(reverse('users:user_register'), {
+            'email': 'signup@example.com',
+            'password': 'Str0ng-Passw0rd!',
+            'password_confirm': 'Str0ng-Passw0rd!',
+        }, format='json')
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        token = Token.objects.get(key=res.data['token'])
+        Token.objects.filter(pk=token.pk).update(created=self.now - timedelta(days=200))
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(self.client.get(reverse('users:user_profile')).status_code, status.HTTP_200_OK)
+
+        result = purge_sessions(revoked_days=30, stale_days=90)
+        self.assertEqual(result.orphaned_tokens, 1)
+        self.assertTrue(Token.objects.filter(pk=token.pk).exists())
+        self.assertFalse(Token.objects.filter(pk=self.idle_token.pk).exists())
+
 
 class UserSummaryApiTests(APITestCase):
     def setUp(self):
@@ -1,46 +1,8 @@
 import random
 import string
 from typing import Tuple
-import ipaddress
-import logging
-import requests
-from requests import RequestException
 from .models import CustomUser
 
-logger = logging.getLogger(__name__)
-
-LOCAL_DEFAULT_LOCATION = "Seoul, South Korea"
-UNKNOWN_LOCATION = "Unknown"
-
-
-def _is_private_ip(ip_address: str) -> bool:
-    try:
-        return ipaddress.ip_address(ip_address).is_private
-    except ValueError:
-        return ip_address in {"localhost", "::1"}
-
-
-def get_location_from_ip(ip_address: str) -> str:
-    if not ip_address or _is_private_ip(ip_address):
-        return LOCAL_DEFAULT_LOCATION
-
-    try:
-        response = requests.get(f"https://ipapi.co/{ip_address}/json/", timeout=3)
-        if response.status_code == 200:
-            data = response.json()
-            city = data.get("city")
-            country = data.get("country_name")
-            if city and country and city != UNKNOWN_LOCATION and country != UNKNOWN_LOCATION:
-                return f"{city}, {country}"
-            if city and city != UNKNOWN_LOCATION:
-                return f"{city}, {UNKNOWN_LOCATION}"
-            if country and country != UNKNOWN_LOCATION:
-                return f"{UNKNOWN_LOCATION}, {country}"
-    except (RequestException, ValueError) as geolocation_error:
-        logger.info("Failed to resolve location from IP %s: %s", ip_address, geolocation_error)
-
-    return LOCAL_DEFAULT_LOCATION
-
 
 def should_auto_set_location(user: CustomUser) -> bool:
     return not user.location or not user.location.strip()
@@ -1,4 +1,3 @@
-from django.db.models import Sum
 from django.shortcuts import get_object_or_404
 from django.db import DatabaseError, transaction
 from rest_framework import status, permissions
@@ -7,6 +6,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import APIException
+from .authentication import invalidate_user_tokens
 from .models import CustomUser, UserSettings, UserSession
 from .serializers import (
     UserRegistrationSerializer, 
@@ -17,12 +17,16 @@ from .serializers import (
     UserSessionSerializer,
 )
 from user_agents import parse as parse_ua
-from .utils import get_location_from_ip, generate_random_avatar_colors, generate_random_username
+from .utils import generate_random_avatar_colors, generate_random_username
+from stats.services import UserStatsService
 import logging
+from functools import lru_cache
 from secrets import token_urlsafe
 from .services import (
+    Geolocation,
     OAuthProviderError,
     OAuthValidationError,
+    SessionActivityBuffer,
     resolve_or_create_google_user,
     verify_google_id_token,
 )
@@ -36,11 +40,10 @@ def _extract_client_ip(request):
     return request.META.get("REMOTE_ADDR")
 
 
-def _parse_device_info(request):
-    raw_user_agent = request.META.get("HTTP_USER_AGENT", "")
-    ua = parse_ua(raw_user_agent) if raw_user_agent else None
-    if not ua:
-        return raw_user_agent, None, None, None
+@lru_cache(maxsize=1024)
+def _parse_user_agent(raw_user_agent):
+    # Parsing is regex-heavy and clients reuse a small set of user-agent strings.
+    ua = parse_ua(raw_user_agent)
 
     if ua.is_mobile:
         device = ua.device.brand or ua.device.family or "Mobile"
@@ -55,20 +58,39 @@ def _parse_device_info(request):
 
     browser = f"{ua.browser.family} {ua.browser.version_string}"
     os_name = f"{ua.os.family} {ua.os.version_string}"
-    return raw_user_agent, device, browser, os_name
+    return device, browser, os_name
+
+
+def _parse_device_info(request):
+    raw_user_agent = request.META.get("HTTP_USER_AGENT", "")
+    if not raw_user_agent:
+        return raw_user_agent, None, None, None
+    return (raw_user_agent, *_parse_user_agent(raw_user_agent))
+
+
+def _get_user_settings(user):
+    # CachedTokenAuthentication loads settings with the user; only fall back to the DB when missing.
+    try:
+        return user.settings
+    except UserSettings.DoesNotExist:
+        settings_obj, _ = UserSettings.objects.get_or_create(user=user)
+        return settings_obj
 
 
 def _create_session(request, user):
     raw_user_agent, device, browser, os_name = _parse_device_info(request)
-    return UserSession.objects.create(
+    client_ip = _extract_client_ip(request)
+    session = UserSession.objects.create(
         user=user,
         key=token_urlsafe(32),
         user_agent=raw_user_agent,
-        ip_address=_extract_client_ip(request),
+        ip_address=client_ip,
         device=device,
         browser=browser,
         os=os_name,
     )
+    Geolocation.schedule(client_ip, session_id=session.pk)
+    return session
 
 
 class UserRegistrationView(APIView):
@@ -78,9 +100,7 @@ class UserRegistrationView(APIView):
         serializer = UserRegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-
-            user.location = get_location_from_ip(_extract_client_ip(request))
-            user.save()
+            Geolocation.schedule(_extract_client_ip(request), user_id=user.pk)
 
             token, _ = Token.objects.get_or_create(user=user)
             profile_data = UserProfileSerializer(user).data
@@ -202,7 +222,7 @@ class UserProfileView(APIView):
 
     def get(self, request):
         serializer = UserProfileSerializer(request.user)
-        settings_obj, _ = UserSettings.objects.get_or_create(user=request.user)
+        settings_obj = _get_user_settings(request.user)
         settings_data = UserSettingsSerializer(settings_obj).data
         profile_completeness = self._check_profile_completeness(request.user)
 
@@ -262,11 +282,11 @@ class UserSettingsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        settings_obj, _ = UserSettings.objects.get_or_create(user=request.user)
+        settings_obj = _get_user_settings(request.user)
         return Response(UserSettingsSerializer(settings_obj).data, status=status.HTTP_200_OK)
 
     def patch(self, request):
-        settings_obj, _ = UserSettings.objects.get_or_create(user=request.user)
+        settings_obj = _get_user_settings(request.user)
         serializer = UserSettingsSerializer(settings_obj, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
@@ -317,6 +337,7 @@ class UserSessionsView(APIView):
             user=request.user,
             revoked_at__isnull=True,
         ).order_by('-last_active')
+        sessions = SessionActivityBuffer.overlay(list(sessions))
         return Response(UserSessionSerializer(sessions, many=True).data, status=status.HTTP_200_OK)
 
     def delete(self, request):
@@ -330,6 +351,7 @@ class UserSessionsView(APIView):
             if current_key:
                 qs = qs.exclude(key=current_key)
             updated = qs.update(revoked_at=timezone.now())
+            invalidate_user_tokens(request.user.pk)
             return Response({'message': '다른 모든 세션을 종료했습니다.', 'count': updated}, status=status.HTTP_200_OK)
 
         if not key:
@@ -339,6 +361,7 @@ class UserSessionsView(APIView):
             session = UserSession.objects.get(user=request.user, key=key, revoked_at__isnull=True)
             session.revoked_at = timezone.now()
             session.save()
+            invalidate_user_tokens(request.user.pk)
             return Response({'message': '세션이 종료되었습니다.'}, status=status.HTTP_200_OK)
         except UserSession.DoesNotExist:
             return Response({'message': '해당 세션을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
@@ -411,7 +434,7 @@ def user_info(request):
 @permission_classes([permissions.AllowAny])
 def user_summary(request, username: str):
     user = get_object_or_404(
-        CustomUser.objects.select_related('settings'),
+        CustomUser.objects.select_related('settings', 'stats'),
         username=username,
     )
 
@@ -421,11 +444,7 @@ def user_summary(request, username: str):
     except UserSettings.DoesNotExist:
         is_public_profile = True
 
-    aggregate = user.posts.aggregate(
-        total_views=Sum('view_count'),
-        total_likes_received=Sum('like_count'),
-        total_bookmarks_received=Sum('bookmark_count'),
-    )
+    stats = UserStatsService.get_for_user(user)
 
     avatar_url = user.avatar_url
     if avatar_url and isinstance(avatar_url, str) and avatar_url.startswith('/'):
@@ -439,10 +458,10 @@ def user_summary(request, username: str):
             'avatar_color1': user.avatar_color1,
             'avatar_color2': user.avatar_color2,
             'created_at': user.created_at,
-            'post_count': user.posts.count(),
-            'total_views': aggregate.get('total_views') or 0,
-            'total_likes_received': aggregate.get('total_likes_received') or 0,
-            'total_bookmarks_received': aggregate.get('total_bookmarks_received') or 0,
+            'post_count': stats.posts_count,
+            'total_views': stats.total_views,
+            'total_likes_received': stats.total_likes,
+            'total_bookmarks_received': stats.total_bookmarks,
         },
         status=status.HTTP_200_OK,
     )